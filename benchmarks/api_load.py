@@ -0,0 +1,141 @@
+"""
+Load-test /api/evaluate or /api/search with concurrent requests.
+
+By default the app runs in-process behind httpx's ASGI transport with the
+embedding and Chroma calls replaced by stubs that sleep for a fixed latency, so
+the numbers isolate how well the endpoint overlaps I/O: a handler that blocks the
+event loop serves requests one at a time, a non-blocking one serves them
+concurrently. Pass --url to load-test a running server against real collections.
+
+Usage:
+    poetry run python benchmarks/api_load.py [--requests 50] [--concurrency 10]
+    poetry run python benchmarks/api_load.py --endpoint search --k 10
+    poetry run python benchmarks/api_load.py --url http://localhost:5000 \
+        --collections openai_paragraph_openai openai_fixed_length_openai
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from unittest.mock import patch
+
+import httpx
+
+DEFAULT_COLLECTIONS = [
+    "openai_paragraph_openai",
+    "openai_fixed_length_openai",
+    "marker_paragraph_openai",
+    "marker_fixed_length_bge",
+]
+
+
+async def run_load(client, endpoint, payload, total, concurrency):
+    """Send total requests with at most concurrency in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one_request():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(endpoint, json=payload)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total)))
+    return time.perf_counter() - start, latencies
+
+
+def stubbed_app(latency):
+    """Return the app with embedding and Chroma calls replaced by sleeps."""
+
+    def fake_embed(embedder_type, texts):
+        time.sleep(latency)
+        return [[0.0] for _ in texts]
+
+    def fake_query(collection_name, user_query, db_path=None, query_embedding=None):
+        time.sleep(latency)
+        return json.dumps({"query": user_query, "results": []})
+
+    def fake_search(collection_name, query_embedding, k=4, where=None, db_path=None):
+        time.sleep(latency)
+        return []
+
+    os.environ.setdefault("OPENROUTER_API_KEY", "benchmark")
+    patches = [
+        patch("descidb.query.query_db.embed_batch", fake_embed),
+        patch("descidb.query.evaluation_agent.query_collection", fake_query),
+        patch("descidb.query.query_db.search_collection", fake_search),
+    ]
+    for p in patches:
+        p.start()
+
+    from descidb.server.app import app
+
+    return app
+
+
+async def main_async(args):
+    payload = {
+        "query": "What is a decentralized RAG database?",
+        "collections": args.collections,
+    }
+    if args.endpoint == "search":
+        payload["k"] = args.k
+
+    if args.url:
+        transport = None
+        base_url = args.url
+    else:
+        app = stubbed_app(args.latency)
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://benchmark"
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=None
+    ) as client:
+        rows = []
+        for concurrency in sorted({1, args.concurrency}):
+            elapsed, latencies = await run_load(
+                client, f"/api/{args.endpoint}", payload, args.requests, concurrency
+            )
+            rows.append(
+                (
+                    concurrency,
+                    args.requests / elapsed,
+                    statistics.median(latencies),
+                    statistics.quantiles(latencies, n=100)[98],
+                )
+            )
+
+    print(f"{'concurrency':>11} {'req/s':>8} {'p50 ms':>9} {'p99 ms':>9}")
+    for concurrency, throughput, p50, p99 in rows:
+        print(f"{concurrency:>11} {throughput:>8.2f} {p50:>9.2f} {p99:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--endpoint", choices=["evaluate", "search"], default="evaluate"
+    )
+    parser.add_argument("--k", type=int, default=10, help="Results per search request")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--collections", nargs="+", default=DEFAULT_COLLECTIONS)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="Simulated seconds per embedding or Chroma call (in-process mode)",
+    )
+    parser.add_argument("--url", help="Base URL of a running server to load-test")
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
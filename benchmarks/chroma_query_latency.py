@@ -0,0 +1,86 @@
+"""
+Benchmark ChromaDB query latency with a cold versus a warm collection registry.
+
+Builds a throwaway persistent collection of random vectors, then times lookup
+plus query round trips through query_db.get_collection. Cold queries drop the
+registry (and Chroma's own per-path system cache) before every call, which is
+what each request paid before clients were cached; warm queries reuse the
+cached client and collection. Query embeddings are random, so no embedding API
+is called.
+
+Usage:
+    poetry run python benchmarks/chroma_query_latency.py [--docs 10000] [--dim 1536]
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+import chromadb
+from chromadb.api.client import SharedSystemClient
+
+from descidb.query.query_db import get_collection, invalidate_cache
+
+COLLECTION = "benchmark_paragraph_openai"
+
+
+def populate(db_path, docs, dim):
+    """Fill the benchmark collection with random vectors."""
+    client = chromadb.PersistentClient(path=db_path)
+    collection = client.get_or_create_collection(name=COLLECTION)
+    batch_size = client.get_max_batch_size()
+    for start in range(0, docs, batch_size):
+        count = min(batch_size, docs - start)
+        collection.add(
+            ids=[str(start + i) for i in range(count)],
+            embeddings=[[random.random() for _ in range(dim)] for _ in range(count)],
+            documents=[f"doc {start + i}" for i in range(count)],
+        )
+
+
+def time_queries(db_path, samples, dim, cold):
+    """Return per-query latencies in milliseconds."""
+    latencies = []
+    for _ in range(samples):
+        if cold:
+            invalidate_cache()
+            SharedSystemClient.clear_system_cache()
+        embedding = [random.random() for _ in range(dim)]
+        start = time.perf_counter()
+        collection = get_collection(COLLECTION, db_path)
+        collection.query(
+            query_embeddings=[embedding],
+            n_results=4,
+            include=["metadatas", "documents", "distances"],
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=10000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as db_path:
+        populate(db_path, args.docs, args.dim)
+        results = {
+            "cold": time_queries(db_path, args.samples, args.dim, cold=True),
+            "warm": time_queries(db_path, args.samples, args.dim, cold=False),
+        }
+        invalidate_cache()
+        SharedSystemClient.clear_system_cache()
+
+    print(f"{'mode':<6} {'docs':>8} {'p50 ms':>9} {'p99 ms':>9}")
+    for mode, latencies in results.items():
+        p50 = statistics.median(latencies)
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(f"{mode:<6} {args.docs:>8} {p50:>9.2f} {p99:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark import time of the DeSciDB entry points.
+
+Imports each entry point in a fresh interpreter under `python -X importtime`
+and reports the cumulative import time, the number of modules loaded and the
+slowest top-level packages, so a change that drags a heavy dependency (marker,
+torch, chromadb, web3, ...) into a lightweight entry point shows up here. Each
+entry point is imported --runs times and the fastest run is kept.
+
+Usage:
+    poetry run python benchmarks/import_time.py [--runs 3] [--top 5]
+    poetry run python benchmarks/import_time.py --modules descidb.core.chunker
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+
+ENTRY_POINTS = [
+    "descidb",
+    "descidb.core.chunker",
+    "descidb.core.embedder",
+    "descidb.core.converter",
+    "descidb.core.processor_main",
+    "descidb.db.db_creator_main",
+    "descidb.query.evaluation_main",
+    "descidb.rewards.token_reward_main",
+    "descidb.server.app",
+]
+
+
+def import_profile(module):
+    """Return {imported module: (self us, cumulative us)} for importing module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        # import time:  self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+
+def summarize(module, runs, top):
+    """Return (cumulative ms, module count, slowest packages) for an entry point."""
+    profile = min(
+        (import_profile(module) for _ in range(runs)),
+        key=lambda p: sum(s for s, _ in p.values()),
+    )
+    total_ms = sum(self_us for self_us, _ in profile.values()) / 1000
+
+    # Attribute self time to top-level packages to see what the import drags in
+    packages = defaultdict(int)
+    for name, (self_us, _) in profile.items():
+        packages[name.split(".")[0]] += self_us
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return total_ms, len(profile), slowest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modules", nargs="+", default=ENTRY_POINTS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'entry point':<34} {'ms':>9} {'modules':>8}  slowest packages (ms)")
+    for module in args.modules:
+        try:
+            total_ms, count, slowest = summarize(module, args.runs, args.top)
+        except RuntimeError as e:
+            print(f"{module:<34} failed: {e}")
+            continue
+        packages = ", ".join(f"{name} {us / 1000:.0f}" for name, us in slowest)
+        print(f"{module:<34} {total_ms:>9.1f} {count:>8}  {packages}")
+
+
+if __name__ == "__main__":
+    main()
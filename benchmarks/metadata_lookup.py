@@ -0,0 +1,96 @@
+"""
+Benchmark metadata lookups: linear JSON-lines scan versus MetadataIndex.
+
+Writes a synthetic arXiv-style metadata file, then times looking up random ids
+with the old per-document scan (parse lines until the id matches) and with the
+id -> offset index, reporting the one-time index build separately.
+
+Usage:
+    poetry run python benchmarks/metadata_lookup.py [--records 200000] [--lookups 20]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from descidb.utils.metadata_index import MetadataIndex
+
+
+def write_metadata(path, records):
+    """Write records shaped like the arXiv metadata dump."""
+    with open(path, "w") as file:
+        for i in range(records):
+            record = {
+                "id": f"{2100 + i // 100000}.{i % 100000:05d}",
+                "submitter": "A. Author",
+                "authors": "A. Author, B. Author",
+                "title": f"Paper {i}",
+                "categories": "cs.LG",
+                "doi": None,
+                "abstract": "Lorem ipsum dolor sit amet. " * 30,
+            }
+            file.write(json.dumps(record) + "\n")
+
+
+def linear_scan(path, doc_id):
+    """The lookup Processor.get_metadata_for_doc used to do."""
+    with open(path, "r") as file:
+        for line in file:
+            try:
+                data = json.loads(line)
+                if data.get("id") == doc_id:
+                    return data
+            except json.JSONDecodeError:
+                continue
+    return {}
+
+
+def time_lookups(lookup, ids):
+    """Return per-lookup latencies in milliseconds."""
+    latencies = []
+    for doc_id in ids:
+        start = time.perf_counter()
+        assert lookup(doc_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--lookups", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "metadata.json"
+        write_metadata(path, args.records)
+        ids = [
+            f"{2100 + i // 100000}.{i % 100000:05d}"
+            for i in random.sample(range(args.records), args.lookups)
+        ]
+
+        index = MetadataIndex(path, Path(tmp) / "index.sqlite")
+        start = time.perf_counter()
+        index.get(ids[0])
+        build_s = time.perf_counter() - start
+
+        results = {
+            "scan": time_lookups(lambda doc_id: linear_scan(path, doc_id), ids),
+            "index": time_lookups(index.get, ids),
+        }
+        index.close()
+
+    print(f"index build: {build_s:.2f} s for {args.records} records")
+    print(f"{'mode':<6} {'p50 ms':>10} {'max ms':>10}")
+    for mode, latencies in results.items():
+        print(
+            f"{mode:<6} {statistics.median(latencies):>10.3f} {max(latencies):>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark MERGE latency on IPFS-style nodes with and without a cid constraint.
+
+Grows a throwaway label to increasing node counts and times single-node MERGE
+round trips at each size, first without any index on cid (label scan) and then
+with the uniqueness constraint that IPFSNeo4jGraph.ensure_schema provisions.
+All benchmark nodes use the IPFSBenchmark label and are deleted afterwards.
+
+Usage:
+    poetry run python benchmarks/neo4j_merge_latency.py [--sizes 1000 10000 50000]
+"""
+
+import argparse
+import os
+import statistics
+import time
+import uuid
+
+from dotenv import load_dotenv
+from neo4j import GraphDatabase
+
+LABEL = "IPFSBenchmark"
+CONSTRAINT = "ipfs_benchmark_cid_unique"
+
+
+def grow_to(driver, target):
+    """Create nodes in bulk until the benchmark label holds target nodes."""
+    (record,) = driver.execute_query(f"MATCH (n:{LABEL}) RETURN count(n) AS c").records
+    missing = target - record["c"]
+    while missing > 0:
+        batch = min(missing, 10_000)
+        driver.execute_query(
+            f"UNWIND $cids AS cid CREATE (:{LABEL} {{cid: cid}})",
+            cids=[uuid.uuid4().hex for _ in range(batch)],
+        )
+        missing -= batch
+
+
+def time_merges(driver, samples):
+    """Return per-MERGE latencies in milliseconds for new cids."""
+    latencies = []
+    for _ in range(samples):
+        cid = uuid.uuid4().hex
+        start = time.perf_counter()
+        driver.execute_query(f"MERGE (:{LABEL} {{cid: $cid}})", cid=cid)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def run(driver, sizes, samples, with_constraint):
+    driver.execute_query(f"DROP CONSTRAINT {CONSTRAINT} IF EXISTS")
+    driver.execute_query(f"MATCH (n:{LABEL}) DETACH DELETE n")
+    if with_constraint:
+        driver.execute_query(
+            f"CREATE CONSTRAINT {CONSTRAINT} IF NOT EXISTS "
+            f"FOR (n:{LABEL}) REQUIRE n.cid IS UNIQUE"
+        )
+
+    rows = []
+    for size in sizes:
+        grow_to(driver, size)
+        latencies = time_merges(driver, samples)
+        rows.append(
+            (
+                size,
+                statistics.median(latencies),
+                statistics.quantiles(latencies, n=100)[98],
+            )
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    load_dotenv()
+    driver = GraphDatabase.driver(
+        os.getenv("NEO4J_URI"),
+        auth=(os.getenv("NEO4J_USERNAME"), os.getenv("NEO4J_PASSWORD")),
+        encrypted=False,
+    )
+    try:
+        results = {
+            "no index": run(driver, args.sizes, args.samples, with_constraint=False),
+            "constraint": run(driver, args.sizes, args.samples, with_constraint=True),
+        }
+    finally:
+        driver.execute_query(f"DROP CONSTRAINT {CONSTRAINT} IF EXISTS")
+        driver.execute_query(f"MATCH (n:{LABEL}) DETACH DELETE n")
+        driver.close()
+
+    print(f"{'mode':<12} {'nodes':>8} {'p50 ms':>9} {'p99 ms':>9}")
+    for mode, rows in results.items():
+        for size, p50, p99 in rows:
+            print(f"{mode:<12} {size:>8} {p50:>9.2f} {p99:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
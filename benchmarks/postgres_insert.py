@@ -0,0 +1,106 @@
+"""
+Benchmark loading papers rows: per-row INSERT versus COPY (insert_data).
+
+Creates a scratch database on the server configured by POSTGRES_HOST/PORT/USER/
+PASSWORD, then loads the same synthetic chunks with one INSERT per row (what
+insert_data used to do) and with PostgresDBManager.insert_data, which streams
+batches through COPY ... FROM STDIN. The scratch database is dropped afterwards.
+
+Usage:
+    poetry run python benchmarks/postgres_insert.py [--rows 20000] [--dim 1536]
+"""
+
+import argparse
+import json
+import pickle
+import random
+import time
+
+import numpy as np
+from psycopg2 import sql
+
+from descidb.db.postgres_db import PostgresDBManager
+
+DB_NAME = "descidb_insert_benchmark"
+
+
+def make_rows(rows, dim):
+    """Synthetic (author, paper_name, markdown, embedding, metadata, public_key)."""
+    return [
+        (
+            "0xauthor",
+            f"paper{i // 50}.pdf",
+            "Lorem ipsum dolor sit amet. " * 20,
+            [random.random() for _ in range(dim)],
+            {"title": f"Paper {i // 50}", "chunk": i % 50},
+            "0xpublickey",
+        )
+        for i in range(rows)
+    ]
+
+
+def insert_per_row(manager, data):
+    """One INSERT per record, as insert_data did before COPY."""
+    with manager._connection(DB_NAME) as conn:
+        with conn.cursor() as cursor:
+            for record in data:
+                cursor.execute(
+                    """
+                    INSERT INTO default_schema.papers
+                        (author, paper_name, markdown, embedding, metadata, public_key)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    """,
+                    (
+                        record[0],
+                        record[1],
+                        record[2],
+                        pickle.dumps(np.array(record[3])),
+                        json.dumps(record[4]),
+                        record[5],
+                    ),
+                )
+
+
+def truncate(manager):
+    manager.query(DB_NAME, "TRUNCATE default_schema.papers")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    data = make_rows(args.rows, args.dim)
+    manager = PostgresDBManager()
+    manager.create_databases([DB_NAME])
+    try:
+        truncate(manager)
+        start = time.perf_counter()
+        insert_per_row(manager, data)
+        per_row_s = time.perf_counter() - start
+
+        truncate(manager)
+        start = time.perf_counter()
+        manager.insert_data(DB_NAME, data, batch_size=args.batch_size)
+        copy_s = time.perf_counter() - start
+    finally:
+        manager.close()
+        admin = PostgresDBManager()
+        with admin._connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL("DROP DATABASE IF EXISTS {}").format(
+                        sql.Identifier(DB_NAME)
+                    )
+                )
+        admin.close()
+
+    print(f"{'mode':<8} {'rows':>8} {'seconds':>9} {'rows/s':>10}")
+    for mode, seconds in (("insert", per_row_s), ("copy", copy_s)):
+        print(f"{mode:<8} {args.rows:>8} {seconds:>9.2f} {args.rows / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
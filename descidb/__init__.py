@@ -3,40 +3,62 @@ DeSciDB package for scientific document processing and storage.
 
 This package provides tools for processing, chunking, embedding, and
 storing scientific documents in various database systems.
-"""
-
-# Import submodules to make them available
-import descidb.core
-import descidb.db
-import descidb.query
-import descidb.rewards
-import descidb.utils
-from descidb.core.chunker import chunk, chunk_from_url
-from descidb.core.converter import convert
-from descidb.core.embedder import embed, embed_from_url
 
-# Core functionality
-from descidb.core.processor import Processor
-from descidb.db.chroma_client import VectorDatabaseManager
-from descidb.db.graph_db import IPFSNeo4jGraph
+Subpackages and re-exported names are loaded on first access (PEP 562), so
+importing one module does not import the heavy dependencies of the others.
+"""
 
-# Database connectors
-from descidb.db.postgres_db import PostgresDBManager
-from descidb.query.evaluation_agent import EvaluationAgent
+from typing import TYPE_CHECKING
 
-# Query functionality
-from descidb.query.query_db import query_collection
+from descidb.utils.lazy import attach
 
-# Reward system
-from descidb.rewards.token_rewarder import TokenRewarder
-from descidb.utils.logging_utils import get_logger
+__version__ = "0.1.0"
 
-# Utility functions
-from descidb.utils.utils import (
-    compress,
-    download_from_url,
-    extract,
-    upload_to_lighthouse,
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["core", "db", "query", "rewards", "utils"],
+    attrs={
+        # Core functionality
+        "descidb.core.chunker": ["chunk", "chunk_from_url"],
+        "descidb.core.converter": ["convert"],
+        "descidb.core.embedder": ["embed", "embed_batch", "embed_from_url"],
+        "descidb.core.processor": ["Processor"],
+        # Database connectors
+        "descidb.db.chroma_client": ["VectorDatabaseManager"],
+        "descidb.db.graph_db": ["IPFSNeo4jGraph"],
+        "descidb.db.postgres_db": ["PostgresDBManager"],
+        # Query functionality
+        "descidb.query.evaluation_agent": ["EvaluationAgent"],
+        "descidb.query.query_db": ["query_collection"],
+        # Reward system
+        "descidb.rewards.token_rewarder": ["TokenRewarder"],
+        # Utility functions
+        "descidb.utils.logging_utils": ["get_logger"],
+        "descidb.utils.utils": [
+            "compress",
+            "download_from_url",
+            "extract",
+            "upload_to_lighthouse",
+        ],
+    },
 )
 
-__version__ = "0.1.0"
+if TYPE_CHECKING:
+    from descidb import core, db, query, rewards, utils
+    from descidb.core.chunker import chunk, chunk_from_url
+    from descidb.core.converter import convert
+    from descidb.core.embedder import embed, embed_batch, embed_from_url
+    from descidb.core.processor import Processor
+    from descidb.db.chroma_client import VectorDatabaseManager
+    from descidb.db.graph_db import IPFSNeo4jGraph
+    from descidb.db.postgres_db import PostgresDBManager
+    from descidb.query.evaluation_agent import EvaluationAgent
+    from descidb.query.query_db import query_collection
+    from descidb.rewards.token_rewarder import TokenRewarder
+    from descidb.utils.logging_utils import get_logger
+    from descidb.utils.utils import (
+        compress,
+        download_from_url,
+        extract,
+        upload_to_lighthouse,
+    )
@@ -2,17 +2,61 @@
 Core functionality for document processing.
 
 This module provides classes and functions for converting, chunking, embedding,
-and processing documents.
+and processing documents. Names are imported from their modules on first use.
 """
 
-from descidb.core.chunker import (
-    chunk,
-    chunk_from_url,
-    fixed_length,
-    paragraph,
-    sentence,
-    word,
+from typing import TYPE_CHECKING
+
+from descidb.utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attrs={
+        "descidb.core.chunker": [
+            "chunk",
+            "chunk_from_url",
+            "fixed_length",
+            "paragraph",
+            "sentence",
+            "word",
+        ],
+        "descidb.core.converter": [
+            "convert",
+            "convert_from_url",
+            "release_marker",
+            "warm_up_marker",
+        ],
+        "descidb.core.embedder": [
+            "embed",
+            "embed_batch",
+            "embed_batch_from_url",
+            "embed_from_url",
+            "openai",
+        ],
+        "descidb.core.processor": ["Processor"],
+    },
 )
-from descidb.core.converter import convert, convert_from_url
-from descidb.core.embedder import embed, embed_from_url, openai
-from descidb.core.processor import Processor
+
+if TYPE_CHECKING:
+    from descidb.core.chunker import (
+        chunk,
+        chunk_from_url,
+        fixed_length,
+        paragraph,
+        sentence,
+        word,
+    )
+    from descidb.core.converter import (
+        convert,
+        convert_from_url,
+        release_marker,
+        warm_up_marker,
+    )
+    from descidb.core.embedder import (
+        embed,
+        embed_batch,
+        embed_batch_from_url,
+        embed_from_url,
+        openai,
+    )
+    from descidb.core.processor import Processor
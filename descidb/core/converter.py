@@ -5,28 +5,58 @@ This module provides functions for converting PDF documents to text
 using various methods including OpenAI's API and local tools.
 """
 
+import gc
 import os
+import random
 import textwrap
-from typing import List, Optional, Dict
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
 
 import PyPDF2
 from dotenv import load_dotenv
-from marker.config.parser import ConfigParser  # type: ignore
-from marker.converters.pdf import PdfConverter  # type: ignore
-from marker.models import create_model_dict  # type: ignore
-from markitdown import MarkItDown
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 from descidb.types.converter import ConverterType, ConverterFunc
 from descidb.utils.logging_utils import get_logger
 from descidb.utils.utils import download_from_url, extract
 
+# marker (torch and its models) and markitdown take seconds to import, so they
+# are imported by the converters that use them rather than at module import
+if TYPE_CHECKING:
+    from marker.converters.pdf import PdfConverter  # type: ignore
+
 # Get module logger
 logger = get_logger(__name__)
 
 
 load_dotenv(override=True)
 
+# Concurrent chat completions used by the openai converter
+OPENAI_CONVERT_CONCURRENCY = int(os.getenv("DESCIDB_OPENAI_CONVERT_CONCURRENCY", "4"))
+OPENAI_CONVERT_MAX_RETRIES = 5
+OPENAI_CONVERT_BACKOFF_BASE = 1.0
+OPENAI_CONVERT_BACKOFF_MAX = 60.0
+
+# PDFs with at least this many pages are extracted by a process pool
+PDF_PARALLEL_PAGE_THRESHOLD = 64
+PDF_PAGES_PER_SHARD = 16
+
+_RETRYABLE_OPENAI_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+
 
 def convert_from_url(conversion_type: ConverterType, input_url: str) -> str:
     """Convert based on the specified conversion type."""
@@ -58,6 +88,49 @@ def chunk_text(text: str, chunk_size: int = 4000) -> List[str]:
     )
 
 
+@lru_cache(maxsize=1)
+def _load_marker_converter() -> "PdfConverter":
+    """Build the marker PdfConverter once per process; loading its models is expensive."""
+    from marker.config.parser import ConfigParser  # type: ignore
+    from marker.converters.pdf import PdfConverter  # type: ignore
+    from marker.models import create_model_dict  # type: ignore
+
+    logger.info("Loading marker models")
+    models = create_model_dict()
+    config_parser = ConfigParser(
+        {
+            "languages": "en",
+            "output_format": "markdown",
+        }
+    )
+
+    return PdfConverter(
+        config=config_parser.generate_config_dict(),
+        artifact_dict=models,
+        processor_list=config_parser.get_processors(),
+        renderer=config_parser.get_renderer(),
+    )
+
+
+def warm_up_marker() -> None:
+    """Load the marker models ahead of the first conversion."""
+    _load_marker_converter()
+
+
+def release_marker() -> None:
+    """Drop the cached marker converter so its models can be freed."""
+    _load_marker_converter.cache_clear()
+    gc.collect()
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
+    logger.info("Released marker models")
+
+
 def marker(input_path: str) -> str:
     """Convert text using the marker module, where input_path is either a path to pdf file or a path to a folder containing a set of pdf files."""
     pass
@@ -85,20 +158,7 @@ def marker(input_path: str) -> str:
         else:
             raise ValueError(f"Invalid input path: {input_path}")
 
-        models = create_model_dict()
-        config_parser = ConfigParser(
-            {
-                "languages": "en",
-                "output_format": "markdown",
-            }
-        )
-
-        converter = PdfConverter(
-            config=config_parser.generate_config_dict(),
-            artifact_dict=models,
-            processor_list=config_parser.get_processors(),
-            renderer=config_parser.get_renderer(),
-        )
+        converter = _load_marker_converter()
 
         std_out = ""
         for pdf_path in input_pdf_paths:
@@ -113,45 +173,145 @@ def marker(input_path: str) -> str:
         return ""  # Return empty string in case of error
 
 
-def extract_text_from_pdf(input_path: str) -> str:
-    """Extracts text from a PDF file."""
+def _extract_page_range(input_path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) of a PDF. Runs in a worker process."""
     pdf_reader = PyPDF2.PdfReader(input_path)
-    text_content = ""
+    return [pdf_reader.pages[i].extract_text() for i in range(start, stop)]
 
-    for page_num in range(len(pdf_reader.pages)):
-        page = pdf_reader.pages[page_num]
-        text_content += page.extract_text()
 
-    return text_content
+def iter_pdf_pages(input_path: str, max_workers: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of each PDF page in order.
 
+    Large PDFs are sharded into page ranges extracted by a process pool; pages are
+    yielded as soon as their shard is done, so consumers can start early.
+    max_workers=1 forces serial extraction.
+    """
+    pdf_reader = PyPDF2.PdfReader(input_path)
+    num_pages = len(pdf_reader.pages)
 
-def openai(input_path: str) -> str:
-    """Convert large text to Markdown using OpenAI API with chunking."""
-    try:
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(f"Input file not found: {input_path}")
+    if num_pages < PDF_PARALLEL_PAGE_THRESHOLD or max_workers == 1:
+        for page in pdf_reader.pages:
+            yield page.extract_text()
+        return
 
-        pdf_text = extract_text_from_pdf(input_path)
-        chunks = chunk_text(pdf_text, chunk_size=4000)
+    starts = range(0, num_pages, PDF_PAGES_PER_SHARD)
+    stops = [min(start + PDF_PAGES_PER_SHARD, num_pages) for start in starts]
+    logger.info(
+        f"Extracting {num_pages} pages from {input_path} in {len(stops)} shards"
+    )
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for shard in executor.map(
+            _extract_page_range, repeat(input_path), starts, stops
+        ):
+            yield from shard
+
+
+def iter_text_segments(pages: Iterable[str], chunk_size: int = 4000) -> Iterator[str]:
+    """Yield the chunk_text segments of the concatenated pages as they become final.
+
+    Only the last, possibly incomplete, segment is carried over to the next page,
+    so segments are produced while later pages are still being extracted. The
+    segments match chunk_text on the joined pages except for the width tabs are
+    expanded to.
+    """
+    pending = ""
+    for page in pages:
+        pending += page
+        if len(pending) < 2 * chunk_size:
+            continue
+        *complete, last = chunk_text(pending, chunk_size=chunk_size) or [""]
+        yield from complete
+        # Keep any whitespace the page ended with, it separates words
+        text_end = len(pending.rstrip())
+        pending = last + pending[text_end:]
+    yield from chunk_text(pending, chunk_size=chunk_size)
+
+
+def extract_text_from_pdf(input_path: str, max_workers: Optional[int] = None) -> str:
+    """Extracts text from a PDF file."""
+    return "".join(iter_pdf_pages(input_path, max_workers=max_workers))
 
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        markdown_chunks = []
 
-        for chunk in chunks:
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring a Retry-After header if present."""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        if retry_after is not None:
+            return min(float(retry_after), OPENAI_CONVERT_BACKOFF_MAX)
+    except (TypeError, ValueError):
+        pass
+    delay = OPENAI_CONVERT_BACKOFF_BASE * (2.0**attempt)
+    return min(delay, OPENAI_CONVERT_BACKOFF_MAX) * random.uniform(0.5, 1.0)
+
+
+def _convert_segment(client: OpenAI, segment: str) -> Optional[str]:
+    """Convert one text segment to Markdown, retrying rate-limit and transient errors.
+
+    A segment that still fails, or fails with a non-retryable error, is kept as
+    plain text so the rest of the document is still converted.
+    """
+    for attempt in range(OPENAI_CONVERT_MAX_RETRIES + 1):
+        try:
             response = client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {
                         "role": "user",
-                        "content": f"Convert the following text to Markdown:\n\n{chunk}",
+                        "content": f"Convert the following text to Markdown:\n\n{segment}",
                     },
                 ],
             )
-            if response and response.choices:
-                markdown_chunks.append(response.choices[0].message.content)
-            else:
-                print("Failed to convert a chunk using OpenAI.")
-                markdown_chunks.append(chunk)
+            break
+        except _RETRYABLE_OPENAI_ERRORS as e:
+            if attempt == OPENAI_CONVERT_MAX_RETRIES:
+                logger.error(
+                    f"OpenAI conversion failed after {attempt + 1} attempts "
+                    f"({type(e).__name__}), keeping the segment unconverted"
+                )
+                return segment
+            delay = _retry_delay(e, attempt)
+            logger.warning(
+                f"OpenAI conversion failed ({type(e).__name__}), retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+        except Exception as e:
+            logger.error(
+                f"OpenAI conversion failed: {e}, keeping the segment unconverted"
+            )
+            return segment
+
+    if response and response.choices:
+        return response.choices[0].message.content
+
+    print("Failed to convert a chunk using OpenAI.")
+    return segment
+
+
+def openai(input_path: str, max_concurrency: Optional[int] = None) -> str:
+    """Convert large text to Markdown using OpenAI API with chunking.
+
+    Segments are converted concurrently, up to max_concurrency requests at a time
+    (DESCIDB_OPENAI_CONVERT_CONCURRENCY by default), and reassembled in order.
+    Pages are streamed from iter_pdf_pages, so the first segments are sent while
+    the rest of a large PDF is still being extracted.
+    """
+    try:
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+
+        segments = iter_text_segments(iter_pdf_pages(input_path), chunk_size=4000)
+
+        # Retries are handled per segment by _convert_segment
+        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
+        workers = max(1, max_concurrency or OPENAI_CONVERT_CONCURRENCY)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            markdown_chunks = list(
+                executor.map(
+                    lambda segment: _convert_segment(client, segment), segments
+                )
+            )
 
         filtered_chunks = [chunk for chunk in markdown_chunks if chunk is not None]
         return "\n\n".join(filtered_chunks)
@@ -184,6 +344,8 @@ def markitdown(input_path: str) -> str:
         else:
             raise ValueError(f"Invalid input path: {input_path}")
 
+        from markitdown import MarkItDown
+
         md = MarkItDown(enable_plugins=False)
 
         logger.info(f"Converting {input_pdf_path} using MarkItDown")
@@ -5,23 +5,52 @@ This module provides functions for generating embeddings from text chunks
 using various embedding models including OpenAI's API.
 """
 
+import json
 import os
 from functools import lru_cache
-from typing import List, Dict
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 from dotenv import load_dotenv
 from openai import OpenAI
-from sentence_transformers import SentenceTransformer
 
-from descidb.types.embedder import EmbedderType, Embedding, EmbedderFunc
+from descidb.core.embedding_cache import get_embedding_cache
+from descidb.types.embedder import (
+    EmbedderBatchFunc,
+    EmbedderFunc,
+    EmbedderType,
+    Embedding,
+)
 from descidb.utils.logging_utils import get_logger
 from descidb.utils.utils import download_from_url
 
+# sentence_transformers imports torch, so it is only imported when BGE is used
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 # Get module logger
 logger = get_logger(__name__)
 
 load_dotenv(override=True)
 
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+# The embeddings endpoint accepts at most 2048 inputs and ~300k tokens per request
+OPENAI_MAX_BATCH_SIZE = 2048
+OPENAI_MAX_BATCH_CHARS = 600_000
+BGE_BATCH_SIZE = int(os.getenv("DESCIDB_BGE_BATCH_SIZE", "32"))
+BGE_MODEL_NAME = "BAAI/bge-small-en"
+
+# Models behind each embedder; part of the cache key so a model change misses
+EMBEDDER_MODELS: Dict[str, str] = {
+    "openai": OPENAI_EMBEDDING_MODEL,
+    "bge": BGE_MODEL_NAME,
+}
+
+
+def _cache_name(embedder_type: EmbedderType) -> str:
+    """Return the embedding cache name for an embedder and its model."""
+    model = EMBEDDER_MODELS.get(embedder_type)
+    return f"{embedder_type}/{model}" if model else embedder_type
+
 
 def embed_from_url(embeder_type: EmbedderType, input_url: str) -> Embedding:
     """Embed based on the specified embedding type."""
@@ -33,8 +62,20 @@ def embed_from_url(embeder_type: EmbedderType, input_url: str) -> Embedding:
     return embed(embeder_type=embeder_type, input_text=input_text)
 
 
+def embed_batch_from_url(
+    embedder_type: EmbedderType, input_url: str, batch_size: Optional[int] = None
+) -> List[Embedding]:
+    """Embed a JSON list of chunks downloaded from the given URL."""
+    download_path = download_from_url(url=input_url)
+
+    with open(download_path, "r") as file:
+        texts = json.load(file)
+
+    return embed_batch(embedder_type=embedder_type, texts=texts, batch_size=batch_size)
+
+
 def embed(embeder_type: EmbedderType, input_text: str) -> Embedding:
-    """Embed based on the specified embedding type."""
+    """Embed based on the specified embedding type, consulting the embedding cache."""
 
     embedding_methods: Dict[str, EmbedderFunc] = {
         "openai": openai,
@@ -42,30 +83,141 @@ def embed(embeder_type: EmbedderType, input_text: str) -> Embedding:
         "bge": bge
     }
 
-    return embedding_methods[embeder_type](text=input_text)
+    embed_method = embedding_methods[embeder_type]
+
+    cache = get_embedding_cache()
+    if cache is not None:
+        cached = cache.get(_cache_name(embeder_type), input_text)
+        if cached is not None:
+            return cached
+
+    embedding = embed_method(text=input_text)
+
+    if cache is not None:
+        cache.put(_cache_name(embeder_type), input_text, embedding)
+    return embedding
+
+
+def embed_batch(
+    embedder_type: EmbedderType, texts: List[str], batch_size: Optional[int] = None
+) -> List[Embedding]:
+    """Embed a list of texts, returning one embedding per text in input order.
+
+    batch_size overrides the embedder's default number of texts per request.
+    Texts found in the embedding cache are not sent to the embedder, and each
+    distinct remaining text is sent once. Raises ValueError if the embedder
+    returns a different number of embeddings than it was given texts.
+    """
+    batch_embedding_methods: Dict[str, EmbedderBatchFunc] = {
+        "openai": openai_batch,
+        "nvidia": nvidia_batch,
+        "bge": bge_batch,
+    }
+
+    embed_method = batch_embedding_methods[embedder_type]
+    if not texts:
+        return []
+
+    cache = get_embedding_cache()
+    if cache is not None:
+        embeddings = cache.get_many(_cache_name(embedder_type), texts)
+    else:
+        embeddings = [None] * len(texts)
+
+    missing = list(
+        dict.fromkeys(text for text, found in zip(texts, embeddings) if found is None)
+    )
+    computed: Dict[str, Embedding] = {}
+    if missing:
+        vectors = embed_method(texts=missing, batch_size=batch_size)
+        if len(vectors) != len(missing):
+            raise ValueError(
+                f"{embedder_type} returned {len(vectors)} embeddings for {len(missing)} texts"
+            )
+        if cache is not None:
+            cache.put_many(_cache_name(embedder_type), missing, vectors)
+        computed = dict(zip(missing, vectors))
+
+    logger.debug(
+        f"Embedded {len(texts)} texts with {embedder_type} ({len(missing)} cache misses)"
+    )
+    return [
+        found if found is not None else computed[text]
+        for text, found in zip(texts, embeddings)
+    ]
 
 
 def openai(text: str) -> Embedding:
     """Embed text using the OpenAI embedding API. Returns a list."""
     client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-    response = client.embeddings.create(model="text-embedding-3-small", input=[text])
+    response = client.embeddings.create(model=OPENAI_EMBEDDING_MODEL, input=[text])
     embedding = response.data[0].embedding
     return embedding
 
 
+def _openai_batches(texts: List[str], batch_size: int) -> Iterator[List[str]]:
+    """Split texts into request-sized batches by item count and total characters."""
+    batch: List[str] = []
+    batch_chars = 0
+    for text in texts:
+        if batch and (
+            len(batch) >= batch_size or batch_chars + len(text) > OPENAI_MAX_BATCH_CHARS
+        ):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(text)
+        batch_chars += len(text)
+    if batch:
+        yield batch
+
+
+def openai_batch(texts: List[str], batch_size: Optional[int] = None) -> List[Embedding]:
+    """Embed texts using the OpenAI embedding API, one request per batch."""
+    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    batch_size = min(batch_size or OPENAI_MAX_BATCH_SIZE, OPENAI_MAX_BATCH_SIZE)
+
+    embeddings: List[Embedding] = []
+    for batch in _openai_batches(texts, batch_size):
+        response = client.embeddings.create(model=OPENAI_EMBEDDING_MODEL, input=batch)
+        # The API tags each result with the index of its input
+        data = sorted(response.data, key=lambda item: item.index)
+        embeddings.extend(item.embedding for item in data)
+        logger.debug(f"Embedded batch of {len(batch)} texts with OpenAI")
+
+    return embeddings
+
+
 def nvidia(text: str) -> Embedding:
     """Embed text using NVIDIA embeddings. Returns a list."""
     # Implementation not available yet
     return []  # Return empty list for now
 
 
+def nvidia_batch(texts: List[str], batch_size: Optional[int] = None) -> List[Embedding]:
+    """Embed texts using NVIDIA embeddings. Returns a list per text."""
+    return [nvidia(text=text) for text in texts]
+
+
 @lru_cache(maxsize=1)
-def _load_bge() -> SentenceTransformer:
-    model_name = "BAAI/bge-small-en"
-    return SentenceTransformer(model_name, device="cpu")
+def _load_bge() -> "SentenceTransformer":
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(BGE_MODEL_NAME, device="cpu")
 
 
 def bge(text: str) -> Embedding:
     model = _load_bge()
     return model.encode(text, show_progress_bar=False).tolist()
+
+
+def bge_batch(texts: List[str], batch_size: Optional[int] = None) -> List[Embedding]:
+    """Embed texts with BGE, letting SentenceTransformer batch the forward passes."""
+    model = _load_bge()
+    embeddings = model.encode(
+        texts, batch_size=batch_size or BGE_BATCH_SIZE, show_progress_bar=False
+    )
+    # Explicitly typed to satisfy type checker
+    batch: List[Embedding] = embeddings.tolist()
+    return batch
@@ -0,0 +1,219 @@
+"""
+Embedding cache module for DeSciDB.
+
+This module provides a persistent, content-addressed cache for embeddings,
+keyed by the embedder and model name and a hash of the embedded text. Entries are stored
+in SQLite and evicted least-recently-used once the cache exceeds its size bound.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from descidb.types.embedder import Embedding
+from descidb.utils.logging_utils import get_logger
+
+# Get module logger
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "descidb" / "embeddings.sqlite"
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Values of DESCIDB_EMBEDDING_CACHE that turn the cache off
+_DISABLED_VALUES = {"", "0", "off", "false", "none"}
+
+
+class EmbeddingCache:
+    """
+    Persistent LRU cache of embeddings backed by SQLite.
+
+    Keys are "<embedder>:<sha256 of text>", where embedder names the embedder
+    and its model (e.g. "openai/text-embedding-3-small") so vectors from another
+    model are never served. Values are the embedding stored as packed float64
+    so cached vectors are returned bit-for-bit unchanged.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Open (or create) an embedding cache.
+
+        Args:
+            path: Path to the SQLite database file
+            max_entries: Maximum number of embeddings kept before LRU eviction
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.path.parent, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                embedding BLOB NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_access ON embeddings (last_access)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(embedder: str, text: str) -> str:
+        """Return the cache key for a text embedded with the given embedder."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{embedder}:{digest}"
+
+    @staticmethod
+    def _encode(embedding: Embedding) -> bytes:
+        return array("d", embedding).tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> Embedding:
+        values = array("d")
+        values.frombytes(blob)
+        return values.tolist()
+
+    def get(self, embedder: str, text: str) -> Optional[Embedding]:
+        """Return the cached embedding for text, or None on a miss."""
+        return self.get_many(embedder, [text])[0]
+
+    def get_many(
+        self, embedder: str, texts: Sequence[str]
+    ) -> List[Optional[Embedding]]:
+        """Return cached embeddings for texts, with None for every miss."""
+        keys = [self.make_key(embedder, text) for text in texts]
+        found: Dict[str, Embedding] = {}
+
+        with self._lock:
+            unique_keys = list(dict.fromkeys(keys))
+            # Stay below SQLite's default bound-variable limit
+            for start in range(0, len(unique_keys), 500):
+                end = start + 500
+                batch = unique_keys[start:end]
+                placeholders = ",".join("?" * len(batch))
+                rows = self.conn.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                found.update((key, self._decode(blob)) for key, blob in rows)
+
+            if found:
+                now = time.time()
+                self.conn.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self.conn.commit()
+
+            results = [found.get(key) for key in keys]
+            hits = sum(1 for result in results if result is not None)
+            self.hits += hits
+            self.misses += len(results) - hits
+
+        return results
+
+    def put(self, embedder: str, text: str, embedding: Embedding) -> None:
+        """Store the embedding for text."""
+        self.put_many(embedder, [text], [embedding])
+
+    def put_many(
+        self, embedder: str, texts: Sequence[str], embeddings: Sequence[Embedding]
+    ) -> None:
+        """Store embeddings for texts, evicting least recently used entries if needed."""
+        now = time.time()
+        rows = [
+            (self.make_key(embedder, text), self._encode(embedding), now)
+            for text, embedding in zip(texts, embeddings)
+            if embedding
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding, last_access) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries above max_entries."""
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                """
+                DELETE FROM embeddings WHERE key IN (
+                    SELECT key FROM embeddings ORDER BY last_access ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            logger.debug(f"Evicted {overflow} embeddings from cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return int(count)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self.conn.execute("DELETE FROM embeddings")
+            self.conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Return the process-wide embedding cache, or None if it is disabled.
+
+    The cache location is read from DESCIDB_EMBEDDING_CACHE (set it to "off" to
+    disable caching) and its size bound from DESCIDB_EMBEDDING_CACHE_MAX_ENTRIES.
+    """
+    global _cache
+
+    setting = os.getenv("DESCIDB_EMBEDDING_CACHE", str(DEFAULT_CACHE_PATH))
+    if setting.strip().lower() in _DISABLED_VALUES:
+        return None
+
+    with _cache_lock:
+        if _cache is None or _cache.path != Path(setting):
+            max_entries = int(
+                os.getenv("DESCIDB_EMBEDDING_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+            )
+            try:
+                _cache = EmbeddingCache(setting, max_entries=max_entries)
+                logger.info(f"Using embedding cache at {setting}")
+            except sqlite3.Error as e:
+                logger.error(f"Failed to open embedding cache at {setting}: {e}")
+                return None
+        return _cache
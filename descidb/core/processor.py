@@ -7,21 +7,30 @@ of scientific documents, including conversion, chunking, embedding, and storage.
 
 import json
 import os
-import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import certifi
-import requests
 
 from descidb.core.chunker import chunk
 from descidb.core.converter import convert
-from descidb.core.embedder import embed
+from descidb.core.embedder import embed_batch
 from descidb.db.chroma_client import VectorDatabaseManager
-from descidb.db.graph_db import IPFSNeo4jGraph
+from descidb.db.graph_db import GraphWriteBuffer, IPFSNeo4jGraph
 from descidb.db.postgres_db import PostgresDBManager
 from descidb.rewards.token_rewarder import TokenRewarder
+from descidb.types.embedder import Embedding
+from descidb.utils.cid import compute_cid, is_single_block
+from descidb.utils.git_commit_batcher import GitCommitBatcher
+from descidb.utils.http_client import get_session
+from descidb.utils.ipfs_blob_store import get_blob_store
 from descidb.utils.logging_utils import get_logger
+from descidb.utils.metadata_index import MetadataIndex
+from descidb.utils.upload_queue import UploadQueue
 
 # Get module logger
 logger = get_logger(__name__)
@@ -39,6 +48,10 @@ class Processor:
         ipfs_api_key: str,
         TokenRewarder: TokenRewarder,
         project_root: Optional[Path] = None,
+        max_workers: int = 1,
+        local_cids: bool = False,
+        git_commit_batch_size: int = 1,
+        git_commit_interval: float = 0.0,
     ):
         """
         Initialize the processor.
@@ -51,6 +64,15 @@ class Processor:
             ipfs_api_key: API key for Lighthouse IPFS
             TokenRewarder: Token rewarder instance
             project_root: Path to project root directory
+            max_workers: Number of chunks processed concurrently. A value of 1
+                keeps the original serial behaviour.
+            local_cids: Compute CIDs locally and upload in the background through
+                a persistent queue instead of waiting for Lighthouse.
+            git_commit_batch_size: Number of CID files recorded per git commit. A
+                value of 1 commits every CID separately; pending files are always
+                committed at the end of each document.
+            git_commit_interval: Seconds after which pending CID files are
+                committed even if the batch is not full, 0 disables this.
         """
         self.logger = get_logger(__name__ + ".Processor")
         self.db_manager = db_manager  # Vector Database Manager
@@ -62,6 +84,12 @@ class Processor:
         self.convert_cache: Dict[str, str] = {}  # Cache for converted text
         self.chunk_cache: Dict[str, List[str]] = {}  # Cache for chunked text
         self.project_root = project_root or Path(__file__).parent.parent.parent
+        self.max_workers = max(1, int(max_workers))
+        # Serializes CID file creation; the batcher serializes the git commands
+        self._git_lock = threading.Lock()
+        self.git_batcher = GitCommitBatcher(
+            max_files=git_commit_batch_size, max_interval=git_commit_interval
+        )
 
         # Create temp directory for temporary files
         self.temp_dir = self.project_root / "temp"
@@ -72,6 +100,10 @@ class Processor:
         self.tmp_file_path = self.temp_dir / "tmp.txt"
         self.cids_file_path = self.temp_dir / "cids.txt"
 
+        # id -> offset indexes of metadata files, built on first lookup
+        self._metadata_indexes: Dict[str, MetadataIndex] = {}
+        self._metadata_lock = threading.Lock()
+
         # Set SSL certificate path explicitly
         os.environ["SSL_CERT_FILE"] = certifi.where()
 
@@ -83,15 +115,23 @@ class Processor:
             uri=neo4j_uri, username=neo4j_username, password=neo4j_password
         )
 
+        self.upload_queue: Optional[UploadQueue] = None
+        if local_cids:
+            self.upload_queue = UploadQueue(
+                ipfs_api_key=self.ipfs_api_key,
+                spool_dir=self.temp_dir / "upload_queue",
+            )
+
         self.__write_to_file(self.authorPublicKey, str(self.tmp_file_path))
         self.logger.info(
             f"Uploading author public key to Lighthouse: {self.authorPublicKey[:10]}..."
         )
-        self.author_cid = self.__upload_text_to_lighthouse(
-            str(self.tmp_file_path)
-        ).split("ipfs/")[-1]
+        author_cid = self.__store_on_ipfs(str(self.tmp_file_path))
+        self.author_cid = author_cid.split("ipfs/")[-1]
         self.logger.info(f"Author CID: {self.author_cid}")
         self.graph_db.add_ipfs_node(self.author_cid)
+        # Per-chunk graph writes are batched into UNWIND transactions
+        self.graph_writer = GraphWriteBuffer(self.graph_db)
 
     def __upload_text_to_lighthouse(self, filename: str) -> str:
         """Uploads a string as a file to Lighthouse IPFS and returns the IPFS hash (CID).
@@ -106,7 +146,7 @@ class Processor:
 
         with open(filename, "rb") as file:
             files = {"file": file}
-            response = requests.post(url, headers=headers, files=files)
+            response = get_session().post(url, headers=headers, files=files)
 
         response.raise_for_status()
 
@@ -114,6 +154,40 @@ class Processor:
         hash_value: str = response.json()["Hash"]
         return hash_value
 
+    def __store_on_ipfs(self, filename: str) -> str:
+        """Returns the IPFS CID of a file, uploading it now or via the upload queue.
+
+        With local CIDs enabled, files that IPFS stores as a single block get their
+        CID computed locally and are handed to the background upload queue; their
+        bytes are also seeded into the local IPFS blob cache. Larger files are
+        uploaded synchronously because their CID depends on Lighthouse's chunking.
+
+        - filename: Path of the file to store.
+        - Returns: IPFS hash (CID) of the file.
+        """
+        if self.upload_queue is not None:
+            with open(filename, "rb") as file:
+                data = file.read()
+            if is_single_block(data):
+                cid = compute_cid(data)
+                self.upload_queue.enqueue(cid, data)
+                get_blob_store().put(cid, data)
+                return cid
+
+        return self.__upload_text_to_lighthouse(filename)
+
+    def close(self, wait: bool = True) -> None:
+        """Flushes pending graph writes and git commits and stops the upload queue.
+
+        - wait: Block until all queued uploads have been drained.
+        """
+        self.graph_writer.close()
+        self.git_batcher.close()
+        if self.upload_queue is not None:
+            self.upload_queue.close(wait=wait)
+        for index in self._metadata_indexes.values():
+            index.close()
+
     def __create_file_with_ipfs(self, content: str, file_path: str) -> str:
         """Creates a file with the IPFS CID and returns the CID.
 
@@ -131,7 +205,7 @@ class Processor:
             return ""  # Return empty string in case of error
 
     def __lighthouse_and_commit(self, object: Union[str, Path], git_path: str) -> str:
-        """Uploads a file to Lighthouse IPFS and commits the CID to git.
+        """Uploads a file to Lighthouse IPFS and queues the CID for a git commit.
 
         - object: Path to the object to be uploaded.
         - Returns: IPFS hash (CID) of the uploaded file.
@@ -139,27 +213,23 @@ class Processor:
         try:
             object_str = str(object)
             self.logger.info(f"Uploading to Lighthouse: {object_str}")
-            ipfs_cid = self.__upload_text_to_lighthouse(object_str)
+            ipfs_cid = self.__store_on_ipfs(object_str)
 
             hash_value = ipfs_cid.split("ipfs/")[-1]
             self.logger.info(f"Generated IPFS CID: {hash_value}")
 
             file_path = os.path.join(git_path, f"{hash_value}.txt")
 
-            self.__create_file_with_ipfs(ipfs_cid, file_path)
-
-            subprocess.run(["git", "-C", git_path, "add", file_path], check=True)
-            subprocess.run(
-                [
-                    "git",
-                    "-C",
-                    git_path,
-                    "commit",
-                    "-m",
-                    f"Added IPFS CID: {hash_value}",
-                ],
-                check=True,
-            )
+            with self._git_lock:
+                # Identical content maps to the same CID, which is already recorded
+                if os.path.exists(file_path):
+                    return ipfs_cid
+
+                # The upload stands, but a CID file that was not written cannot be committed
+                if not self.__create_file_with_ipfs(ipfs_cid, file_path):
+                    return ipfs_cid
+
+            self.git_batcher.add(git_path, file_path, hash_value)
 
             return ipfs_cid
 
@@ -181,6 +251,145 @@ class Processor:
         except Exception as e:
             self.logger.error(f"Error writing to file {file_path}: {e}")
 
+    def __write_to_temp_file(self, content: str) -> Path:
+        """Writes the content to a new, uniquely named file in the temp directory.
+
+        Used by chunk workers, which cannot share the single tmp.txt file.
+
+        - content: The content to be written to the file.
+        - Returns: Path to the created file. The caller is responsible for removing it.
+        """
+        fd, path = tempfile.mkstemp(suffix=".txt", dir=self.temp_dir)
+        with os.fdopen(fd, "w") as file:
+            file.write(content)
+        return Path(path)
+
+    def __lighthouse_and_commit_text(self, content: str, git_path: str) -> str:
+        """Uploads a string to Lighthouse IPFS via a private temp file and commits the CID.
+
+        - content: The string content to be uploaded.
+        - git_path: Path to git repository for storing CIDs.
+        - Returns: IPFS hash (CID) of the uploaded content, empty string on failure.
+        """
+        tmp_path = self.__write_to_temp_file(content)
+        try:
+            return self.__lighthouse_and_commit(object=tmp_path, git_path=git_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def __process_chunk(
+        self,
+        chunk_i: str,
+        embedding: Embedding,
+        converted_text_ipfs_cid: str,
+        chunker_func: str,
+        embedder_func: str,
+        git_path: str,
+    ) -> None:
+        """Uploads, embeds and links a single chunk of a converted document.
+
+        - chunk_i: The chunk text.
+        - embedding: The precomputed embedding of the chunk.
+        - converted_text_ipfs_cid: CID of the converted document the chunk belongs to.
+        - chunker_func: Name of the chunker that produced the chunk.
+        - embedder_func: Name of the embedder that produced the embedding.
+        - git_path: Path to git repository for storing CIDs.
+        """
+        chunk_text_ipfs_cid = self.__lighthouse_and_commit_text(chunk_i, git_path)
+        if not chunk_text_ipfs_cid:
+            self.logger.error("Failed to upload chunk to IPFS, skipping chunk")
+            return
+
+        self.graph_writer.add_ipfs_node(chunk_text_ipfs_cid)
+        self.graph_writer.create_relationship(
+            converted_text_ipfs_cid,
+            chunk_text_ipfs_cid,
+            "CHUNKED_BY_" + chunker_func,
+        )
+        self.graph_writer.create_relationship(
+            chunk_text_ipfs_cid, self.author_cid, "AUTHORED_BY"
+        )
+
+        embedding_ipfs_cid = self.__lighthouse_and_commit_text(
+            json.dumps(embedding), git_path
+        )
+        if not embedding_ipfs_cid:
+            self.logger.error(
+                f"Failed to upload embedding for chunk {chunk_text_ipfs_cid}"
+            )
+            return
+
+        self.graph_writer.add_ipfs_node(embedding_ipfs_cid)
+        self.graph_writer.create_relationship(
+            chunk_text_ipfs_cid,
+            embedding_ipfs_cid,
+            "EMBEDDED_BY_" + embedder_func,
+        )
+        self.graph_writer.create_relationship(
+            embedding_ipfs_cid, self.author_cid, "AUTHORED_BY"
+        )
+
+    def __process_chunks(
+        self,
+        chunked_text: List[str],
+        embeddings: List[Embedding],
+        converted_text_ipfs_cid: str,
+        chunker_func: str,
+        embedder_func: str,
+        git_path: str,
+    ) -> None:
+        """Runs the per-chunk pipeline over all chunks, fanning out to a bounded pool.
+
+        Every chunk only depends on the CID of its parent document, so chunks are
+        independent of each other. Git commits are serialized by a lock.
+        """
+        start_time = time.perf_counter()
+        failed = 0
+
+        if self.max_workers == 1:
+            for chunk_i, embedding in zip(chunked_text, embeddings):
+                try:
+                    self.__process_chunk(
+                        chunk_i,
+                        embedding,
+                        converted_text_ipfs_cid,
+                        chunker_func,
+                        embedder_func,
+                        git_path,
+                    )
+                except Exception as e:
+                    failed += 1
+                    self.logger.error(f"Error processing chunk: {e}")
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="descidb-chunk"
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.__process_chunk,
+                        chunk_i,
+                        embedding,
+                        converted_text_ipfs_cid,
+                        chunker_func,
+                        embedder_func,
+                        git_path,
+                    )
+                    for chunk_i, embedding in zip(chunked_text, embeddings)
+                ]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed += 1
+                        self.logger.error(f"Error processing chunk: {e}")
+
+        elapsed = time.perf_counter() - start_time
+        rate = len(chunked_text) / elapsed if elapsed > 0 else 0.0
+        self.logger.info(
+            f"Processed {len(chunked_text)} chunks ({failed} failed) in {elapsed:.2f}s: "
+            f"{rate:.2f} chunks/sec with {self.max_workers} worker(s)"
+        )
+
     def process(self, pdf_path: str, databases: List[dict], git_path: str) -> None:
         """
         Processes the PDF according to the list of database configurations passed.
@@ -221,8 +430,8 @@ class Processor:
             return
 
         self.logger.info(f"Adding PDF CID to graph: {metadata['pdf_ipfs_cid']}")
-        self.graph_db.add_ipfs_node(metadata["pdf_ipfs_cid"])
-        self.graph_db.create_relationship(
+        self.graph_writer.add_ipfs_node(metadata["pdf_ipfs_cid"])
+        self.graph_writer.create_relationship(
             metadata["pdf_ipfs_cid"], self.author_cid, "AUTHORED_BY"
         )
 
@@ -231,6 +440,9 @@ class Processor:
             self.logger.debug(f"Recorded CID in {self.cids_file_path}")
 
         for db_config in databases:
+            # Make earlier writes visible to the conversion lookup below
+            self.graph_writer.flush()
+
             converter_func = db_config["converter"]
             chunker_func = db_config["chunker"]
             embedder_func = db_config["embedder"]
@@ -279,13 +491,13 @@ class Processor:
                     object=self.tmp_file_path, git_path=git_path
                 )
 
-                self.graph_db.add_ipfs_node(converted_text_ipfs_cid)
-                self.graph_db.create_relationship(
+                self.graph_writer.add_ipfs_node(converted_text_ipfs_cid)
+                self.graph_writer.create_relationship(
                     metadata["pdf_ipfs_cid"],
                     converted_text_ipfs_cid,
                     "CONVERTED_BY_" + converter_func,
                 )
-                self.graph_db.create_relationship(
+                self.graph_writer.create_relationship(
                     converted_text_ipfs_cid, self.author_cid, "AUTHORED_BY"
                 )
 
@@ -300,57 +512,50 @@ class Processor:
             else:
                 chunked_text = self.chunk_cache[chunk_cache_key]
 
-            for chunk_index, chunk_i in enumerate(chunked_text):
-                self.__write_to_file(chunk_i, self.tmp_file_path)
-
-                chunk_text_ipfs_cid = self.__lighthouse_and_commit(
-                    object=self.tmp_file_path, git_path=git_path
-                )
-
-                self.graph_db.add_ipfs_node(chunk_text_ipfs_cid)
-                self.graph_db.create_relationship(
-                    converted_text_ipfs_cid,
-                    chunk_text_ipfs_cid,
-                    "CHUNKED_BY_" + chunker_func,
+            # Step 2.3: Embedding, one batched call for all chunks
+            try:
+                embeddings = embed_batch(
+                    embedder_type=embedder_func, texts=chunked_text
                 )
-                self.graph_db.create_relationship(
-                    chunk_text_ipfs_cid, self.author_cid, "AUTHORED_BY"
+            except Exception as e:
+                self.logger.error(
+                    f"Error embedding {len(chunked_text)} chunks with {embedder_func}: {e}"
                 )
-                # Step 2.3: Embedding
-
-                embedding = embed(embeder_type=embedder_func, input_text=chunk_i)
-
-                self.__write_to_file(json.dumps(embedding), self.tmp_file_path)
+                continue
+
+            self.__process_chunks(
+                chunked_text,
+                embeddings,
+                converted_text_ipfs_cid,
+                chunker_func,
+                embedder_func,
+                git_path,
+            )
 
-                embedding_ipfs_cid = self.__lighthouse_and_commit(
-                    object=self.tmp_file_path, git_path=git_path
-                )
-                self.graph_db.add_ipfs_node(embedding_ipfs_cid)
-                self.graph_db.create_relationship(
-                    chunk_text_ipfs_cid,
-                    embedding_ipfs_cid,
-                    "EMBEDDED_BY_" + embedder_func,
-                )
-                self.graph_db.create_relationship(
-                    embedding_ipfs_cid, self.author_cid, "AUTHORED_BY"
-                )
+        self.graph_writer.flush()
+        self.git_batcher.flush()
 
     def get_metadata_for_doc(self, metadata_file: str, doc_id: str) -> Dict[str, Any]:
         """Retrieves metadata for the given document ID from the metadata file.
 
+        Lookups go through an id -> byte offset index stored in the temp
+        directory, built on first use and rebuilt when the file changes.
+
         - metadata_file: Path to the metadata file.
         - doc_id: Document ID to retrieve metadata for.
         - Returns: Dictionary containing metadata or empty dict if not found.
         """
-        with open(metadata_file, "r") as file:
-            for line in file:
-                try:
-                    data = json.loads(line)
-                    if data.get("id") == doc_id:
-                        return data  # type: ignore[no-any-return]
-                except json.JSONDecodeError:
-                    continue
-        return {}
+        with self._metadata_lock:
+            index = self._metadata_indexes.get(metadata_file)
+            if index is None:
+                index_file = (
+                    self.temp_dir
+                    / "metadata_index"
+                    / f"{Path(metadata_file).name}.sqlite"
+                )
+                index = MetadataIndex(metadata_file, index_file)
+                self._metadata_indexes[metadata_file] = index
+        return index.get(doc_id)
 
     def default_metadata(self, doc_id: str) -> Dict[str, Any]:
         """Returns default metadata in case None is found.
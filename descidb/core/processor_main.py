@@ -14,6 +14,7 @@ from pathlib import Path
 import yaml
 from dotenv import load_dotenv
 
+from descidb.core.converter import release_marker, warm_up_marker
 from descidb.core.processor import Processor
 from descidb.db.chroma_client import VectorDatabaseManager
 from descidb.db.postgres_db import PostgresDBManager
@@ -49,6 +50,20 @@ def load_config():
         raise
 
 
+def create_vector_indexes(db_manager_postgres, postgres_config, databases, index_types):
+    """Build the configured pgvector index on each database if it is one of index_types."""
+    vector_index = postgres_config.get("vector_index", "none")
+    if vector_index not in index_types:
+        return
+    vector_dimensions = postgres_config.get("vector_dimensions", {})
+    for db_config in databases:
+        db_manager_postgres.create_vector_index(
+            db_config["db_name"],
+            dimensions=vector_dimensions.get(db_config["embedder"]),
+            index_type=vector_index,
+        )
+
+
 def test_processor():
     """
     Test the document processing pipeline with sample papers.
@@ -77,6 +92,9 @@ def test_processor():
         port=postgres_config["port"],
         user=postgres_config["user"],
         password=postgres_config["password"],
+        min_connections=postgres_config.get("min_connections", 1),
+        max_connections=postgres_config.get("max_connections", 10),
+        embedding_format=postgres_config.get("embedding_format", "float32"),
     )
 
     # Get papers
@@ -119,6 +137,10 @@ def test_processor():
 
     db_manager_postgres.create_databases(db_names)
 
+    # HNSW indexes take inserts incrementally, so they can exist before the load;
+    # IVFFlat lists are sized from the row count and are built after it
+    create_vector_indexes(db_manager_postgres, postgres_config, databases, ("hnsw",))
+
     processor = Processor(
         authorPublicKey=author_config["public_key"],
         db_manager=db_manager,
@@ -127,8 +149,17 @@ def test_processor():
         ipfs_api_key=lighthouse_api_key,
         TokenRewarder=tokenRewarder,
         project_root=PROJECT_ROOT,
+        max_workers=processing_config.get("max_workers", 1),
+        local_cids=processing_config.get("local_cids", False),
+        git_commit_batch_size=processing_config.get("git_commit_batch_size", 1),
+        git_commit_interval=processing_config.get("git_commit_interval", 0.0),
     )
 
+    # Pay the marker model-load cost once for the whole batch of papers
+    uses_marker = "marker" in components["converter"]
+    if uses_marker:
+        warm_up_marker()
+
     for paper in papers:
         logger.info(f"Processing {paper}...")
         random_data = os.urandom(32)
@@ -152,6 +183,15 @@ def test_processor():
 
         time.sleep(5)
 
+    if uses_marker:
+        release_marker()
+
+    # Wait for background uploads to drain before exiting
+    processor.close()
+
+    create_vector_indexes(db_manager_postgres, postgres_config, databases, ("ivfflat",))
+    db_manager_postgres.close()
+
 
 if __name__ == "__main__":
     logger.info("Running test_processor")
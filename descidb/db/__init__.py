@@ -2,9 +2,23 @@
 Database management module.
 
 This module provides classes and functions for working with different databases,
-including ChromaDB, Neo4j, and PostgreSQL.
+including ChromaDB, Neo4j, and PostgreSQL. Each client is imported on first use.
 """
 
-from descidb.db.chroma_client import VectorDatabaseManager
-from descidb.db.graph_db import IPFSNeo4jGraph
-from descidb.db.postgres_db import PostgresDBManager
+from typing import TYPE_CHECKING
+
+from descidb.utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attrs={
+        "descidb.db.chroma_client": ["VectorDatabaseManager"],
+        "descidb.db.graph_db": ["GraphWriteBuffer", "IPFSNeo4jGraph"],
+        "descidb.db.postgres_db": ["PostgresDBManager"],
+    },
+)
+
+if TYPE_CHECKING:
+    from descidb.db.chroma_client import VectorDatabaseManager
+    from descidb.db.graph_db import GraphWriteBuffer, IPFSNeo4jGraph
+    from descidb.db.postgres_db import PostgresDBManager
@@ -7,10 +7,12 @@ used to store document embeddings and perform vector similarity searches.
 
 import itertools
 import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, cast
 
 import chromadb
+from chromadb.api.types import Embeddings, Metadatas
 
 
 class VectorDatabaseManager:
@@ -58,6 +60,9 @@ class VectorDatabaseManager:
         os.makedirs(db_path_obj, exist_ok=True)
 
         self.db_client = chromadb.PersistentClient(path=str(db_path_obj))
+        self._collections: Dict[str, chromadb.Collection] = {}
+        self._collections_lock = threading.Lock()
+        self._max_batch_size: Optional[int] = None
         self.initialize_databases()
 
     def initialize_databases(self):
@@ -82,7 +87,7 @@ class VectorDatabaseManager:
             raise ValueError(f"Database '{db_name}' does not exist.")
 
         # Insert document into the database
-        collection = self.db_client.get_collection(name=db_name)
+        collection = self._get_collection(db_name)
         try:
             collection.add(
                 documents=[metadata["content_cid"]],
@@ -93,12 +98,76 @@ class VectorDatabaseManager:
         except Exception as e:
             print(f"Error inserting document into database '{db_name}': {e}")
 
+    def _get_collection(self, db_name: str) -> chromadb.Collection:
+        """Returns a cached handle to the named collection (thread-safe)."""
+        with self._collections_lock:
+            collection = self._collections.get(db_name)
+            if collection is None:
+                collection = self.db_client.get_collection(name=db_name)
+                self._collections[db_name] = collection
+            return collection
+
+    @property
+    def max_batch_size(self) -> int:
+        """The largest number of records the client accepts in a single add."""
+        if self._max_batch_size is None:
+            self._max_batch_size = self.db_client.get_max_batch_size()
+        return self._max_batch_size
+
+    def insert_documents(
+        self,
+        db_name: str,
+        embeddings: List[list],
+        metadatas: List[dict],
+        ids: List[str],
+        upsert: bool = False,
+    ):
+        """
+        Inserts many documents into the specified database.
+
+        Inputs larger than the client's maximum batch size are split into several
+        calls. With upsert=True existing ids are overwritten, so re-running an
+        ingestion is idempotent. Chroma rejects repeated ids within a call, so
+        only the last occurrence of an id is written.
+
+        :param db_name: Name of the database where the documents are to be inserted.
+        :param embeddings: The embeddings of the document chunks to insert.
+        :param metadatas: Metadata associated with each document chunk.
+        :param ids: Document IDs to use for insertion.
+        :param upsert: Update documents whose ids already exist instead of skipping them.
+        """
+        if db_name not in self.db_names:
+            raise ValueError(f"Database '{db_name}' does not exist.")
+        if not len(embeddings) == len(metadatas) == len(ids):
+            raise ValueError("embeddings, metadatas and ids must have the same length.")
+
+        # Index of the last occurrence of every id, in first-seen order
+        last = {doc_id: i for i, doc_id in enumerate(ids)}
+        if len(last) < len(ids):
+            embeddings = [embeddings[i] for i in last.values()]
+            metadatas = [metadatas[i] for i in last.values()]
+            ids = list(last)
+
+        collection = self._get_collection(db_name)
+        write = collection.upsert if upsert else collection.add
+        batch_size = self.max_batch_size
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            write(
+                documents=[
+                    metadata["content_cid"] for metadata in metadatas[start:end]
+                ],
+                embeddings=cast(Embeddings, embeddings[start:end]),
+                ids=ids[start:end],
+                metadatas=cast(Metadatas, metadatas[start:end]),
+            )
+
     def print_all_metadata(self):
         """
         Retrieves and prints all metadata from every collection.
         """
         for db_name in self.db_names:
-            collection = self.db_client.get_collection(name=db_name)
+            collection = self._get_collection(db_name)
             # Retrieve all entries from the collection.
             # The structure of the returned results is assumed to contain a "metadatas" key.
             results = collection.get()
@@ -6,11 +6,16 @@ with scientific document data for the DeSciDB system.
 """
 
 import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
 
+from descidb.utils.ipfs_blob_store import get_blob_store
 from descidb.utils.logging_utils import get_logger
 
 # Get module logger
@@ -30,17 +35,32 @@ class DatabaseCreator:
     relationships and inserts them into ChromaDB collections.
     """
 
-    def __init__(self, graph, vector_db_manager):
+    def __init__(self, graph, vector_db_manager, max_in_flight=16, batch_size=64):
         """
         Initialize the DatabaseCreator.
 
         Args:
             graph: IPFSNeo4jGraph instance for graph database operations
             vector_db_manager: VectorDatabaseManager instance for vector database operations
+            max_in_flight: Maximum number of paths fetched from IPFS concurrently
+            batch_size: Number of fetched documents inserted per batch
         """
         self.graph = graph
         self.vector_db_manager = vector_db_manager
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.batch_size = max(1, int(batch_size))
         self.logger = get_logger(__name__ + ".DatabaseCreator")
+        # Totals across all process_paths calls, which may run in parallel
+        self.metrics = {
+            "paths": 0,
+            "inserted": 0,
+            "failed": 0,
+            "insert_failed": 0,
+            "duplicates": 0,
+        }
+        self._metrics_lock = threading.Lock()
+        # Fetches run in parallel, writes to the vector database one at a time
+        self._insert_lock = threading.Lock()
 
     def query_lighthouse_for_embedding(self, cid):
         """
@@ -52,71 +72,179 @@ class DatabaseCreator:
         Returns:
             List representation of the embedding vector or None if retrieval fails
         """
-        url = f"https://gateway.lighthouse.storage/ipfs/{cid}"
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            embedding_vector = json.loads(response.text)
+            embedding_vector = json.loads(get_blob_store().get_text(cid))
             return embedding_vector
         except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
             self.logger.error(f"Failed to retrieve embedding for CID {cid}: {e}")
             return None
 
     def query_ipfs_content(self, cid):
-        url = f"https://gateway.lighthouse.storage/ipfs/{cid}"
+        """
+        Query the IPFS blob store for the text content of a CID.
+
+        Args:
+            cid: IPFS CID of the content
+
+        Returns:
+            The content as a string or None if retrieval fails
+        """
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            content = response.text
+            content = get_blob_store().get_text(cid)
             return content
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Failed to retrieve IPFS content for CID {cid}: {e}")
             return None
 
+    def _fetch_path(self, start_cid, path_nodes):
+        """
+        Fetch the embedding and content for one graph path.
+
+        Args:
+            start_cid: Root CID the path starts from
+            path_nodes: CIDs along the path, ending in content and embedding
+
+        Returns:
+            Tuple of (embedding_cid, embedding_vector, metadata) or None on failure
+        """
+        if len(path_nodes) < 2:
+            self.logger.error(f"Path {path_nodes} is too short.")
+            return None
+
+        content_cid = path_nodes[-2]
+        embedding_cid = path_nodes[-1]
+
+        try:
+            embedding_vector = self.query_lighthouse_for_embedding(embedding_cid)
+            content = (
+                self.query_ipfs_content(content_cid)
+                if embedding_vector is not None
+                else None
+            )
+        except (OSError, KeyError, ValueError) as e:
+            # A bad path is skipped instead of aborting the whole root CID
+            self.logger.error(f"Skipping path {path_nodes}: {e}")
+            return None
+
+        if embedding_vector is None:
+            self.logger.error(
+                f"Skipping path {path_nodes} due to failed embedding retrieval."
+            )
+            return None
+
+        if content is None:
+            self.logger.error(
+                f"Skipping path {path_nodes} due to failed IPFS content retrieval."
+            )
+            return None
+
+        metadata = {
+            "content_cid": content_cid,
+            "root_cid": start_cid,
+            "embedding_cid": embedding_cid,
+            "content": content,
+        }
+        return embedding_cid, embedding_vector, metadata
+
+    def _insert_batch(self, db_name, batch):
+        """
+        Insert fetched documents into a collection.
+
+        Documents sharing an embedding CID are written once, keeping the last.
+
+        Args:
+            db_name: Name of the collection
+            batch: List of (embedding_cid, embedding_vector, metadata) tuples
+
+        Returns:
+            Dictionary with the number of inserted, insert_failed and duplicate
+            documents
+        """
+        unique = list({embedding_cid: item for embedding_cid, *item in batch}.items())
+        duplicates = len(batch) - len(unique)
+        ids = [embedding_cid for embedding_cid, _ in unique]
+        embeddings = [embedding_vector for _, (embedding_vector, _) in unique]
+        metadatas = [metadata for _, (_, metadata) in unique]
+        try:
+            # Upsert so that re-running the ingestion for a root CID is idempotent
+            with self._insert_lock:
+                self.vector_db_manager.insert_documents(
+                    db_name, embeddings, metadatas, ids, upsert=True
+                )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to insert {len(ids)} documents into '{db_name}': {e}"
+            )
+            return {"inserted": 0, "insert_failed": len(ids), "duplicates": duplicates}
+        self.logger.info(f"Inserted {len(ids)} documents into '{db_name}'")
+        return {"inserted": len(ids), "insert_failed": 0, "duplicates": duplicates}
+
+    def _record(self, **counts):
+        with self._metrics_lock:
+            for key, value in counts.items():
+                self.metrics[key] += value
+
     def process_paths(self, start_cid, path, db_name):
+        """
+        Recreate the documents reachable from a root CID in a vector database.
+
+        Embeddings and contents are fetched concurrently, with at most
+        max_in_flight paths outstanding, and inserted in batches of batch_size.
+
+        Args:
+            start_cid: Root CID to start from
+            path: Relationship types to follow from the root
+            db_name: Name of the collection to insert into
+
+        Returns:
+            Dictionary with the number of paths, inserted documents, paths that
+            failed to fetch, documents that failed to insert, duplicate documents
+            dropped from a batch, and the elapsed time in seconds
+        """
         paths = self.graph.recreate_path(start_cid, path)
 
         if paths is False:
             self.logger.error(f"No valid paths found for CID {start_cid}")
-            return
+            return None
 
         self.logger.info(f"Found {len(paths)} paths for CID {start_cid}")
 
-        for path_nodes in paths:
-            if len(path_nodes) < 2:
-                self.logger.error(f"Path {path_nodes} is too short.")
-                continue
-
-            content_cid = path_nodes[-2]
-            embedding_cid = path_nodes[-1]
-
-            embedding_vector = self.query_lighthouse_for_embedding(embedding_cid)
-            if embedding_vector is None:
-                self.logger.error(
-                    f"Skipping path {path_nodes} due to failed embedding retrieval."
-                )
-                continue
-
-            content = self.query_ipfs_content(content_cid)
-            if content is None:
-                self.logger.error(
-                    f"Skipping path {path_nodes} due to failed IPFS content retrieval."
-                )
-                continue
-
-            metadata = {
-                "content_cid": content_cid,
-                "root_cid": start_cid,
-                "embedding_cid": embedding_cid,
-                "content": content,
-            }
-
-            try:
-                self.vector_db_manager.insert_document(
-                    db_name, embedding_vector, metadata, embedding_cid
-                )
-                self.logger.info(
-                    f"Inserted document into '{db_name}' with CID {embedding_cid}"
-                )
-            except Exception as e:
-                self.logger.error(f"Failed to insert document into '{db_name}': {e}")
+        start_time = time.monotonic()
+        fetched = failed = 0
+        counts = Counter(inserted=0, insert_failed=0, duplicates=0)
+        batch = []
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            futures = [
+                executor.submit(self._fetch_path, start_cid, path_nodes)
+                for path_nodes in paths
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    failed += 1
+                    continue
+                fetched += 1
+                batch.append(result)
+                if len(batch) >= self.batch_size:
+                    counts.update(self._insert_batch(db_name, batch))
+                    batch = []
+                    self.logger.info(
+                        f"Progress for CID {start_cid}: "
+                        f"{fetched + failed}/{len(paths)} paths fetched"
+                    )
+
+        if batch:
+            counts.update(self._insert_batch(db_name, batch))
+
+        elapsed = time.monotonic() - start_time
+        rate = counts["inserted"] / elapsed if elapsed > 0 else 0.0
+        self.logger.info(
+            f"Processed {len(paths)} paths for CID {start_cid} in {elapsed:.2f}s: "
+            f"{counts['inserted']} inserted, {failed} failed to fetch, "
+            f"{counts['insert_failed']} failed to insert, "
+            f"{counts['duplicates']} duplicates ({rate:.2f} docs/sec)"
+        )
+
+        self._record(paths=len(paths), failed=failed, **counts)
+        return {"paths": len(paths), "failed": failed, **counts, "elapsed": elapsed}
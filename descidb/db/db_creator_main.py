@@ -6,6 +6,7 @@ with scientific document data for the DeSciDB system.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
@@ -74,7 +75,15 @@ def main():
 
     # Initialize database manager
     vector_db_manager = VectorDatabaseManager(components, db_path=str(db_path))
-    create_db = DatabaseCreator(graph, vector_db_manager)
+
+    # Fetch concurrency and insert batch size, the class defaults apply if unset
+    processing_config = config.get("processing", {})
+    creator_options = {
+        key: processing_config[key]
+        for key in ("max_in_flight", "batch_size")
+        if key in processing_config
+    }
+    create_db = DatabaseCreator(graph, vector_db_manager, **creator_options)
 
     # Construct relationship paths from components
     relationship_path = []
@@ -108,15 +117,30 @@ def main():
         logger.error("No cids.txt file found. Please run processor first.")
         return
 
-    # Process CIDs
+    # Process CIDs, several root CIDs at a time
     with open(cids_file, "r") as file:
-        counter = 0
-        for line in file:
-            start_cid = line.strip()
-            if start_cid:
-                logger.info(f"Processing CID #{counter}: {start_cid}")
-                create_db.process_paths(start_cid, relationship_path, db_name)
-                counter += 1
+        start_cids = [line.strip() for line in file if line.strip()]
+
+    max_parallel_cids = max(1, int(processing_config.get("max_parallel_cids", 1)))
+
+    def process_cid(counter, start_cid):
+        logger.info(f"Processing CID #{counter}: {start_cid}")
+        create_db.process_paths(start_cid, relationship_path, db_name)
+
+    with ThreadPoolExecutor(max_workers=max_parallel_cids) as executor:
+        for future in [
+            executor.submit(process_cid, counter, start_cid)
+            for counter, start_cid in enumerate(start_cids)
+        ]:
+            future.result()
+
+    metrics = create_db.metrics
+    logger.info(
+        f"Processed {len(start_cids)} CIDs: {metrics['paths']} paths, "
+        f"{metrics['inserted']} inserted, {metrics['failed']} failed to fetch, "
+        f"{metrics['insert_failed']} failed to insert, "
+        f"{metrics['duplicates']} duplicates"
+    )
 
 
 if __name__ == "__main__":
@@ -6,16 +6,37 @@ and operations related to IPFS content identifiers (CIDs).
 """
 
 import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import certifi
 import requests
 from neo4j import GraphDatabase
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
 
+from descidb.utils.ipfs_blob_store import get_blob_store
 from descidb.utils.logging_utils import get_logger
 
 # Get module logger
 logger = get_logger(__name__)
 
+# Failures a later retry can fix: the server was unreachable or asked for a retry.
+# Anything else (e.g. a Cypher error) fails the same way every time.
+TRANSIENT_GRAPH_ERRORS = (ServiceUnavailable, SessionExpired, TransientError, OSError)
+
+# Version of the graph schema provisioned by IPFSNeo4jGraph.ensure_schema
+GRAPH_SCHEMA_VERSION = 1
+
+# Statements that bring the schema from version N-1 to version N
+SCHEMA_MIGRATIONS: Dict[int, List[str]] = {
+    1: [
+        "CREATE CONSTRAINT ipfs_cid_unique IF NOT EXISTS "
+        "FOR (n:IPFS) REQUIRE n.cid IS UNIQUE",
+    ],
+}
+
 
 class IPFSNeo4jGraph:
     """
@@ -25,7 +46,10 @@ class IPFSNeo4jGraph:
     between IPFS content identifiers in a Neo4j database.
     """
 
-    def __init__(self, uri=None, username=None, password=None):
+    # URIs whose schema has already been checked by this process
+    _schema_checked_uris: set = set()
+
+    def __init__(self, uri=None, username=None, password=None, ensure_schema=True):
         """
         Initialize the Neo4j graph connection with URI and credentials.
 
@@ -33,6 +57,8 @@ class IPFSNeo4jGraph:
             uri: Neo4j connection URI
             username: Neo4j username
             password: Neo4j password
+            ensure_schema: Provision the IPFS.cid uniqueness constraint on first
+                connect to this URI
 
         Raises:
             ValueError: If URI, username, or password is missing
@@ -69,6 +95,51 @@ class IPFSNeo4jGraph:
             self.logger.error(f"Failed to connect to Neo4j: {e}")
             raise
 
+        if ensure_schema and self.uri not in IPFSNeo4jGraph._schema_checked_uris:
+            self.ensure_schema()
+            IPFSNeo4jGraph._schema_checked_uris.add(self.uri)
+
+    def get_schema_version(self):
+        """Return the schema version recorded in the graph, 0 if none."""
+        result = self.driver.execute_query(
+            "MATCH (s:DescidbSchema) RETURN max(s.version) AS version"
+        )
+        records = list(result.records)
+        version = records[0]["version"] if records else None
+        return version or 0
+
+    def ensure_schema(self):
+        """
+        Idempotently provision constraints and indexes up to GRAPH_SCHEMA_VERSION.
+
+        The uniqueness constraint on IPFS.cid also backs every MERGE and MATCH on
+        (:IPFS {cid: ...}) with an index instead of a label scan.
+
+        Returns:
+            The schema version after provisioning, or None if it failed
+        """
+        try:
+            current_version = self.get_schema_version()
+            if current_version >= GRAPH_SCHEMA_VERSION:
+                self.logger.info(f"Graph schema is at version {current_version}")
+                return current_version
+
+            for version in range(current_version + 1, GRAPH_SCHEMA_VERSION + 1):
+                for statement in SCHEMA_MIGRATIONS[version]:
+                    self.driver.execute_query(statement)
+                self.driver.execute_query(
+                    "MERGE (s:DescidbSchema) SET s.version = $version",
+                    version=version,
+                )
+                self.logger.info(f"Graph schema migrated to version {version}")
+            return GRAPH_SCHEMA_VERSION
+        except Exception as e:
+            # Creating the constraint fails if duplicate IPFS nodes already exist
+            self.logger.error(
+                f"Failed to provision graph schema (duplicate IPFS.cid nodes?): {e}"
+            )
+            return None
+
     def close(self):
         """Close the database connection."""
         self.driver.close()
@@ -101,6 +172,86 @@ class IPFSNeo4jGraph:
                 f"Failed to create relationship {cid1} - [{relationship_type}] -> {cid2}: {e}"
             )
 
+    def add_ipfs_nodes(self, cids: Iterable[str]) -> bool:
+        """
+        Add many IPFS CIDs as nodes in Neo4j with a single UNWIND transaction.
+
+        Returns:
+            False if the transaction failed with a transient error and can be
+            retried; True if it succeeded or failed permanently (logged and dropped)
+        """
+        unique_cids = [cid for cid in dict.fromkeys(cids) if cid]
+        if not unique_cids:
+            return True
+        try:
+            with self.driver.session() as session:
+                session.execute_write(self._merge_nodes_tx, unique_cids)
+                self.logger.info(f"Nodes added: {len(unique_cids)}")
+            return True
+        except TRANSIENT_GRAPH_ERRORS as e:
+            self.logger.error(f"Failed to add {len(unique_cids)} nodes: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(
+                f"Dropping {len(unique_cids)} nodes that cannot be written: {e}"
+            )
+            return True
+
+    @staticmethod
+    def _merge_nodes_tx(tx, cids: List[str]):
+        tx.run("UNWIND $cids AS cid MERGE (:IPFS {cid: cid})", cids=cids)
+
+    def create_relationships(
+        self, relationships: Iterable[Tuple[str, str, str]]
+    ) -> bool:
+        """
+        Create many relationships in one transaction.
+
+        Relationships are grouped by type (types cannot be parameterized in Cypher)
+        and each group is merged with a single UNWIND query.
+
+        Args:
+            relationships: Iterable of (source_cid, target_cid, relationship_type)
+
+        Returns:
+            False if the transaction failed with a transient error and can be
+            retried; True if it succeeded or failed permanently (logged and dropped)
+        """
+        by_type: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        for cid1, cid2, relationship_type in relationships:
+            if cid1 and cid2:
+                by_type[relationship_type].append({"src": cid1, "dst": cid2})
+        if not by_type:
+            return True
+
+        count = sum(len(pairs) for pairs in by_type.values())
+        try:
+            with self.driver.session() as session:
+                session.execute_write(self._merge_relationships_tx, dict(by_type))
+                self.logger.info(
+                    f"Relationships created: {count} across {len(by_type)} types"
+                )
+            return True
+        except TRANSIENT_GRAPH_ERRORS as e:
+            self.logger.error(f"Failed to create {count} relationships: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(
+                f"Dropping {count} relationships that cannot be written: {e}"
+            )
+            return True
+
+    @staticmethod
+    def _merge_relationships_tx(tx, by_type: Dict[str, List[Dict[str, str]]]):
+        for relationship_type, pairs in by_type.items():
+            query = f"""
+                UNWIND $pairs AS pair
+                MERGE (a:IPFS {{cid: pair.src}})
+                MERGE (b:IPFS {{cid: pair.dst}})
+                MERGE (a)-[:{relationship_type}]->(b)
+            """
+            tx.run(query, pairs=pairs)
+
     def query_graph(self):
         """Retrieve all nodes and relationships."""
         try:
@@ -217,14 +368,14 @@ class IPFSNeo4jGraph:
         """
         Retrieves the content stored in IPFS for a given CID.
 
+        Content is served from the local IPFS blob cache when available.
+
         :param cid: The IPFS CID.
         :return: The content of the IPFS file as a string.
         """
-        url = f"https://gateway.lighthouse.storage/ipfs/{cid}"
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.text.strip()  # Ensure leading/trailing spaces are removed
+            content = get_blob_store().get_text(cid)
+            return content.strip()  # Ensure leading/trailing spaces are removed
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Failed to retrieve IPFS content for CID {cid}: {e}")
             return None
@@ -261,3 +412,173 @@ class IPFSNeo4jGraph:
         except Exception as e:
             self.logger.error(f"Failed to retrieve AUTHORED_BY stats: {e}")
             return {}
+
+
+class GraphWriteBuffer:
+    """
+    Buffers node and relationship writes for an IPFSNeo4jGraph.
+
+    Writes are flushed through the graph's bulk methods once max_size writes are
+    pending or max_interval seconds have passed since the last flush. A batch
+    whose transaction fails with a transient error is put back at the front of
+    the buffer; automatic flushes then back off exponentially until a write
+    succeeds, and once more than max_pending writes are held the oldest are
+    dropped. Batches that fail permanently are logged and dropped by the graph.
+    The buffer is thread-safe so concurrent chunk workers can share it.
+    """
+
+    def __init__(
+        self,
+        graph: IPFSNeo4jGraph,
+        max_size: int = 500,
+        max_interval: float = 5.0,
+        max_pending: int = 10_000,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            graph: Graph to write to
+            max_size: Number of pending writes that triggers a flush
+            max_interval: Seconds after which pending writes are flushed
+            max_pending: Writes kept for retry while the graph is failing
+            backoff_base: Delay in seconds before the first automatic retry,
+                doubled per consecutive failure
+            backoff_max: Upper bound for the retry delay in seconds
+        """
+        self.graph = graph
+        self.max_size = max_size
+        self.max_interval = max_interval
+        self.max_pending = max(max_pending, max_size)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._failures = 0
+        self._retry_at = 0.0
+        self._dropped = 0
+        self._nodes: List[str] = []
+        self._relationships: List[Tuple[str, str, str]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_flush = time.monotonic()
+        self._timer: Optional[threading.Thread] = None
+        if max_interval > 0:
+            self._timer = threading.Thread(
+                target=self._flush_periodically, name="descidb-graph-flush", daemon=True
+            )
+            self._timer.start()
+
+    def add_ipfs_node(self, cid: str):
+        """Queue an IPFS node write."""
+        with self._lock:
+            self._nodes.append(cid)
+            self._trim()
+        self._maybe_flush()
+
+    def create_relationship(
+        self, cid1: str, cid2: str, relationship_type: str = "LINKS_TO"
+    ):
+        """Queue a relationship write."""
+        with self._lock:
+            self._relationships.append((cid1, cid2, relationship_type))
+            self._trim()
+        self._maybe_flush()
+
+    def _pending(self) -> int:
+        return len(self._nodes) + len(self._relationships)
+
+    def _trim(self):
+        """Drop the oldest writes, nodes first, beyond max_pending (lock held)."""
+        overflow = self._pending() - self.max_pending
+        if overflow <= 0:
+            return
+        dropped_nodes = min(overflow, len(self._nodes))
+        del self._nodes[:dropped_nodes]
+        del self._relationships[: overflow - dropped_nodes]
+        self._dropped += overflow
+
+    def _maybe_flush(self):
+        with self._lock:
+            now = time.monotonic()
+            due = now >= self._retry_at and (
+                self._pending() >= self.max_size
+                or (
+                    self.max_interval > 0
+                    and now - self._last_flush >= self.max_interval
+                )
+            )
+        if due:
+            self.flush()
+
+    def _flush_periodically(self):
+        while not self._stop.wait(self.max_interval):
+            if time.monotonic() >= self._retry_at:
+                self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write all pending nodes, then all pending relationships.
+
+        Called directly, this always attempts the write; the size and timer
+        triggers wait out the backoff after a failure.
+
+        Returns:
+            False if a write failed and its batch was kept for the next flush
+        """
+        # Serialize flushes so nodes always land before the relationships queued after them
+        with self._flush_lock:
+            with self._lock:
+                nodes, self._nodes = self._nodes, []
+                relationships, self._relationships = self._relationships, []
+                self._last_flush = time.monotonic()
+            if nodes and not self.graph.add_ipfs_nodes(nodes):
+                self._requeue(nodes, relationships)
+                return False
+            if relationships and not self.graph.create_relationships(relationships):
+                self._requeue([], relationships)
+                return False
+            with self._lock:
+                self._failures = 0
+                self._retry_at = 0.0
+                dropped, self._dropped = self._dropped, 0
+            if dropped:
+                logger.error(f"Dropped {dropped} graph writes while retrying")
+            return True
+
+    def _requeue(self, nodes: List[str], relationships: List[Tuple[str, str, str]]):
+        """Put a failed batch back ahead of newer writes and back off before retrying."""
+        with self._lock:
+            self._nodes[:0] = nodes
+            self._relationships[:0] = relationships
+            self._trim()
+            pending = self._pending()
+            dropped, self._dropped = self._dropped, 0
+
+            self._failures += 1
+            delay = min(self.backoff_base * 2 ** (self._failures - 1), self.backoff_max)
+            self._retry_at = time.monotonic() + delay
+        if dropped:
+            logger.error(
+                f"Graph write buffer is full, dropped the {dropped} oldest writes"
+            )
+        logger.warning(
+            f"Graph write failed, keeping {pending} writes for retry in {delay:.0f}s"
+        )
+
+    def close(self):
+        """Flush pending writes and stop the periodic flush thread."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join()
+        if not self.flush():
+            logger.error(
+                f"Closing graph write buffer with {self._pending()} unwritten writes"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -5,19 +5,116 @@ This module provides a PostgresDBManager class for managing PostgreSQL databases
 used to store document metadata and user statistics.
 """
 
+import io
+import json
 import os
 import pickle
-from typing import List, Tuple
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import psycopg2
 from psycopg2 import sql
+from psycopg2.extensions import TRANSACTION_STATUS_UNKNOWN, connection
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
 from descidb.utils.logging_utils import get_logger
 
 # Get module logger
 logger = get_logger(__name__)
 
+DEFAULT_MIN_CONNECTIONS = 1
+DEFAULT_MAX_CONNECTIONS = 10
+# Pooled connections idle for longer than this are pinged before reuse
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+# Rows sent per COPY statement by insert_data
+DEFAULT_INSERT_BATCH_SIZE = 1000
+
+PAPERS_COPY_SQL = """
+    COPY default_schema.papers (author, paper_name, markdown, embedding, metadata, public_key)
+    FROM STDIN WITH (FORMAT csv)
+"""
+
+PaperRecord = Tuple[str, str, str, List[float], dict, str]
+
+# How the papers.embedding column is encoded: pickled NumPy arrays in BYTEA,
+# raw little-endian float32 bytes in BYTEA, or a pgvector vector column
+EMBEDDING_FORMATS = ("pickle", "float32", "vector")
+DEFAULT_EMBEDDING_FORMAT = "float32"
+# Databases without a recorded format predate it and hold pickled arrays
+LEGACY_EMBEDDING_FORMAT = "pickle"
+FLOAT32 = np.dtype("<f4")
+
+# Approximate nearest neighbour indexes pgvector can build on the embedding column
+VECTOR_INDEX_TYPES = ("hnsw", "ivfflat")
+DEFAULT_VECTOR_INDEX = "hnsw"
+# pgvector suggests rows / 1000 IVFFlat lists for tables of up to 1M rows
+IVFFLAT_ROWS_PER_LIST = 1000
+# An HNSW scan returns at most hnsw.ef_search candidates (pgvector default 40,
+# maximum 1000); filtered searches scan this many times k to leave headroom
+DEFAULT_HNSW_EF_SEARCH = 40
+MAX_HNSW_EF_SEARCH = 1000
+FILTERED_EF_SEARCH_FACTOR = 10
+
+
+def encode_embedding(
+    embedding: Union[Sequence[float], np.ndarray], embedding_format: str
+) -> str:
+    """Encode an embedding as the text input of its column type."""
+    if embedding_format == "vector":
+        return "[" + ",".join(repr(float(x)) for x in embedding) + "]"
+    if embedding_format == "float32":
+        data = np.asarray(embedding, dtype=FLOAT32).tobytes()
+    else:
+        data = pickle.dumps(np.array(embedding))
+    # bytea hex input format
+    return "\\x" + data.hex()
+
+
+def decode_embedding(value: Any, embedding_format: str) -> np.ndarray:
+    """
+    Decode an embedding column value read from the papers table.
+
+    float32 values are wrapped with np.frombuffer, without copying; the returned
+    array is read-only.
+
+    Args:
+        value: Column value as returned by psycopg2 (memoryview or str)
+        embedding_format: Format recorded for the database
+
+    Returns:
+        The embedding as a NumPy array
+    """
+    if embedding_format == "float32":
+        return np.frombuffer(value, dtype=FLOAT32)
+    if embedding_format == "vector":
+        if isinstance(value, str):
+            value = json.loads(value)
+        return np.asarray(value, dtype=FLOAT32)
+    return pickle.loads(bytes(value))  # type: ignore[no-any-return]
+
+
+def _csv_field(value: Optional[str]) -> str:
+    """Quote a value for COPY ... CSV; None becomes an unquoted empty field (NULL)."""
+    if value is None:
+        return ""
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _paper_row(record: PaperRecord, embedding_format: str) -> str:
+    """Serialize a papers record as one CSV line for COPY."""
+    author, paper_name, markdown, embedding, metadata, public_key = record
+    fields: List[Optional[Any]] = [author, paper_name, markdown, None, None, public_key]
+    if embedding is not None:
+        fields[3] = encode_embedding(embedding, embedding_format)
+    if metadata is not None:
+        fields[4] = json.dumps(metadata)
+    return ",".join(_csv_field(None if f is None else str(f)) for f in fields) + "\n"
+
 
 class PostgresDBManager:
     """
@@ -25,9 +122,23 @@ class PostgresDBManager:
 
     This class provides methods to create databases, tables, and perform
     database operations related to document processing and user statistics.
+
+    Connections come from a thread-safe pool per database, so calls reuse open
+    connections instead of connecting every time. Callers block while all
+    max_connections of a database are checked out; call close() on shutdown.
     """
 
-    def __init__(self, host=None, port=None, user=None, password=None):
+    def __init__(
+        self,
+        host=None,
+        port=None,
+        user=None,
+        password=None,
+        min_connections: int = DEFAULT_MIN_CONNECTIONS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        embedding_format: str = DEFAULT_EMBEDDING_FORMAT,
+    ):
         """
         Initialize a PostgresDBManager with connection parameters.
 
@@ -36,12 +147,39 @@ class PostgresDBManager:
             port: PostgreSQL server port
             user: PostgreSQL username
             password: PostgreSQL password
+            min_connections: Connections each database pool keeps open
+            max_connections: Upper bound on open connections per database
+            health_check_interval: Seconds a pooled connection may sit idle
+                before it is checked with SELECT 1 on checkout
+            embedding_format: Embedding encoding for new databases, one of
+                "pickle", "float32" or "vector" (needs the pgvector extension;
+                falls back to "float32" where it is not installed)
         """
+        if embedding_format not in EMBEDDING_FORMATS:
+            raise ValueError(f"Unknown embedding format: {embedding_format}")
+
         self.logger = get_logger(__name__ + ".PostgresDBManager")
         self.host = host or os.getenv("POSTGRES_HOST", "localhost")
         self.port = port or os.getenv("POSTGRES_PORT", "5432")
         self.user = user or os.getenv("POSTGRES_USER", "postgres")
         self.password = password or os.getenv("POSTGRES_PASSWORD", "")
+        self.min_connections = min_connections
+        self.max_connections = max(1, max_connections)
+        self.health_check_interval = health_check_interval
+        self.embedding_format = embedding_format
+        # Embedding format of each database, read from its storage_info table
+        self._embedding_formats: Dict[str, str] = {}
+
+        self._pools: Dict[str, ThreadedConnectionPool] = {}
+        # getconn raises when a pool is exhausted; the semaphores make callers wait
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        # When each pool was opened, and when each connection was last returned.
+        # Weak keys drop closed connections and never alias a recycled id().
+        self._pool_opened: Dict[str, float] = {}
+        self._last_used: "weakref.WeakKeyDictionary[connection, float]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pools_lock = threading.Lock()
 
         try:
             # Connect to the default postgres database first
@@ -58,148 +196,662 @@ class PostgresDBManager:
             self.logger.error(f"Error connecting to PostgreSQL: {e}")
             raise
 
-    def _connect(self, dbname: str = "postgres"):
+    def _get_pool(
+        self, dbname: str
+    ) -> Tuple[ThreadedConnectionPool, threading.BoundedSemaphore]:
+        """Return the connection pool of a database, creating it on first use."""
+        with self._pools_lock:
+            if dbname not in self._pools:
+                self._pools[dbname] = ThreadedConnectionPool(
+                    min(self.min_connections, self.max_connections),
+                    self.max_connections,
+                    host=self.host,
+                    port=self.port,
+                    user=self.user,
+                    password=self.password,
+                    dbname=dbname,
+                )
+                self._slots[dbname] = threading.BoundedSemaphore(self.max_connections)
+                self._pool_opened[dbname] = time.monotonic()
+                self.logger.debug(f"Created connection pool for database '{dbname}'")
+            return self._pools[dbname], self._slots[dbname]
+
+    def _is_healthy(self, conn: connection, dbname: str) -> bool:
+        """Check a pooled connection before handing it out."""
+        if conn.closed or conn.info.transaction_status == TRANSACTION_STATUS_UNKNOWN:
+            return False
+        # A connection not yet returned is dated from its pool's creation, the
+        # earliest it can have been opened: min_connections opened with the pool
+        # and left idle are pinged, and one the pool opens later is pinged at most once
+        last_used = self._last_used.setdefault(conn, self._pool_opened.get(dbname, 0.0))
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
         try:
-            conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                dbname=dbname,
-            )
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _getconn(
+        self, dbname: str
+    ) -> Optional[
+        Tuple[connection, ThreadedConnectionPool, threading.BoundedSemaphore]
+    ]:
+        """Check a healthy autocommit connection out of the database's pool."""
+        try:
+            pool, slots = self._get_pool(dbname)
+        except Exception as e:
+            self.logger.error(f"Error connecting to the database: {e}")
+            return None
+
+        slots.acquire()
+        try:
+            conn = pool.getconn()
+            if not self._is_healthy(conn, dbname):
+                self.logger.warning(f"Replacing broken connection to '{dbname}'")
+                self._last_used.pop(conn, None)
+                pool.putconn(conn, close=True)
+                conn = pool.getconn()
+                # The replacement has just been opened
+                self._last_used[conn] = time.monotonic()
             conn.autocommit = True
-            return conn
+            return conn, pool, slots
         except Exception as e:
+            slots.release()
             self.logger.error(f"Error connecting to the database: {e}")
             return None
 
-    def create_databases(self, db_names: List[str]):
-        conn = self._connect()
-        if conn is None:
-            self.logger.error("Unable to connect to the PostgreSQL server.")
+    def _putconn(
+        self,
+        conn: connection,
+        pool: ThreadedConnectionPool,
+        slots: threading.BoundedSemaphore,
+    ) -> None:
+        """Return a connection to its pool, discarding it if it broke."""
+        try:
+            if pool.closed:
+                # close() ran while the connection was checked out
+                conn.close()
+                return
+            broken = bool(conn.closed)
+            if broken:
+                self._last_used.pop(conn, None)
+            else:
+                self._last_used[conn] = time.monotonic()
+            pool.putconn(conn, close=broken)
+        finally:
+            slots.release()
+
+    @contextmanager
+    def _connection(self, dbname: str = "postgres") -> Iterator[Optional[connection]]:
+        """Borrow a pooled connection for the duration of a with block.
+
+        Yields None if no connection could be established.
+        """
+        checkout = self._getconn(dbname)
+        if checkout is None:
+            yield None
             return
 
-        cursor = conn.cursor()
-        for db_name in db_names:
-            try:
-                cursor.execute(
-                    sql.SQL("SELECT 1 FROM pg_database WHERE datname = %s"), [db_name]
-                )
-                exists = cursor.fetchone()
+        conn, pool, slots = checkout
+        try:
+            yield conn
+        finally:
+            self._putconn(conn, pool, slots)
+
+    def close(self) -> None:
+        """Close every pooled connection and the initial server connection."""
+        with self._pools_lock:
+            for pool in self._pools.values():
+                pool.closeall()
+            self._pools.clear()
+            self._slots.clear()
+            self._pool_opened.clear()
+            self._last_used.clear()
+        if not self.conn.closed:
+            self.conn.close()
+        self.logger.info("Closed PostgreSQL connections")
+
+    def create_databases(self, db_names: List[str]):
+        with self._connection() as conn:
+            if conn is None:
+                self.logger.error("Unable to connect to the PostgreSQL server.")
+                return
 
-                if not exists:
+            cursor = conn.cursor()
+            for db_name in db_names:
+                try:
                     cursor.execute(
-                        sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name))
+                        sql.SQL("SELECT 1 FROM pg_database WHERE datname = %s"),
+                        [db_name],
                     )
-                    self.logger.info(f"Database '{db_name}' created successfully.")
+                    exists = cursor.fetchone()
 
-                    self._create_schema_and_table_in_db(db_name)
-                else:
-                    self.logger.info(
-                        f"Database '{db_name}' already exists. Skipping creation."
+                    if not exists:
+                        cursor.execute(
+                            sql.SQL("CREATE DATABASE {}").format(
+                                sql.Identifier(db_name)
+                            )
+                        )
+                        self.logger.info(f"Database '{db_name}' created successfully.")
+
+                        self._create_schema_and_table_in_db(db_name)
+                    else:
+                        self.logger.info(
+                            f"Database '{db_name}' already exists. Skipping creation."
+                        )
+
+                except Exception as e:
+                    self.logger.error(f"Error creating database '{db_name}': {e}")
+
+            cursor.close()
+
+    def _create_schema_and_table_in_db(self, db_name: str):
+        with self._connection(db_name) as conn:
+            if conn is None:
+                self.logger.error(f"Unable to connect to the database '{db_name}'.")
+                return
+
+            cursor = conn.cursor()
+            try:
+                cursor.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS default_schema"))
+                self.logger.info(
+                    f"Schema 'default_schema' created successfully in database '{db_name}'."
+                )
+
+                embedding_format = self.embedding_format
+                if embedding_format == "vector" and not self._create_vector_extension(
+                    cursor
+                ):
+                    embedding_format = "float32"
+
+                cursor.execute(
+                    sql.SQL(
+                        """
+                    CREATE TABLE IF NOT EXISTS default_schema.papers (
+                        author TEXT,
+                        paper_name TEXT,
+                        markdown TEXT,
+                        embedding {},
+                        metadata JSON,
+                        public_key TEXT
                     )
+                """
+                    ).format(sql.SQL(self._embedding_column_type(embedding_format)))
+                )
+                self._set_embedding_format(cursor, db_name, embedding_format)
+                self.logger.info(
+                    f"Table 'papers' created successfully in schema 'default_schema' of database '{db_name}'."
+                )
 
             except Exception as e:
-                self.logger.error(f"Error creating database '{db_name}': {e}")
+                self.logger.error(
+                    f"Error creating schema or table in database '{db_name}': {e}"
+                )
 
-        cursor.close()
-        conn.close()
+            cursor.close()
 
-    def _create_schema_and_table_in_db(self, db_name: str):
-        conn = self._connect(db_name)
-        if conn is None:
-            self.logger.error(f"Unable to connect to the database '{db_name}'.")
-            return
+    @staticmethod
+    def _embedding_column_type(embedding_format: str) -> str:
+        return "vector" if embedding_format == "vector" else "BYTEA"
 
-        cursor = conn.cursor()
+    def _create_vector_extension(self, cursor) -> bool:
+        """Enable pgvector in the current database; False if it is unavailable."""
         try:
-            cursor.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS default_schema"))
-            self.logger.info(
-                f"Schema 'default_schema' created successfully in database '{db_name}'."
-            )
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            return True
+        except psycopg2.Error as e:
+            self.logger.warning(f"pgvector is not available, storing float32: {e}")
+            return False
 
-            cursor.execute(
-                sql.SQL(
-                    """
-                CREATE TABLE IF NOT EXISTS default_schema.papers (
-                    author TEXT,
-                    paper_name TEXT,
-                    markdown TEXT,
-                    embedding BYTEA,
-                    metadata JSON,
-                    public_key TEXT
-                )
+    def _set_embedding_format(self, cursor, db_name: str, embedding_format: str):
+        """Record the embedding format in the database's storage_info table."""
+        cursor.execute(
             """
-                )
-            )
-            self.logger.info(
-                f"Table 'papers' created successfully in schema 'default_schema' of database '{db_name}'."
+            CREATE TABLE IF NOT EXISTS default_schema.storage_info (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
             )
+            """
+        )
+        cursor.execute(
+            """
+            INSERT INTO default_schema.storage_info (key, value)
+            VALUES ('embedding_format', %s)
+            ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value
+            """,
+            (embedding_format,),
+        )
+        self._embedding_formats[db_name] = embedding_format
 
-        except Exception as e:
-            self.logger.error(
-                f"Error creating schema or table in database '{db_name}': {e}"
+    def get_embedding_format(self, db_name: str) -> str:
+        """
+        Return how embeddings are encoded in a database's papers table.
+
+        Args:
+            db_name: Database name
+
+        Returns:
+            "pickle", "float32" or "vector"; "pickle" for databases created
+            before the format was recorded
+        """
+        if db_name in self._embedding_formats:
+            return self._embedding_formats[db_name]
+
+        with self._connection(db_name) as conn:
+            if conn is None:
+                raise ConnectionError(f"Unable to connect to the database '{db_name}'")
+            with conn.cursor() as cursor:
+                return self._read_embedding_format(cursor, db_name)
+
+    def _read_embedding_format(self, cursor, db_name: str) -> str:
+        """get_embedding_format on a connection the caller already holds."""
+        if db_name in self._embedding_formats:
+            return self._embedding_formats[db_name]
+
+        row = None
+        cursor.execute("SELECT to_regclass('default_schema.storage_info')")
+        if cursor.fetchone()[0] is not None:
+            cursor.execute(
+                "SELECT value FROM default_schema.storage_info "
+                "WHERE key = 'embedding_format'"
             )
+            row = cursor.fetchone()
 
-        cursor.close()
-        conn.close()
+        embedding_format = row[0] if row else LEGACY_EMBEDDING_FORMAT
+        self._embedding_formats[db_name] = embedding_format
+        return embedding_format
 
     def insert_data(
-        self, db_name: str, data: List[Tuple[str, str, str, bytes, dict, bool]]
-    ):
-        conn = self._connect(db_name)
-        if conn is None:
-            self.logger.error(
-                f"Unable to connect to the database '{db_name}' for data insertion."
-            )
-            return
+        self,
+        db_name: str,
+        data: List[PaperRecord],
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    ) -> int:
+        """
+        Bulk-load (author, paper_name, markdown, embedding, metadata, public_key)
+        records into default_schema.papers.
 
-        cursor = conn.cursor()
-        try:
-            insert_query = sql.SQL(
-                """
-                    INSERT INTO default_schema.papers (author, paper_name, markdown, embedding, metadata)
-                    VALUES (%s, %s, %s, %s, %s)
-                """
-            )
+        Rows are streamed with COPY ... FROM STDIN in CSV form, one COPY statement
+        per batch; each batch commits on its own.
+
+        Args:
+            db_name: Database to insert into
+            data: Records to insert
+            batch_size: Rows sent per COPY statement
 
-            for record in data:
-                binary_embedding = pickle.dumps(np.array(record[3]))
-                new_record = (
-                    record[0],
-                    record[1],
-                    record[2],
-                    binary_embedding,
-                    record[4],
-                    record[5],
+        Returns:
+            Number of rows inserted; loading stops at the first failed batch
+        """
+        with self._connection(db_name) as conn:
+            if conn is None:
+                self.logger.error(
+                    f"Unable to connect to the database '{db_name}' for data insertion."
                 )
-                cursor.execute(insert_query, new_record)
+                return 0
 
-        except Exception as e:
-            self.logger.error(f"Error inserting data into database '{db_name}': {e}")
+            inserted = 0
+            batch_size = max(1, batch_size)
+            cursor = conn.cursor()
+            try:
+                embedding_format = self._read_embedding_format(cursor, db_name)
+                for start in range(0, len(data), batch_size):
+                    end = start + batch_size
+                    batch = data[start:end]
+                    buffer = io.StringIO(
+                        "".join(_paper_row(r, embedding_format) for r in batch)
+                    )
+                    cursor.copy_expert(PAPERS_COPY_SQL, buffer)
+                    inserted += len(batch)
 
-        cursor.close()
+            except Exception as e:
+                self.logger.error(
+                    f"Error inserting data into database '{db_name}': {e}"
+                )
 
-    def query(self, db_name: str, query_string: str, params: Tuple = ()):
-        conn = self._connect(db_name)
-        if conn is None:
-            self.logger.error(
-                f"Unable to connect to the database '{db_name}' for query execution."
-            )
-            return None
+            cursor.close()
+            self.logger.debug(f"Inserted {inserted} rows into '{db_name}'")
+            return inserted
+
+    def migrate_embeddings(
+        self,
+        db_name: str,
+        embedding_format: Optional[str] = None,
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Re-encode the embeddings of an existing papers table.
+
+        Existing tables hold pickled arrays; this rewrites them as float32 bytes
+        or a pgvector column in a single transaction, so the table either moves
+        to the new format completely or is left unchanged. Run it while nothing
+        else writes to the database.
+
+        Args:
+            db_name: Database to migrate
+            embedding_format: Target format, defaults to the manager's format
+            batch_size: Rows re-encoded per UPDATE statement
+
+        Returns:
+            Dictionary with the source and target formats and the rows migrated
+        """
+        target = embedding_format or self.embedding_format
+        if target not in EMBEDDING_FORMATS:
+            raise ValueError(f"Unknown embedding format: {target}")
+
+        with self._connection(db_name) as conn:
+            if conn is None:
+                raise ConnectionError(f"Unable to connect to the database '{db_name}'")
+            with conn.cursor() as cursor:
+                source = self._read_embedding_format(cursor, db_name)
+            stats: Dict[str, Any] = {"from": source, "to": target, "rows": 0}
+            if source == target:
+                self.logger.info(f"Embeddings in '{db_name}' are already {target}")
+                return stats
+
+            column_type = self._embedding_column_type(target)
+            conn.autocommit = False
+            try:
+                with conn.cursor() as cursor:
+                    if target == "vector":
+                        cursor.execute("CREATE EXTENSION IF NOT EXISTS vector")
+                    cursor.execute(
+                        "ALTER TABLE default_schema.papers "
+                        f"ADD COLUMN embedding_migrated {column_type}"
+                    )
+                    # A server-side cursor keeps memory flat; it reads the table as
+                    # of its declaration, so the updates below do not affect it
+                    with conn.cursor(name="descidb_migrate_embeddings") as reader:
+                        reader.itersize = batch_size
+                        reader.execute(
+                            "SELECT ctid::text, embedding FROM default_schema.papers "
+                            "WHERE embedding IS NOT NULL"
+                        )
+                        while rows := reader.fetchmany(batch_size):
+                            values = [
+                                (
+                                    ctid,
+                                    encode_embedding(
+                                        decode_embedding(value, source), target
+                                    ),
+                                )
+                                for ctid, value in rows
+                            ]
+                            execute_values(
+                                cursor,
+                                f"""
+                                UPDATE default_schema.papers AS p
+                                SET embedding_migrated = v.embedding::{column_type}
+                                FROM (VALUES %s) AS v (ctid, embedding)
+                                WHERE p.ctid = v.ctid::tid
+                                """,
+                                values,
+                                page_size=batch_size,
+                            )
+                            stats["rows"] += len(rows)
+
+                    cursor.execute(
+                        "ALTER TABLE default_schema.papers DROP COLUMN embedding"
+                    )
+                    cursor.execute(
+                        "ALTER TABLE default_schema.papers "
+                        "RENAME COLUMN embedding_migrated TO embedding"
+                    )
+                    self._set_embedding_format(cursor, db_name, target)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                self._embedding_formats.pop(db_name, None)
+                self.logger.error(f"Error migrating embeddings in '{db_name}': {e}")
+                raise
+            finally:
+                conn.autocommit = True
+
+        self.logger.info(
+            f"Migrated {stats['rows']} embeddings in '{db_name}' from {source} to {target}"
+        )
+        return stats
+
+    def create_vector_index(
+        self,
+        db_name: str,
+        dimensions: Optional[int] = None,
+        index_type: str = DEFAULT_VECTOR_INDEX,
+    ) -> bool:
+        """
+        Provision a pgvector column with an ANN index for cosine search.
+
+        Tables in another embedding format are migrated to vector first. The
+        column is then fixed to the given number of dimensions, which indexes
+        require, and an HNSW or IVFFlat index is built on it.
+
+        Args:
+            db_name: Database to index
+            dimensions: Embedding dimensions, inferred from the stored embeddings
+                when omitted (so they are required for empty tables)
+            index_type: "hnsw" or "ivfflat"; IVFFlat lists are sized from the
+                current row count, so build it after loading the data. An
+                existing IVFFlat index the table has outgrown is rebuilt
+
+        Returns:
+            True if the index exists afterwards
+        """
+        if index_type not in VECTOR_INDEX_TYPES:
+            raise ValueError(f"Unknown vector index type: {index_type}")
 
-        cursor = conn.cursor()
         try:
-            cursor.execute(query_string, params)
-            if query_string.strip().lower().startswith("select"):
-                result = cursor.fetchall()
-                return result
-            else:
+            if self.get_embedding_format(db_name) != "vector":
+                self.migrate_embeddings(db_name, "vector")
+        except Exception as e:
+            self.logger.error(f"Unable to store vectors in '{db_name}': {e}")
+            return False
+
+        with self._connection(db_name) as conn:
+            if conn is None:
+                self.logger.error(f"Unable to connect to the database '{db_name}'.")
+                return False
+
+            cursor = conn.cursor()
+            try:
+                if dimensions is None:
+                    cursor.execute(
+                        "SELECT vector_dims(embedding) FROM default_schema.papers "
+                        "WHERE embedding IS NOT NULL LIMIT 1"
+                    )
+                    row = cursor.fetchone()
+                    if row is None:
+                        self.logger.warning(
+                            f"Cannot index '{db_name}': no embeddings to infer dimensions from"
+                        )
+                        return False
+                    dimensions = row[0]
+
+                cursor.execute(
+                    sql.SQL(
+                        "ALTER TABLE default_schema.papers "
+                        "ALTER COLUMN embedding TYPE vector({})"
+                    ).format(sql.Literal(int(dimensions)))
+                )
+
+                index_name = f"papers_embedding_{index_type}_idx"
+                options: sql.Composable = sql.SQL("")
+                if index_type == "ivfflat":
+                    cursor.execute("SELECT count(*) FROM default_schema.papers")
+                    count_row = cursor.fetchone()
+                    rows = count_row[0] if count_row else 0
+                    lists = max(1, rows // IVFFLAT_ROWS_PER_LIST)
+                    options = sql.SQL(" WITH (lists = {})").format(sql.Literal(lists))
+                    # Lists are fixed at build time, so rebuild an outgrown index
+                    built_lists = self._ivfflat_lists(cursor, index_name)
+                    if built_lists is not None and built_lists < lists:
+                        self.logger.info(
+                            f"Rebuilding {index_name} in '{db_name}' with {lists} lists (was {built_lists})"
+                        )
+                        cursor.execute(
+                            sql.SQL("DROP INDEX default_schema.{}").format(
+                                sql.Identifier(index_name)
+                            )
+                        )
+
+                cursor.execute(
+                    sql.SQL(
+                        "CREATE INDEX IF NOT EXISTS {} ON default_schema.papers "
+                        "USING {} (embedding vector_cosine_ops){}"
+                    ).format(
+                        sql.Identifier(index_name),
+                        sql.SQL(index_type),
+                        options,
+                    )
+                )
+                self.logger.info(
+                    f"Created {index_type} index on {dimensions}-dimensional embeddings in '{db_name}'."
+                )
+                return True
+
+            except Exception as e:
+                self.logger.error(f"Error creating vector index in '{db_name}': {e}")
+                return False
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _ivfflat_lists(cursor: Any, index_name: str) -> Optional[int]:
+        """Return the lists an existing IVFFlat index was built with, or None."""
+        cursor.execute(
+            "SELECT reloptions FROM pg_class WHERE oid = to_regclass(%s)",
+            (f"default_schema.{index_name}",),
+        )
+        row = cursor.fetchone()
+        for option in (row[0] if row else None) or []:
+            key, _, value = option.partition("=")
+            if key == "lists":
+                return int(value)
+        return None
+
+    def search(
+        self,
+        db_name: str,
+        query_vector: List[float],
+        k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the k chunks nearest to query_vector by cosine distance.
+
+        The ORDER BY embedding <=> query form lets Postgres use the HNSW or
+        IVFFlat index from create_vector_index. An HNSW scan yields at most
+        hnsw.ef_search candidates, so the search raises it for its own
+        transaction to k, or to FILTERED_EF_SEARCH_FACTOR * k when filters are
+        given, capped at pgvector's maximum of 1000. Filters are applied to
+        the candidates the index returns, so k above 1000 or a filter more
+        selective than that headroom can still yield fewer than k results.
+
+        Args:
+            db_name: Database to search
+            query_vector: Query embedding, from the database's embedder
+            k: Number of results
+            filters: Exact-match conditions on top-level metadata keys
+
+        Returns:
+            List of dicts with author, paper_name, document, metadata, public_key
+            and distance, nearest first
+        """
+        with self._connection(db_name) as conn:
+            if conn is None:
+                self.logger.error(
+                    f"Unable to connect to the database '{db_name}' for search."
+                )
+                return []
+
+            cursor = conn.cursor()
+            try:
+                if self._read_embedding_format(cursor, db_name) != "vector":
+                    self.logger.error(
+                        f"Database '{db_name}' has no vector column; run create_vector_index first."
+                    )
+                    return []
+
+                conditions = [sql.SQL("embedding IS NOT NULL")]
+                params: List[Any] = []
+                for key, value in (filters or {}).items():
+                    conditions.append(sql.SQL("metadata->>%s = %s"))
+                    # ->> returns strings, and JSON text for non-string values
+                    params += [
+                        key,
+                        value if isinstance(value, str) else json.dumps(value),
+                    ]
+
+                ef_search = min(
+                    max(
+                        k * (FILTERED_EF_SEARCH_FACTOR if filters else 1),
+                        DEFAULT_HNSW_EF_SEARCH,
+                    ),
+                    MAX_HNSW_EF_SEARCH,
+                )
+                vector = encode_embedding(query_vector, "vector")
+                # SET LOCAL ends with the transaction, so the pooled connection
+                # keeps the server default
+                conn.autocommit = False
+                cursor.execute(
+                    sql.SQL("SET LOCAL hnsw.ef_search = {}").format(
+                        sql.Literal(ef_search)
+                    )
+                )
+                cursor.execute(
+                    sql.SQL(
+                        """
+                    SELECT author, paper_name, markdown, metadata, public_key,
+                           embedding <=> %s::vector AS distance
+                    FROM default_schema.papers
+                    WHERE {}
+                    ORDER BY embedding <=> %s::vector
+                    LIMIT %s
+                """
+                    ).format(sql.SQL(" AND ").join(conditions)),
+                    [vector, *params, vector, k],
+                )
+                rows = cursor.fetchall()
                 conn.commit()
+                return [
+                    {
+                        "author": author,
+                        "paper_name": paper_name,
+                        "document": markdown,
+                        "metadata": metadata,
+                        "public_key": public_key,
+                        "distance": distance,
+                    }
+                    for author, paper_name, markdown, metadata, public_key, distance in rows
+                ]
+
+            except Exception as e:
+                conn.rollback()
+                self.logger.error(f"Error searching database '{db_name}': {e}")
+                return []
+            finally:
+                conn.autocommit = True
+                cursor.close()
+
+    def query(self, db_name: str, query_string: str, params: Tuple = ()):
+        with self._connection(db_name) as conn:
+            if conn is None:
+                self.logger.error(
+                    f"Unable to connect to the database '{db_name}' for query execution."
+                )
                 return None
-        except Exception as e:
-            self.logger.error(f"Error executing query on database '{db_name}': {e}")
-            return None
-        finally:
-            cursor.close()
-            conn.close()
+
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query_string, params)
+                if query_string.strip().lower().startswith("select"):
+                    result = cursor.fetchall()
+                    return result
+                else:
+                    conn.commit()
+                    return None
+            except Exception as e:
+                self.logger.error(f"Error executing query on database '{db_name}': {e}")
+                return None
+            finally:
+                cursor.close()
@@ -2,8 +2,21 @@
 Query functionality module.
 
 This module provides classes and functions for querying vector databases
-and evaluating search results.
+and evaluating search results. Names are imported from their modules on first use.
 """
 
-from descidb.query.evaluation_agent import EvaluationAgent
-from descidb.query.query_db import query_collection
+from typing import TYPE_CHECKING
+
+from descidb.utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attrs={
+        "descidb.query.evaluation_agent": ["EvaluationAgent"],
+        "descidb.query.query_db": ["invalidate_cache", "query_collection"],
+    },
+)
+
+if TYPE_CHECKING:
+    from descidb.query.evaluation_agent import EvaluationAgent
+    from descidb.query.query_db import invalidate_cache, query_collection
@@ -5,16 +5,24 @@ This module provides an EvaluationAgent class for assessing the quality
 of document processing and query results.
 """
 
+import asyncio
 import json
 import os
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
 from dotenv import load_dotenv
 
-from descidb.query.query_db import query_collection
+from descidb.query.query_db import (
+    embed_query,
+    embedder_for_collection,
+    query_collection,
+)
+from descidb.utils.audit_log import AuditLog, get_audit_log
 from descidb.utils.logging_utils import get_logger
 
 # Get module logger
@@ -29,19 +37,29 @@ class EvaluationAgent:
 
     This class provides functionality to:
     1. Query multiple collections with the same query
-    2. Store results in a temporary JSON file
+    2. Return the results in memory or store them in a temporary JSON file
     3. Evaluate and rank results using LLM agents via OpenRouter
+
+    Query results and evaluations are also recorded to the audit log when one is
+    configured (see descidb.utils.audit_log).
     """
 
-    def __init__(self, model_name: str = "openai/gpt-3.5-turbo"):
+    def __init__(
+        self,
+        model_name: str = "openai/gpt-3.5-turbo",
+        audit_log: Optional[AuditLog] = None,
+    ):
         """
         Initialize the evaluation agent.
 
         Args:
             model_name: Full model name in the format "provider/model"
                        (e.g., "openai/gpt-3.5-turbo", "anthropic/claude-3-opus-20240229")
+            audit_log: Audit sink for results, defaults to the one configured by
+                       DESCIDB_AUDIT_LOG (None if auditing is off)
         """
         self.model_name = model_name
+        self.audit_log = audit_log if audit_log is not None else get_audit_log()
         self.temp_dir = Path(__file__).parents[1].parent / "temp"
         os.makedirs(self.temp_dir, exist_ok=True)
 
@@ -51,38 +69,142 @@ class EvaluationAgent:
             logger.error("OpenRouter API key is not set in environment variables")
             raise ValueError("OpenRouter API key not configured")
 
+    def run_queries(
+        self,
+        query: str,
+        collection_names: List[str],
+        db_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query multiple collections with the same query and return the results.
+
+        The query is embedded once per embedder (collections sharing a name suffix
+        share the vector) and the collections are then queried concurrently.
+
+        Args:
+            query: Natural language query string
+            collection_names: List of collection names to query
+            db_path: Optional path to ChromaDB directory
+            max_workers: Maximum number of collections queried at once, defaults
+                to one thread per collection
+
+        Returns:
+            Dictionary with the query and the results of every collection
+        """
+        query_embeddings = embed_query(query, collection_names)
+
+        results: List[Dict[str, Any]] = []
+        if collection_names:
+            workers = max_workers or len(collection_names)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map keeps the results in collection_names order
+                results = list(
+                    executor.map(
+                        lambda name: self._query_collection(
+                            query, name, db_path, query_embeddings
+                        ),
+                        collection_names,
+                    )
+                )
+
+        return self._collect_results(query, collection_names, results)
+
     def query_collections(
-        self, query: str, collection_names: List[str], db_path: Optional[str] = None
+        self,
+        query: str,
+        collection_names: List[str],
+        db_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> str:
         """
         Query multiple collections with the same query and store results.
 
+        Like run_queries, but the results are written to a JSON file for
+        evaluate_results.
+
         Args:
             query: Natural language query string
             collection_names: List of collection names to query
             db_path: Optional path to ChromaDB directory
+            max_workers: Maximum number of collections queried at once
 
         Returns:
             Path to the temporary JSON file containing all results
         """
-        timestamp = int(time.time())
-        results_file = self.temp_dir / f"query_results_{timestamp}.json"
+        all_results = self.run_queries(query, collection_names, db_path, max_workers)
+        return self._save_results(all_results)
+
+    async def aquery_collections(
+        self, query: str, collection_names: List[str], db_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Query multiple collections without blocking the event loop.
+
+        The async counterpart of query_collections for use from request handlers:
+        the blocking embedding and Chroma calls run in worker threads and the
+        collections are fanned out with asyncio.gather. Nothing is written to disk
+        except the optional audit record, which is queued to a background writer.
+
+        Args:
+            query: Natural language query string
+            collection_names: List of collection names to query
+            db_path: Optional path to ChromaDB directory
+
+        Returns:
+            Dictionary with the query and the results of every collection
+        """
+        query_embeddings = await asyncio.to_thread(embed_query, query, collection_names)
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._query_collection, query, name, db_path, query_embeddings
+                )
+                for name in collection_names
+            )
+        )
+
+        return self._collect_results(query, collection_names, results)
+
+    def _query_collection(
+        self,
+        query: str,
+        collection_name: str,
+        db_path: Optional[str],
+        query_embeddings: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Query one collection with the precomputed embedding of its embedder."""
+        logger.info(f"Querying collection: {collection_name}")
+        embedding = query_embeddings[embedder_for_collection(collection_name)]
+        if isinstance(embedding, Exception):
+            return {"error": str(embedding)}
+        try:
+            result_json = query_collection(
+                collection_name, query, db_path, query_embedding=embedding
+            )
+            return json.loads(result_json)  # type: ignore[no-any-return]
+        except Exception as e:
+            logger.error(f"Error querying collection {collection_name}: {e}")
+            return {"error": str(e)}
 
-        collection_results: Dict[str, Any] = {}
-        all_results: Dict[str, Any] = {
+    def _collect_results(
+        self, query: str, collection_names: List[str], results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        all_results = {
             "query": query,
-            "collection_results": collection_results,
+            "collection_results": dict(zip(collection_names, results)),
         }
+        if self.audit_log is not None:
+            self.audit_log.record("query_results", all_results)
+        return all_results
 
-        for collection_name in collection_names:
-            logger.info(f"Querying collection: {collection_name}")
-            try:
-                result_json = query_collection(collection_name, query, db_path)
-                result_data = json.loads(result_json)
-                collection_results[collection_name] = result_data
-            except Exception as e:
-                logger.error(f"Error querying collection {collection_name}: {e}")
-                collection_results[collection_name] = {"error": str(e)}
+    def _save_results(self, all_results: Dict[str, Any]) -> str:
+        """Write query results to a JSON file in the temp directory."""
+        # The random suffix keeps results of queries in the same second apart
+        timestamp = int(time.time())
+        results_file = (
+            self.temp_dir / f"query_results_{timestamp}_{uuid.uuid4().hex[:8]}.json"
+        )
 
         with open(results_file, "w") as f:
             json.dump(all_results, f, indent=2)
@@ -104,6 +226,27 @@ class EvaluationAgent:
         with open(results_file, "r") as f:
             all_results = json.load(f)
 
+        evaluation = self.evaluate(all_results)
+
+        eval_file = Path(results_file).with_name(
+            f"{Path(results_file).stem}_evaluation.json"
+        )
+        with open(eval_file, "w") as f:
+            json.dump(evaluation, f, indent=2)
+
+        logger.info(f"Saved evaluation to {eval_file}")
+        return evaluation
+
+    def evaluate(self, all_results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluate and rank in-memory query results from different collections.
+
+        Args:
+            all_results: Query results as returned by run_queries
+
+        Returns:
+            Dictionary with evaluation results and rankings
+        """
         original_query = all_results["query"]
         collections = all_results["collection_results"]
 
@@ -152,13 +295,8 @@ class EvaluationAgent:
             logger.error(f"Error evaluating results with model {self.model_name}: {e}")
             evaluation["error"] = str(e)
 
-        eval_file = Path(results_file).with_name(
-            f"{Path(results_file).stem}_evaluation.json"
-        )
-        with open(eval_file, "w") as f:
-            json.dump(evaluation, f, indent=2)
-
-        logger.info(f"Saved evaluation to {eval_file}")
+        if self.audit_log is not None:
+            self.audit_log.record("evaluation", evaluation)
         return evaluation
 
     def _generate_evaluation_prompt(
@@ -7,12 +7,16 @@ language queries and retrieving relevant document chunks.
 
 import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import chromadb
 from dotenv import load_dotenv
 
-from descidb.core.embedder import embed
+from descidb.core.embedder import embed_batch
 from descidb.utils.logging_utils import get_logger
 
 # Get module logger
@@ -20,91 +24,315 @@ logger = get_logger(__name__)
 
 load_dotenv()
 
+# os.pathsep-separated ChromaDB directories accepted from API requests, besides
+# the default one
+DB_PATHS_ENV = "DESCIDB_DB_PATHS"
+# Clients kept open at once; the least recently used one is dropped first
+MAX_CACHED_CLIENTS = 8
+# Upper bound on the number of collections searched concurrently
+SEARCH_MAX_WORKERS = 8
 
-def query_collection(collection_name, user_query, db_path=None):
+# Process-wide registry of clients (by db_path) and collections (by db_path, name)
+_clients: "OrderedDict[str, chromadb.ClientAPI]" = OrderedDict()
+_collections: Dict[Tuple[str, str], chromadb.Collection] = {}
+_registry_lock = threading.Lock()
+
+
+def _resolve_db_path(db_path: Optional[Union[str, Path]]) -> str:
+    """Return the ChromaDB directory to use, defaulting to descidb/database."""
+    if db_path is None:
+        # Get the directory where this module is located and use its database subdirectory
+        module_dir = Path(__file__).parent.parent
+        return str(module_dir / "database")
+    return str(Path(db_path))
+
+
+def configured_db_paths() -> List[str]:
+    """Return the default ChromaDB directory and those listed in DESCIDB_DB_PATHS."""
+    paths = [_resolve_db_path(None)]
+    for path in os.getenv(DB_PATHS_ENV, "").split(os.pathsep):
+        if path:
+            paths.append(_resolve_db_path(path))
+    return paths
+
+
+def check_db_path(db_path: Optional[Union[str, Path]]) -> None:
+    """
+    Reject a ChromaDB directory that is not configured.
+
+    Args:
+        db_path: Requested ChromaDB directory, None for the default one
+
+    Raises:
+        ValueError: If db_path is not one of configured_db_paths()
+    """
+    allowed = {os.path.realpath(path) for path in configured_db_paths()}
+    if os.path.realpath(_resolve_db_path(db_path)) not in allowed:
+        raise ValueError(f"Database path '{db_path}' is not configured")
+
+
+def get_collection(collection_name, db_path=None):
+    """
+    Return a cached handle to a ChromaDB collection.
+
+    The PersistentClient for each db_path is opened once per process and reused,
+    as are collection handles, so repeated queries skip reopening the on-disk
+    store and reloading the index. At most MAX_CACHED_CLIENTS clients are kept;
+    the least recently used one and its collections are dropped first.
+
+    Args:
+        collection_name: Name of the ChromaDB collection
+        db_path: Optional path to ChromaDB directory. If None, uses default path
+
+    Returns:
+        The ChromaDB collection
+    """
+    path = _resolve_db_path(db_path)
+    with _registry_lock:
+        collection = _collections.get((path, collection_name))
+        if collection is not None:
+            _clients.move_to_end(path)
+            return collection
+
+        client = _clients.get(path)
+        if client is None:
+            # Ensure the db_path exists
+            os.makedirs(path, exist_ok=True)
+            client = chromadb.PersistentClient(path=path)
+            _clients[path] = client
+            logger.info(f"Opened ChromaDB client at {path}")
+            while len(_clients) > MAX_CACHED_CLIENTS:
+                evicted, _ = _clients.popitem(last=False)
+                for key in [key for key in _collections if key[0] == evicted]:
+                    del _collections[key]
+        _clients.move_to_end(path)
+
+        collection = client.get_collection(name=f"{collection_name}")
+        _collections[(path, collection_name)] = collection
+        return collection
+
+
+def invalidate_cache(db_path=None, collection_name=None):
+    """
+    Drop cached ChromaDB clients and collection handles.
+
+    Call this after collections are deleted or recreated outside this process.
+
+    Args:
+        db_path: Only drop entries for this ChromaDB directory. If None, drop all
+        collection_name: Only drop this collection's handle, keeping the client
+    """
+    path = _resolve_db_path(db_path) if db_path is not None else None
+    with _registry_lock:
+        for key in list(_collections):
+            if (path is None or key[0] == path) and (
+                collection_name is None or key[1] == collection_name
+            ):
+                del _collections[key]
+        if collection_name is None:
+            for client_path in list(_clients):
+                if path is None or client_path == path:
+                    del _clients[client_path]
+
+
+def embedder_for_collection(collection_name):
+    """
+    Return the embedder type a collection was built with.
+
+    Collections are named "<converter>_<chunker>_<embedder>", so this is the part
+    after the last underscore, or "openai" if the name has no underscore.
+    """
+    parts = collection_name.split("_")
+    if len(parts) > 1:
+        return parts[-1]
+    return "openai"
+
+
+def embed_query(query, collection_names):
+    """
+    Embed a query once for every embedder used by the given collections.
+
+    Args:
+        query: Natural language query string
+        collection_names: Collections that will be queried
+
+    Returns:
+        Dictionary mapping embedder type to the query embedding, or to the
+        exception raised while embedding with it
+    """
+    embeddings: Dict[str, Any] = {}
+    for embedder_type in dict.fromkeys(map(embedder_for_collection, collection_names)):
+        try:
+            embeddings[embedder_type] = embed_batch(
+                embedder_type=embedder_type, texts=[query]
+            )[0]
+        except Exception as e:
+            logger.error(f"Error embedding query with {embedder_type}: {e}")
+            embeddings[embedder_type] = e
+    return embeddings
+
+
+def search_collection(
+    collection_name, query_embedding, k=4, where=None, db_path=None
+) -> List[Dict[str, Any]]:
+    """
+    Return the k chunks of a collection nearest to a query embedding.
+
+    Args:
+        collection_name: Name of the ChromaDB collection to search
+        query_embedding: Embedding of the query
+        k: Number of results to return
+        where: Optional ChromaDB metadata filter, e.g. {"root_cid": "Qm..."}
+        db_path: Optional path to ChromaDB directory. If None, uses default path
+
+    Returns:
+        List of results with id, document, metadata and distance, nearest first
+    """
+    collection = get_collection(collection_name, db_path)
+    values = collection.query(
+        query_embeddings=[query_embedding],
+        n_results=k,
+        where=where or None,
+        include=["metadatas", "documents", "distances"],
+    )
+
+    if not values["ids"]:
+        return []
+
+    ids = values["ids"][0]
+    documents = (values.get("documents") or [[]])[0] or []
+    metadatas = (values.get("metadatas") or [[]])[0] or []
+    distances = (values.get("distances") or [[]])[0] or []
+    return [
+        {
+            "id": doc_id,
+            "document": documents[i] if i < len(documents) else "",
+            "metadata": metadatas[i] if i < len(metadatas) else {},
+            "distance": distances[i] if i < len(distances) else 0,
+        }
+        for i, doc_id in enumerate(ids)
+    ]
+
+
+def query_collection(
+    collection_name,
+    user_query,
+    db_path=None,
+    query_embedding=None,
+    n_results=4,
+    where=None,
+):
     """
     Query a ChromaDB collection with a natural language query.
 
     This function converts the user query to an embedding using the embedder module
     and performs a similarity search in the specified ChromaDB collection.
 
-    If embedder_type is not specified, it will be extracted from the collection name
-    (the part after the last underscore).
+    The embedder type is extracted from the collection name (the part after the
+    last underscore). Callers querying several collections that share an embedder
+    can embed the query once and pass it as query_embedding.
 
     Args:
         collection_name: Name of the ChromaDB collection to query
         user_query: Natural language query string
         db_path: Optional path to ChromaDB directory. If None, uses default path
-        embedder_type: Type of embedder to use (openai, nvidia). If None, extracted from collection_name
+        query_embedding: Optional precomputed embedding of user_query
+        n_results: Number of results to return
+        where: Optional ChromaDB metadata filter
 
     Returns:
         JSON string containing query results with metadata and similarity scores
     """
     try:
-        parts = collection_name.split("_")
-        if len(parts) > 1:
-            embedder_type = parts[-1]
-            logger.info(
-                f"Using embedder type '{embedder_type}' derived from collection name"
-            )
-        else:
-            embedder_type = "openai"
-            logger.info(
-                "Using default embedder type 'openai' as collection name has no underscore"
-            )
-
-        # Use the provided db_path or create a default path
-        if db_path is None:
-            # Get the directory where this module is located and use its database subdirectory
-            module_dir = Path(__file__).parent.parent
-            db_path = module_dir / "database"
-        else:
-            db_path = Path(db_path)
-
-        # Ensure the db_path exists
-        os.makedirs(db_path, exist_ok=True)
-
         logger.info(
             f"Querying collection '{collection_name}' with: '{user_query[:50]}...'"
         )
-        client = chromadb.PersistentClient(path=str(db_path))
-
-        # Get collection
-        collection = client.get_collection(name=f"{collection_name}")
 
-        # Generate embedding using the embedder module with the determined embedder_type
-        embedding = embed(embeder_type=embedder_type, input_text=user_query)
+        if query_embedding is None:
+            embedder_type = embedder_for_collection(collection_name)
+            logger.info(
+                f"Using embedder type '{embedder_type}' derived from collection name"
+            )
+            # Generate embedding using the embedder module with the determined embedder_type
+            query_embedding = embed_batch(
+                embedder_type=embedder_type, texts=[user_query]
+            )[0]
 
-        values = collection.query(
-            query_embeddings=[embedding],
-            n_results=4,
-            include=["metadatas", "documents", "distances"],
+        results = search_collection(
+            collection_name, query_embedding, k=n_results, where=where, db_path=db_path
         )
 
-        result = {"query": user_query, "results": []}
-
-        if values["ids"] and len(values["ids"][0]) > 0:
-            for i in range(len(values["ids"][0])):
-                result["results"].append(
-                    {
-                        "document": values["documents"][0][i]
-                        if i < len(values["documents"][0])
-                        else "",
-                        "metadata": values["metadatas"][0][i]
-                        if i < len(values["metadatas"][0])
-                        else {},
-                        "distance": values["distances"][0][i]
-                        if i < len(values["distances"][0])
-                        else 0,
-                    }
-                )
-
-            logger.info(f"Found {len(result['results'])} results for query")
-            return json.dumps(result)
+        if results:
+            logger.info(f"Found {len(results)} results for query")
         else:
             logger.warning(f"No results found for query: '{user_query[:50]}...'")
-            return json.dumps({"query": user_query, "results": []})
+        return json.dumps({"query": user_query, "results": results})
 
     except Exception as e:
         logger.error(f"Error querying collection: {e}")
+        # The cached handle may be stale, fetch it again on the next call
+        invalidate_cache(db_path, collection_name)
         return json.dumps({"error": str(e)})
+
+
+def search_collections(query, collection_names, k=10, where=None, db_path=None):
+    """
+    Retrieve the k chunks nearest to a query across several collections.
+
+    The query is embedded once per embedder and the collections are searched
+    concurrently, up to SEARCH_MAX_WORKERS at a time, through the cached clients.
+    Distances are only comparable between collections that share an embedder,
+    so results are ranked by distance within each embedder and the rankings are
+    interleaved: every embedder's best result comes before any second best.
+
+    Args:
+        query: Natural language query string
+        collection_names: Collections to search
+        k: Number of results to return in total
+        where: Optional ChromaDB metadata filter applied to every collection
+        db_path: Optional path to ChromaDB directory. If None, uses default path
+
+    Returns:
+        Dictionary with the query, the merged results (each tagged with its
+        collection, nearest first) and an error message per failed collection
+    """
+    query_embeddings = embed_query(query, collection_names)
+
+    def search(collection_name):
+        embedding = query_embeddings[embedder_for_collection(collection_name)]
+        if isinstance(embedding, Exception):
+            raise embedding
+        return search_collection(collection_name, embedding, k, where, db_path)
+
+    results: List[Dict[str, Any]] = []
+    errors: Dict[str, str] = {}
+    if collection_names:
+        workers = min(len(collection_names), SEARCH_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(search, name) for name in collection_names}
+            for collection_name, future in futures.items():
+                try:
+                    for result in future.result():
+                        results.append({"collection": collection_name, **result})
+                except Exception as e:
+                    logger.error(f"Error searching collection {collection_name}: {e}")
+                    invalidate_cache(db_path, collection_name)
+                    errors[collection_name] = str(e)
+
+    ranked = _rank_per_embedder(results)
+    return {"query": query, "results": ranked[:k], "errors": errors}
+
+
+def _rank_per_embedder(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Order results by their distance rank within their embedder."""
+    by_embedder: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        embedder = embedder_for_collection(result["collection"])
+        by_embedder.setdefault(embedder, []).append(result)
+
+    ranked: List[Tuple[Tuple[int, int], Dict[str, Any]]] = []
+    for order, group in enumerate(by_embedder.values()):
+        group.sort(key=lambda result: result["distance"])
+        ranked.extend(((rank, order), result) for rank, result in enumerate(group))
+    ranked.sort(key=lambda item: item[0])
+    return [result for _, result in ranked]
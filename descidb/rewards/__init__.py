@@ -2,6 +2,16 @@
 Reward system module.
 
 This module provides classes and functions for token rewards based on user contributions.
+TokenRewarder (and web3) is imported on first use.
 """
 
-from descidb.rewards.token_rewarder import TokenRewarder
+from typing import TYPE_CHECKING
+
+from descidb.utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__, attrs={"descidb.rewards.token_rewarder": ["TokenRewarder"]}
+)
+
+if TYPE_CHECKING:
+    from descidb.rewards.token_rewarder import TokenRewarder
@@ -1,14 +1,15 @@
 # Create new file: descidb/server/app.py
 from fastapi import FastAPI, HTTPException, Depends
 from pydantic import BaseModel, Field
-from typing import List, Optional
-import json
+from typing import Any, Dict, List, Optional
+import asyncio
 import os
 import sys
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import your entry points
 from descidb.query.evaluation_agent import EvaluationAgent
+from descidb.query.query_db import check_db_path, search_collections
 
 # Setup FastAPI app
 app = FastAPI(
@@ -26,6 +27,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 # Define request/response models
 class EvaluationRequest(BaseModel):
     query: str
@@ -33,23 +35,57 @@ class EvaluationRequest(BaseModel):
     db_path: Optional[str] = None
     model_name: str = "openai/gpt-3.5-turbo"
 
+
+class SearchRequest(BaseModel):
+    query: str
+    collections: List[str] = Field(..., min_length=1)
+    k: int = Field(10, ge=1, le=100)
+    where: Optional[Dict[str, Any]] = None
+    db_path: Optional[str] = None
+
+
+def _check_db_path(db_path: Optional[str]):
+    """Only configured ChromaDB directories (see DESCIDB_DB_PATHS) may be opened"""
+    try:
+        check_db_path(db_path)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/search")
+async def search_endpoint(request: SearchRequest):
+    """Plain retrieval: the k nearest chunks across collections, with distances"""
+    _check_db_path(request.db_path)
+    try:
+        # Uses the process-wide Chroma clients; runs in a worker thread so the
+        # event loop keeps serving other requests
+        return await asyncio.to_thread(
+            search_collections,
+            query=request.query,
+            collection_names=request.collections,
+            k=request.k,
+            where=request.where,
+            db_path=request.db_path,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/api/evaluate")
 async def evaluate_endpoint(request: EvaluationRequest):
     """Endpoint for evaluation (maps to run_evaluation.sh)"""
+    _check_db_path(request.db_path)
     try:
         # Initialize evaluation agent
         agent = EvaluationAgent(model_name=request.model_name)
-        # Run query on collections
-        results_file = agent.query_collections(
+        # Run query on collections; the blocking embedding and Chroma calls run in
+        # worker threads so the event loop keeps serving other requests
+        results = await agent.aquery_collections(
             query=request.query,
             collection_names=request.collections,
             db_path=request.db_path,
         )
-        
-        # Read the results from the JSON file
-        with open(results_file, 'r') as f:
-            results = json.load(f)
-        
+
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -9,4 +9,7 @@ EmbedderType = Literal["openai", "nvidia", "bge"]
 Embedding = List[float] 
 
 # Function type for all embedder implementations
-EmbedderFunc = Callable[[str], Embedding]
\ No newline at end of file
+EmbedderFunc = Callable[[str], Embedding]
+
+# Function type for all batch embedder implementations (texts, batch_size=None)
+EmbedderBatchFunc = Callable[..., List[Embedding]]
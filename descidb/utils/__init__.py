@@ -2,12 +2,45 @@
 Utility functions module.
 
 This module provides various utility functions for file handling, logging, and more.
+Names are imported from their modules on first use.
 """
 
-from descidb.utils.logging_utils import get_logger
-from descidb.utils.utils import (
-    compress,
-    download_from_url,
-    extract,
-    upload_to_lighthouse,
+from typing import TYPE_CHECKING
+
+from descidb.utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attrs={
+        "descidb.utils.audit_log": ["AuditLog", "get_audit_log"],
+        "descidb.utils.cid": ["compute_cid", "is_single_block"],
+        "descidb.utils.git_commit_batcher": ["GitCommitBatcher"],
+        "descidb.utils.http_client": ["get_session"],
+        "descidb.utils.ipfs_blob_store": ["IPFSBlobStore", "get_blob_store"],
+        "descidb.utils.logging_utils": ["get_logger"],
+        "descidb.utils.metadata_index": ["MetadataIndex"],
+        "descidb.utils.upload_queue": ["UploadQueue"],
+        "descidb.utils.utils": [
+            "compress",
+            "download_from_url",
+            "extract",
+            "upload_to_lighthouse",
+        ],
+    },
 )
+
+if TYPE_CHECKING:
+    from descidb.utils.audit_log import AuditLog, get_audit_log
+    from descidb.utils.cid import compute_cid, is_single_block
+    from descidb.utils.git_commit_batcher import GitCommitBatcher
+    from descidb.utils.http_client import get_session
+    from descidb.utils.ipfs_blob_store import IPFSBlobStore, get_blob_store
+    from descidb.utils.logging_utils import get_logger
+    from descidb.utils.metadata_index import MetadataIndex
+    from descidb.utils.upload_queue import UploadQueue
+    from descidb.utils.utils import (
+        compress,
+        download_from_url,
+        extract,
+        upload_to_lighthouse,
+    )
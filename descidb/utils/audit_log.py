@@ -0,0 +1,113 @@
+"""
+Audit log for DeSciDB.
+
+This module provides an AuditLog that appends JSON records (one per line) to a
+size-rotated file. Records are handed to a background thread through a queue,
+so recording never blocks the caller on disk I/O. Auditing is opt-in.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from descidb.utils.logging_utils import get_logger
+
+# Get module logger
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 10 * 1024**2
+DEFAULT_BACKUP_COUNT = 5
+
+# Values of DESCIDB_AUDIT_LOG that leave auditing off
+_DISABLED_VALUES = {"", "0", "off", "false", "none"}
+
+
+class AuditLog:
+    """
+    Asynchronous, size-rotated JSON-lines audit sink.
+
+    Once the file exceeds max_bytes it is rotated to <path>.1 ... <path>.N and
+    the oldest file beyond backup_count is deleted, so disk usage stays bounded.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ):
+        """
+        Open the audit log and start its writer thread.
+
+        Args:
+            path: Path of the audit log file
+            max_bytes: Size at which the file is rotated
+            backup_count: Number of rotated files kept
+        """
+        self.path = Path(path)
+        os.makedirs(self.path.parent, exist_ok=True)
+
+        file_handler = RotatingFileHandler(
+            str(self.path), maxBytes=max_bytes, backupCount=backup_count
+        )
+        file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        records: queue.Queue = queue.Queue()
+        self._listener = QueueListener(records, file_handler)
+        self._file_handler = file_handler
+
+        # A private logger so audit records never reach the console handlers
+        self._logger = logging.getLogger(f"{__name__}.{id(self)}")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(QueueHandler(records))
+        self._listener.start()
+
+    def record(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Queue one audit record; it is written by the background thread."""
+        entry = {"type": event_type, "timestamp": time.time(), **data}
+        self._logger.info(json.dumps(entry, default=str))
+
+    def close(self) -> None:
+        """Write all queued records and close the file."""
+        self._listener.stop()
+        self._file_handler.close()
+        self._logger.handlers.clear()
+
+
+_audit_log: Optional[AuditLog] = None
+_audit_log_lock = threading.Lock()
+
+
+def get_audit_log() -> Optional[AuditLog]:
+    """
+    Return the process-wide audit log, or None if auditing is disabled.
+
+    Enabled by pointing DESCIDB_AUDIT_LOG at a file; rotation is configured by
+    DESCIDB_AUDIT_LOG_MAX_BYTES and DESCIDB_AUDIT_LOG_BACKUPS.
+    """
+    global _audit_log
+
+    setting = os.getenv("DESCIDB_AUDIT_LOG", "")
+    if setting.strip().lower() in _DISABLED_VALUES:
+        return None
+
+    with _audit_log_lock:
+        if _audit_log is None or _audit_log.path != Path(setting):
+            if _audit_log is not None:
+                _audit_log.close()
+            max_bytes = int(os.getenv("DESCIDB_AUDIT_LOG_MAX_BYTES", DEFAULT_MAX_BYTES))
+            backup_count = int(
+                os.getenv("DESCIDB_AUDIT_LOG_BACKUPS", DEFAULT_BACKUP_COUNT)
+            )
+            _audit_log = AuditLog(
+                setting, max_bytes=max_bytes, backup_count=backup_count
+            )
+            logger.info(f"Writing audit records to {setting}")
+        return _audit_log
@@ -0,0 +1,30 @@
+"""
+Local IPFS CID computation for DeSciDB.
+
+This module computes CIDv1 identifiers (raw codec, sha2-256 multihash, base32
+multibase) for byte strings, matching what an IPFS node reports for a file that
+fits in a single block when added with cid-version=1 and raw-leaves=true.
+"""
+
+import base64
+import hashlib
+
+# Largest file that IPFS stores as a single raw block with the default chunker
+MAX_SINGLE_BLOCK_SIZE = 256 * 1024
+
+_CID_VERSION_1 = b"\x01"
+_RAW_CODEC = b"\x55"
+_SHA2_256 = b"\x12\x20"  # multihash code and digest length
+
+
+def compute_cid(data: bytes) -> str:
+    """Return the CIDv1 (raw, sha2-256) of data as a base32 string ("bafkrei...")."""
+    digest = hashlib.sha256(data).digest()
+    cid_bytes = _CID_VERSION_1 + _RAW_CODEC + _SHA2_256 + digest
+    encoded = base64.b32encode(cid_bytes).decode("ascii").lower().rstrip("=")
+    return "b" + encoded
+
+
+def is_single_block(data: bytes) -> bool:
+    """Return True if an IPFS add of data yields the raw-block CID from compute_cid."""
+    return len(data) <= MAX_SINGLE_BLOCK_SIZE
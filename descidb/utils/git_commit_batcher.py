@@ -0,0 +1,188 @@
+"""
+Batched git commits of CID files for DeSciDB.
+
+This module provides a GitCommitBatcher that stages many CID files with a single
+`git add` and records them in a single commit, instead of spawning an add and a
+commit per object. Every CID still gets an "Added IPFS CID: <cid>" line in the
+commit that introduces its file, so `git log --grep` and `git log -- <cid>.txt`
+find the same provenance as with one commit per CID.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from descidb.utils.logging_utils import get_logger
+
+# Get module logger
+logger = get_logger(__name__)
+
+
+def commit_message(cids: List[str]) -> str:
+    """Return the commit message recording the given CIDs."""
+    if len(cids) == 1:
+        return f"Added IPFS CID: {cids[0]}"
+    lines = [f"Added IPFS CID: {cid}" for cid in cids]
+    return f"Added {len(cids)} IPFS CIDs\n\n" + "\n".join(lines)
+
+
+class GitCommitBatcher:
+    """
+    Buffers CID files and commits them to their git repositories in batches.
+
+    Pending files are committed once max_files are pending or max_interval seconds
+    have passed since the last commit. With max_files=1 every CID gets its own
+    commit, as before batching existed. Files that no longer exist are dropped
+    before staging, since git rejects their pathspecs. Files whose commit fails go
+    back to the front of the pending list and are retried by the next flush; after
+    max_attempts consecutive failures in a repository its pending files are
+    dropped, so one bad batch cannot block the repository for the rest of the run.
+    The batcher is thread-safe so concurrent chunk workers can share it.
+    """
+
+    def __init__(
+        self, max_files: int = 1, max_interval: float = 0.0, max_attempts: int = 3
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_files: Number of pending files that triggers a commit
+            max_interval: Seconds after which pending files are committed, 0 disables
+                the periodic commit
+            max_attempts: Consecutive failed commits to a repository before its
+                pending files are dropped
+        """
+        self.max_files = max(1, int(max_files))
+        self.max_interval = max_interval
+        self.max_attempts = max(1, int(max_attempts))
+        self.commits = 0
+        self._pending: Dict[str, List[Tuple[str, str]]] = {}
+        self._failures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_flush = time.monotonic()
+        self._timer: Optional[threading.Thread] = None
+        if max_interval > 0:
+            self._timer = threading.Thread(
+                target=self._flush_periodically, name="descidb-git-commit", daemon=True
+            )
+            self._timer.start()
+
+    def add(self, git_path: str, file_path: str, cid: str) -> None:
+        """Queue a CID file, already written inside git_path, for committing."""
+        if not os.path.isfile(file_path):
+            logger.error(f"Not committing CID {cid}: {file_path} does not exist")
+            return
+        with self._lock:
+            self._pending.setdefault(git_path, []).append((file_path, cid))
+        self._maybe_flush()
+
+    def _pending_count(self) -> int:
+        return sum(len(files) for files in self._pending.values())
+
+    def _maybe_flush(self) -> None:
+        with self._lock:
+            due = self._pending_count() >= self.max_files or (
+                self.max_interval > 0
+                and time.monotonic() - self._last_flush >= self.max_interval
+            )
+        if due:
+            self.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.max_interval):
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Commit all pending files, one commit per repository.
+
+        Returns:
+            False if a commit failed; its files are kept for the next flush unless
+            the repository has now failed max_attempts times in a row
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._last_flush = time.monotonic()
+            ok = True
+            for git_path, files in pending.items():
+                if self._commit(git_path, files):
+                    self._failures.pop(git_path, None)
+                    continue
+                ok = False
+                failures = self._failures.get(git_path, 0) + 1
+                if failures >= self.max_attempts:
+                    self._failures.pop(git_path, None)
+                    logger.error(
+                        f"Dropping {len(files)} CID(s) for {git_path} after "
+                        f"{failures} failed commits: {[cid for _, cid in files]}"
+                    )
+                    continue
+                self._failures[git_path] = failures
+                with self._lock:
+                    # Keep them ahead of files queued during the commit
+                    queued = self._pending.get(git_path, [])
+                    self._pending[git_path] = files + queued
+            return ok
+
+    def _commit(self, git_path: str, files: List[Tuple[str, str]]) -> bool:
+        # git add fails the whole batch on a pathspec that matches nothing
+        missing = [cid for file_path, cid in files if not os.path.isfile(file_path)]
+        if missing:
+            logger.error(
+                f"Dropping CID(s) whose files are missing from {git_path}: {missing}"
+            )
+            files = [(path, cid) for path, cid in files if cid not in missing]
+            if not files:
+                return True
+
+        paths = [os.path.relpath(file_path, git_path) for file_path, _ in files]
+        cids = [cid for _, cid in files]
+        try:
+            # Paths go through stdin so large batches never hit the argv limit
+            subprocess.run(
+                [
+                    "git",
+                    "-C",
+                    git_path,
+                    "add",
+                    "--pathspec-from-file=-",
+                    "--pathspec-file-nul",
+                ],
+                input="\0".join(paths).encode("utf-8"),
+                check=True,
+            )
+            subprocess.run(
+                ["git", "-C", git_path, "commit", "-q", "-F", "-"],
+                input=commit_message(cids).encode("utf-8"),
+                check=True,
+            )
+            self.commits += 1
+            logger.info(f"Committed {len(cids)} IPFS CID(s) to {git_path}")
+            return True
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.error(f"Error committing {len(cids)} CID(s) to {git_path}: {e}")
+            return False
+
+    def close(self) -> None:
+        """Commit pending files and stop the periodic commit thread."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join()
+        if not self.flush():
+            with self._lock:
+                pending = self._pending_count()
+            logger.error(
+                f"Closing git commit batcher with {pending} uncommitted CID(s)"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
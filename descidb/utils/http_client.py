@@ -0,0 +1,122 @@
+"""
+Shared HTTP client for DeSciDB.
+
+This module provides a process-wide requests.Session with keep-alive connection
+pooling, default timeouts and retries with exponential backoff, so repeated
+Lighthouse uploads and gateway reads reuse TCP/TLS connections instead of paying
+for a new handshake on every call.
+"""
+
+import os
+import threading
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from descidb.utils.logging_utils import get_logger
+
+# Get module logger
+logger = get_logger(__name__)
+
+DEFAULT_POOL_SIZE = 32
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+
+# Transient statuses worth retrying; IPFS adds are content-addressed, so
+# retrying a POST cannot create a duplicate object
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests that set none."""
+
+    def __init__(self, *args, timeout: Optional[Timeout] = None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retries: int = DEFAULT_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    timeout: Optional[Timeout] = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_TIMEOUT),
+) -> requests.Session:
+    """
+    Create a pooled session that retries transient failures.
+
+    Args:
+        pool_size: Maximum number of kept-alive connections per host
+        retries: Retries for connection errors and transient HTTP statuses
+        backoff_factor: Base of the exponential backoff between retries, in seconds
+        timeout: Default (connect, read) timeout for requests that set none
+
+    Returns:
+        A configured requests.Session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+        timeout=timeout,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide pooled HTTP session.
+
+    Configured by DESCIDB_HTTP_POOL_SIZE, DESCIDB_HTTP_RETRIES and
+    DESCIDB_HTTP_TIMEOUT (read timeout in seconds).
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            pool_size = int(os.getenv("DESCIDB_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE))
+            retries = int(os.getenv("DESCIDB_HTTP_RETRIES", DEFAULT_RETRIES))
+            read_timeout = float(os.getenv("DESCIDB_HTTP_TIMEOUT", DEFAULT_TIMEOUT))
+            _session = create_session(
+                pool_size=pool_size,
+                retries=retries,
+                timeout=(DEFAULT_CONNECT_TIMEOUT, read_timeout),
+            )
+            logger.debug(
+                f"Created HTTP session (pool_size={pool_size}, retries={retries})"
+            )
+        return _session
+
+
+def close_session() -> None:
+    """Close the process-wide session and its pooled connections."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
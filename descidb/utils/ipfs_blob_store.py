@@ -0,0 +1,188 @@
+"""
+Local IPFS blob cache for DeSciDB.
+
+This module provides an IPFSBlobStore that keeps a size-bounded, content-addressed
+copy of IPFS objects on disk in front of the Lighthouse gateway. IPFS content is
+immutable, so a cached blob never needs revalidation.
+"""
+
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from descidb.utils.http_client import get_session
+from descidb.utils.logging_utils import get_logger
+
+# Get module logger
+logger = get_logger(__name__)
+
+DEFAULT_GATEWAY_URL = "https://gateway.lighthouse.storage/ipfs"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "descidb" / "ipfs"
+DEFAULT_MAX_BYTES = 1024**3
+
+# Values of DESCIDB_IPFS_CACHE_DIR that turn on-disk caching off
+_DISABLED_VALUES = {"", "0", "off", "false", "none"}
+
+_CID_PATTERN = re.compile(r"^[A-Za-z0-9]+$")
+
+
+class IPFSBlobStore:
+    """
+    Read-through disk cache of IPFS objects keyed by CID.
+
+    On a miss the object is fetched from the configured gateway (Lighthouse by
+    default, or a local stand-in gateway for offline testing) and stored under its
+    CID. Once the cache exceeds max_bytes the least recently read blobs are evicted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        gateway_url: str = DEFAULT_GATEWAY_URL,
+    ):
+        """
+        Initialize the blob store.
+
+        Args:
+            cache_dir: Directory holding cached blobs, or None to disable caching
+            max_bytes: Maximum total size of cached blobs
+            gateway_url: Base URL of the IPFS gateway, CIDs are appended to it
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_bytes = max_bytes
+        self.gateway_url = gateway_url.rstrip("/")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._size = 0
+
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._size = sum(
+                entry.stat().st_size for entry in os.scandir(self.cache_dir)
+            )
+
+    def url_for(self, cid: str) -> str:
+        """Return the gateway URL of a CID."""
+        return f"{self.gateway_url}/{cid}"
+
+    def _path(self, cid: str) -> Optional[Path]:
+        if self.cache_dir is None or not _CID_PATTERN.match(cid):
+            return None
+        return self.cache_dir / cid
+
+    def get(self, cid: str) -> bytes:
+        """
+        Return the bytes of an IPFS object, fetching it from the gateway on a miss.
+
+        Raises:
+            requests.exceptions.RequestException: If the gateway fetch fails
+        """
+        path = self._path(cid)
+        if path is not None:
+            try:
+                data = path.read_bytes()
+                # Reads refresh the mtime, which orders LRU eviction
+                os.utime(path)
+                with self._lock:
+                    self.hits += 1
+                return data
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                # An unreadable cache entry is treated as a miss
+                logger.warning(f"Failed to read cached IPFS object {cid}: {e}")
+
+        with self._lock:
+            self.misses += 1
+
+        response = get_session().get(self.url_for(cid))
+        response.raise_for_status()
+        data = response.content
+
+        self.put(cid, data)
+        return data
+
+    def get_text(self, cid: str) -> str:
+        """Return an IPFS object decoded as UTF-8 text."""
+        return self.get(cid).decode("utf-8", errors="replace")
+
+    def put(self, cid: str, data: bytes) -> None:
+        """Store the bytes of an IPFS object under its CID."""
+        path = self._path(cid)
+        if path is None or path.exists():
+            return
+
+        # Write to a temp file first so readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache IPFS object {cid}: {e}")
+            Path(tmp_path).unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently read blobs until the cache fits in max_bytes."""
+        entries = sorted(
+            (entry for entry in os.scandir(self.cache_dir) if entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        self._size = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._size -= size
+            except FileNotFoundError:
+                continue
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current cache size in bytes."""
+        return {"hits": self.hits, "misses": self.misses, "bytes": self._size}
+
+
+_store: Optional[IPFSBlobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_blob_store() -> IPFSBlobStore:
+    """
+    Return the process-wide IPFS blob store.
+
+    Configured by DESCIDB_IPFS_CACHE_DIR (set it to "off" to disable caching),
+    DESCIDB_IPFS_CACHE_MAX_BYTES and DESCIDB_IPFS_GATEWAY.
+    """
+    global _store
+
+    cache_setting = os.getenv("DESCIDB_IPFS_CACHE_DIR", str(DEFAULT_CACHE_DIR))
+    cache_dir = (
+        None if cache_setting.strip().lower() in _DISABLED_VALUES else cache_setting
+    )
+    gateway_url = os.getenv("DESCIDB_IPFS_GATEWAY", DEFAULT_GATEWAY_URL)
+    max_bytes = int(os.getenv("DESCIDB_IPFS_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+    with _store_lock:
+        if (
+            _store is None
+            or _store.cache_dir != (Path(cache_dir) if cache_dir else None)
+            or _store.gateway_url != gateway_url.rstrip("/")
+            or _store.max_bytes != max_bytes
+        ):
+            _store = IPFSBlobStore(
+                cache_dir=cache_dir, max_bytes=max_bytes, gateway_url=gateway_url
+            )
+        return _store
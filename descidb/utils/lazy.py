@@ -0,0 +1,55 @@
+"""
+Lazy attribute loading for DeSciDB packages.
+
+This module provides a PEP 562 helper that lets a package re-export names from
+its submodules without importing them up front, so importing one lightweight
+module (e.g. descidb.core.chunker) does not pull in marker, torch, chromadb or
+the other heavy dependencies of its siblings.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def attach(
+    package_name: str,
+    submodules: Iterable[str] = (),
+    attrs: Optional[Dict[str, List[str]]] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Build lazy __getattr__, __dir__ and __all__ for a package.
+
+    Usage in a package __init__:
+        __getattr__, __dir__, __all__ = attach(__name__, submodules, attrs)
+
+    Args:
+        package_name: __name__ of the package
+        submodules: Submodule names exposed as attributes (e.g. "core")
+        attrs: Mapping of module name to the names re-exported from it
+
+    Returns:
+        The package's __getattr__, __dir__ and __all__
+    """
+    submodule_names = set(submodules)
+    attr_to_module = {
+        name: module for module, names in (attrs or {}).items() for name in names
+    }
+    __all__ = sorted(submodule_names | attr_to_module.keys())
+
+    def __getattr__(name: str) -> Any:
+        if name in submodule_names:
+            value = importlib.import_module(f"{package_name}.{name}")
+        elif name in attr_to_module:
+            value = getattr(importlib.import_module(attr_to_module[name]), name)
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        # Cache on the package so __getattr__ only runs once per name
+        setattr(importlib.import_module(package_name), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        # Names already bound on the package plus those that load lazily
+        return sorted(set(vars(sys.modules[package_name])) | set(__all__))
+
+    return __getattr__, __dir__, __all__
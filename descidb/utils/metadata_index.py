@@ -0,0 +1,146 @@
+"""
+Indexed lookup into JSON-lines metadata files for DeSciDB.
+
+This module provides a MetadataIndex that maps each record's "id" to its byte
+offset in a metadata file such as the arXiv metadata dump. The offsets are kept
+in SQLite, so a lookup is a single indexed query plus one seek, memory use does
+not grow with the file, and the index survives restarts. The index is rebuilt
+whenever the metadata file's size or modification time changes.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from descidb.utils.logging_utils import get_logger
+
+# Get module logger
+logger = get_logger(__name__)
+
+# Fast path for lines that start with the id, as in the arXiv dump
+_LEADING_ID = re.compile(rb'^\s*\{\s*"id"\s*:\s*"([^"\\]*)"')
+
+
+def _record_id(line: bytes) -> Optional[str]:
+    """Return the "id" of a JSON line, or None if it has none or is invalid."""
+    match = _LEADING_ID.match(line)
+    if match:
+        return match.group(1).decode("utf-8")
+    try:
+        record_id = json.loads(line).get("id")
+    except (ValueError, AttributeError):
+        return None
+    return record_id if isinstance(record_id, str) else None
+
+
+class MetadataIndex:
+    """
+    id -> byte offset table for a JSON-lines metadata file.
+
+    When an id occurs more than once the first record wins, matching a linear
+    scan of the file.
+    """
+
+    def __init__(self, metadata_file: Union[str, Path], index_file: Union[str, Path]):
+        """
+        Open (or create) the index; it is built on the first lookup.
+
+        Args:
+            metadata_file: Path to the JSON-lines metadata file
+            index_file: Path of the SQLite file holding the offsets
+        """
+        self.metadata_file = Path(metadata_file)
+        self.index_file = Path(index_file)
+        os.makedirs(self.index_file.parent, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.index_file), check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS offsets (
+                id TEXT PRIMARY KEY,
+                offset INTEGER NOT NULL
+            )
+            """
+        )
+        # Identifies the version of the metadata file the offsets belong to
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS source (
+                path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def _signature(self) -> Tuple[str, int, int]:
+        stat = os.stat(self.metadata_file)
+        return str(self.metadata_file.resolve()), stat.st_size, stat.st_mtime_ns
+
+    def _scan(self) -> Iterator[Tuple[str, int]]:
+        """Yield (id, offset) for every record of the metadata file."""
+        with open(self.metadata_file, "rb") as file:
+            offset = 0
+            for line in file:
+                record_id = _record_id(line)
+                if record_id is not None:
+                    yield record_id, offset
+                offset += len(line)
+
+    def _ensure_current(self) -> None:
+        """Rebuild the index if it was built for another version of the file."""
+        signature = self._signature()
+        if self.conn.execute("SELECT * FROM source").fetchone() == signature:
+            return
+
+        logger.info(f"Building metadata index for {self.metadata_file}")
+        with self.conn:
+            self.conn.execute("DELETE FROM offsets")
+            self.conn.execute("DELETE FROM source")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO offsets (id, offset) VALUES (?, ?)",
+                self._scan(),
+            )
+            self.conn.execute("INSERT INTO source VALUES (?, ?, ?)", signature)
+        count = self.conn.execute("SELECT COUNT(*) FROM offsets").fetchone()[0]
+        logger.info(f"Indexed {count} metadata records")
+
+    def get(self, doc_id: str) -> Dict[str, Any]:
+        """
+        Return the metadata record for doc_id.
+
+        Args:
+            doc_id: Value of the record's "id" field
+
+        Returns:
+            The parsed record, or an empty dict if the id is not in the file or
+            its line is not valid JSON
+        """
+        with self._lock:
+            self._ensure_current()
+            row = self.conn.execute(
+                "SELECT offset FROM offsets WHERE id = ?", (doc_id,)
+            ).fetchone()
+        if row is None:
+            return {}
+
+        with open(self.metadata_file, "rb") as file:
+            file.seek(row[0])
+            line = file.readline()
+        # The leading-id fast path indexes lines without parsing them
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            logger.warning(f"Invalid metadata record for {doc_id}: {e}")
+            return {}
+        return record if isinstance(record, dict) else {}
+
+    def close(self) -> None:
+        """Close the index database."""
+        self.conn.close()
@@ -0,0 +1,268 @@
+"""
+Persistent background upload queue for DeSciDB.
+
+This module provides an UploadQueue that spools content-addressed blobs to disk
+and uploads them to Lighthouse IPFS from background threads, retrying transport
+failures with exponential backoff. Queue state lives in SQLite, so pending uploads
+survive a restart and re-enqueueing the same CID is a no-op.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import requests
+
+from descidb.utils.http_client import get_session
+from descidb.utils.logging_utils import get_logger
+
+# Get module logger
+logger = get_logger(__name__)
+
+LIGHTHOUSE_ADD_URL = "https://node.lighthouse.storage/api/v0/add"
+# CIDv1 with raw leaves, the format compute_cid produces
+LIGHTHOUSE_ADD_PARAMS: Dict[str, Union[str, int]] = {
+    "cid-version": 1,
+    "raw-leaves": "true",
+}
+
+
+def _is_transient(error: Exception) -> bool:
+    """Return whether an upload failure may succeed when retried."""
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return (
+            response is None
+            or response.status_code in (408, 429)
+            or response.status_code >= 500
+        )
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+class UploadQueue:
+    """
+    Drains spooled blobs to Lighthouse in the background.
+
+    Each blob is stored as <spool_dir>/blobs/<cid> and tracked by a row in
+    <spool_dir>/queue.sqlite until the upload succeeds. Uploads ask for CIDv1 raw
+    leaves so that the CID reported by Lighthouse matches the locally computed one.
+    Only transport errors (connection failures, timeouts, 408/429/5xx responses)
+    are retried. A CID mismatch or any other deterministic error marks the upload
+    failed on its first attempt; the blob and its row are kept, so it can be
+    rescheduled with retry_failed.
+    """
+
+    def __init__(
+        self,
+        ipfs_api_key: str,
+        spool_dir: Union[str, Path],
+        num_workers: int = 2,
+        max_attempts: int = 8,
+        backoff_base: float = 2.0,
+        backoff_max: float = 300.0,
+    ):
+        """
+        Open (or create) the queue and start its worker threads.
+
+        Args:
+            ipfs_api_key: API key for Lighthouse IPFS
+            spool_dir: Directory holding the queue database and spooled blobs
+            num_workers: Number of concurrent upload threads
+            max_attempts: Attempts before an upload is marked as failed
+            backoff_base: Delay in seconds before the first retry, doubled per attempt
+            backoff_max: Upper bound for the retry delay in seconds
+        """
+        self.ipfs_api_key = ipfs_api_key
+        self.spool_dir = Path(spool_dir)
+        self.blob_dir = self.spool_dir / "blobs"
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.logger = get_logger(__name__ + ".UploadQueue")
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stop = threading.Event()
+
+        self.conn = sqlite3.connect(
+            str(self.spool_dir / "queue.sqlite"), check_same_thread=False
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS uploads (
+                cid TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt REAL NOT NULL DEFAULT 0,
+                last_error TEXT
+            )
+            """
+        )
+        # Uploads interrupted by a crash are retried
+        self.conn.execute(
+            "UPDATE uploads SET status = 'pending' WHERE status = 'in_progress'"
+        )
+        self.conn.commit()
+
+        self._workers: List[threading.Thread] = []
+        for i in range(num_workers):
+            worker = threading.Thread(
+                target=self._run, name=f"descidb-upload-{i}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def enqueue(self, cid: str, data: bytes) -> None:
+        """Spool data under its CID and schedule it for upload (idempotent)."""
+        blob_path = self.blob_dir / cid
+        if not blob_path.exists():
+            fd, tmp_path = tempfile.mkstemp(dir=self.blob_dir, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, blob_path)
+
+        with self._wakeup:
+            self.conn.execute("INSERT OR IGNORE INTO uploads (cid) VALUES (?)", (cid,))
+            self.conn.commit()
+            self._wakeup.notify()
+
+    def _claim(self) -> Optional[str]:
+        """Mark the next due upload as in progress and return its CID."""
+        row = self.conn.execute(
+            """
+            SELECT cid FROM uploads
+            WHERE status = 'pending' AND next_attempt <= ?
+            ORDER BY next_attempt LIMIT 1
+            """,
+            (time.time(),),
+        ).fetchone()
+        if row is None:
+            return None
+        self.conn.execute(
+            "UPDATE uploads SET status = 'in_progress' WHERE cid = ?", (row[0],)
+        )
+        self.conn.commit()
+        return str(row[0])
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._wakeup:
+                cid = self._claim()
+                if cid is None:
+                    self._wakeup.wait(timeout=1.0)
+                    continue
+            self._upload(cid)
+
+    def _upload(self, cid: str) -> None:
+        blob_path = self.blob_dir / cid
+        try:
+            with open(blob_path, "rb") as file:
+                response = get_session().post(
+                    LIGHTHOUSE_ADD_URL,
+                    headers={"Authorization": f"Bearer {self.ipfs_api_key}"},
+                    params=LIGHTHOUSE_ADD_PARAMS,
+                    files={"file": file},
+                )
+            response.raise_for_status()
+            remote_cid = response.json()["Hash"]
+            if remote_cid != cid:
+                raise ValueError(
+                    f"Lighthouse reported CID {remote_cid} for locally computed {cid}"
+                )
+        except Exception as e:
+            self._record_failure(cid, e)
+            return
+
+        with self._wakeup:
+            self.conn.execute("DELETE FROM uploads WHERE cid = ?", (cid,))
+            self.conn.commit()
+            self._wakeup.notify_all()
+        blob_path.unlink(missing_ok=True)
+        self.logger.info(f"Uploaded {cid} to Lighthouse")
+
+    def _record_failure(self, cid: str, error: Exception) -> None:
+        with self._wakeup:
+            (attempts,) = self.conn.execute(
+                "SELECT attempts FROM uploads WHERE cid = ?", (cid,)
+            ).fetchone()
+            attempts += 1
+            delay = min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+            retry = _is_transient(error) and attempts < self.max_attempts
+            status = "pending" if retry else "failed"
+            self.conn.execute(
+                """
+                UPDATE uploads
+                SET status = ?, attempts = ?, next_attempt = ?, last_error = ?
+                WHERE cid = ?
+                """,
+                (status, attempts, time.time() + delay, str(error), cid),
+            )
+            self.conn.commit()
+            self._wakeup.notify_all()
+
+        if status == "failed":
+            self.logger.error(
+                f"Giving up on upload of {cid} after {attempts} attempt(s): {error}"
+            )
+        else:
+            self.logger.warning(
+                f"Upload of {cid} failed (attempt {attempts}), retrying in {delay:.0f}s: {error}"
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of uploads per status."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT status, COUNT(*) FROM uploads GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def retry_failed(self) -> None:
+        """Reschedule uploads that exhausted their attempts."""
+        with self._wakeup:
+            self.conn.execute(
+                """
+                UPDATE uploads SET status = 'pending', attempts = 0, next_attempt = 0
+                WHERE status = 'failed'
+                """
+            )
+            self.conn.commit()
+            self._wakeup.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no uploads are pending or in progress.
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._wakeup:
+            while True:
+                (remaining,) = self.conn.execute(
+                    "SELECT COUNT(*) FROM uploads WHERE status != 'failed'"
+                ).fetchone()
+                if remaining == 0:
+                    return True
+                wait = 1.0
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return False
+                self._wakeup.wait(timeout=wait)
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the workers, optionally after draining the queue first."""
+        if wait:
+            self.join()
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for worker in self._workers:
+            worker.join()
+        self.conn.close()
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import List, Union
 from urllib.parse import urlparse
 
-import requests
+from descidb.utils.http_client import get_session
 
 
 def compress(
@@ -63,7 +63,7 @@ def upload_to_lighthouse(filepath: Union[str, Path], ipfs_api_key: str) -> str:
     with open(str(filepath), "rb") as file:
         files = {"file": file}
         print(f"Uploading {filepath} to Lighthouse IPFS...")
-        response = requests.post(url, headers=headers, files=files)
+        response = get_session().post(url, headers=headers, files=files)
         response.raise_for_status()
     cid = response.json()["Hash"]
     return f"https://gateway.lighthouse.storage/ipfs/{cid}"
@@ -76,7 +76,7 @@ def download_from_url(url: str, output_folder: Union[str, Path] = "./tmp"):
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Fetch the file
-    response = requests.get(url, stream=True)
+    response = get_session().get(url, stream=True)
     response.raise_for_status()
 
     parsed_url = urlparse(url)
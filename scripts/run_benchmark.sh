@@ -0,0 +1,18 @@
+#!/bin/bash
+# run_benchmark.sh
+# DESCRIPTION: Run a benchmark from benchmarks/ by name, e.g. neo4j_merge_latency
+
+set -e
+
+if [ -z "$1" ]; then
+    echo "Available benchmarks:"
+    for f in "$(dirname "$0")"/../benchmarks/*.py; do
+        echo "  $(basename "$f" .py)"
+    done
+    exit 1
+fi
+
+name="$1"
+shift
+echo "Running benchmark $name..."
+poetry run python "benchmarks/$name.py" "$@"
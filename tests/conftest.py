@@ -11,6 +11,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
+# Keep tests from reading or writing the user's persistent embedding cache
+os.environ["DESCIDB_EMBEDDING_CACHE"] = "off"
+os.environ["DESCIDB_IPFS_CACHE_DIR"] = "off"
+
 # Mock problematic modules to avoid OpenCV import issues
 
 
@@ -35,10 +39,6 @@ for mod_name in MOCK_MODULES:
         sys.modules[f"{mod_name}.{submod}.donut"] = MockModule()
         sys.modules[f"{mod_name}.{submod}.donut.processor"] = MockModule()
 
-# Set up mock for the convert function
-sys.modules["descidb.core.converter"] = MockModule()
-sys.modules["descidb.core.converter"].convert = MagicMock()
-
 
 @pytest.fixture
 def sample_text():
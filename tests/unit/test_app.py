@@ -0,0 +1,112 @@
+"""
+Unit tests for the FastAPI server.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from descidb.server.app import app
+
+
+class TestEvaluateEndpoint:
+    """Test cases for /api/evaluate."""
+
+    @patch("descidb.server.app.EvaluationAgent")
+    def test_evaluate_returns_query_results(self, mock_agent_class):
+        """The endpoint awaits the async query path and returns its results."""
+        results = {"query": "q", "collection_results": {"a_b_openai": {"results": []}}}
+        mock_agent = mock_agent_class.return_value
+        mock_agent.aquery_collections = AsyncMock(return_value=results)
+
+        response = TestClient(app).post(
+            "/api/evaluate", json={"query": "q", "collections": ["a_b_openai"]}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == results
+        mock_agent.aquery_collections.assert_awaited_once_with(
+            query="q", collection_names=["a_b_openai"], db_path=None
+        )
+
+    @patch("descidb.server.app.EvaluationAgent")
+    def test_evaluate_error(self, mock_agent_class):
+        """Failures are reported as HTTP 500."""
+        mock_agent_class.side_effect = ValueError("OpenRouter API key not configured")
+
+        response = TestClient(app).post(
+            "/api/evaluate", json={"query": "q", "collections": []}
+        )
+
+        assert response.status_code == 500
+        assert "OpenRouter" in response.json()["detail"]
+
+
+class TestSearchEndpoint:
+    """Test cases for /api/search."""
+
+    @patch("descidb.server.app.search_collections")
+    def test_search_passes_k_and_filters(self, mock_search):
+        """The endpoint forwards k, filters and collections to the search helper."""
+        results = {
+            "query": "q",
+            "results": [
+                {
+                    "collection": "a_b_openai",
+                    "id": "emb1",
+                    "document": "cid1",
+                    "metadata": {"root_cid": "root"},
+                    "distance": 0.1,
+                }
+            ],
+            "errors": {},
+        }
+        mock_search.return_value = results
+
+        response = TestClient(app).post(
+            "/api/search",
+            json={
+                "query": "q",
+                "collections": ["a_b_openai"],
+                "k": 5,
+                "where": {"root_cid": "root"},
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == results
+        mock_search.assert_called_once_with(
+            query="q",
+            collection_names=["a_b_openai"],
+            k=5,
+            where={"root_cid": "root"},
+            db_path=None,
+        )
+
+    def test_search_validates_request(self):
+        """k must be positive and at least one collection is required."""
+        client = TestClient(app)
+
+        assert (
+            client.post(
+                "/api/search", json={"query": "q", "collections": ["a"], "k": 0}
+            ).status_code
+            == 422
+        )
+        assert (
+            client.post(
+                "/api/search", json={"query": "q", "collections": []}
+            ).status_code
+            == 422
+        )
+
+    @patch("descidb.server.app.search_collections")
+    def test_search_rejects_unconfigured_db_path(self, mock_search, tmp_path):
+        """Only configured ChromaDB directories can be opened."""
+        response = TestClient(app).post(
+            "/api/search",
+            json={"query": "q", "collections": ["a"], "db_path": str(tmp_path)},
+        )
+
+        assert response.status_code == 400
+        mock_search.assert_not_called()
@@ -0,0 +1,43 @@
+"""
+Unit tests for the audit log.
+"""
+
+import json
+
+from descidb.utils.audit_log import AuditLog, get_audit_log
+
+
+class TestAuditLog:
+    """Test cases for AuditLog."""
+
+    def test_records_are_written_as_json_lines(self, tmp_path):
+        """Each record becomes one JSON line with its type and a timestamp."""
+        audit_log = AuditLog(tmp_path / "audit.jsonl")
+        audit_log.record("query_results", {"query": "q", "collection_results": {}})
+        audit_log.record("evaluation", {"query": "q"})
+        audit_log.close()
+
+        lines = (tmp_path / "audit.jsonl").read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert [record["type"] for record in records] == [
+            "query_results",
+            "evaluation",
+        ]
+        assert records[0]["collection_results"] == {}
+        assert "timestamp" in records[0]
+
+    def test_rotation_bounds_disk_usage(self, tmp_path):
+        """Files are rotated at max_bytes and only backup_count are kept."""
+        audit_log = AuditLog(tmp_path / "audit.jsonl", max_bytes=200, backup_count=2)
+        for i in range(50):
+            audit_log.record("query_results", {"query": f"query {i}"})
+        audit_log.close()
+
+        files = sorted(path.name for path in tmp_path.iterdir())
+        assert files == ["audit.jsonl", "audit.jsonl.1", "audit.jsonl.2"]
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Auditing is opt-in."""
+        monkeypatch.delenv("DESCIDB_AUDIT_LOG", raising=False)
+
+        assert get_audit_log() is None
@@ -6,7 +6,7 @@ ChromaDB vector database collections.
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
@@ -182,3 +182,99 @@ class TestVectorDatabaseManager:
 
                 # Verify collection.get() was called
                 mock_collection.get.assert_called_once()
+
+    def test_insert_documents_batches_and_caches_collection(self):
+        """Test bulk inserts are split by the client's max batch size."""
+        components = {
+            "converter": ["openai"],
+            "chunker": ["paragraph"],
+            "embedder": ["openai"],
+        }
+        db_name = "openai_paragraph_openai"
+        embeddings = [[float(i)] for i in range(5)]
+        metadatas = [{"content_cid": f"cid{i}"} for i in range(5)]
+        ids = [f"id{i}" for i in range(5)]
+
+        with patch("chromadb.PersistentClient") as mock_client:
+            with patch("os.makedirs"):
+                mock_instance = mock_client.return_value
+                mock_collection = MagicMock()
+                mock_instance.get_collection.return_value = mock_collection
+                mock_instance.get_max_batch_size.return_value = 2
+
+                manager = VectorDatabaseManager(components=components)
+                manager.insert_documents(db_name, embeddings, metadatas, ids)
+                manager.insert_documents(
+                    db_name, embeddings[:1], metadatas[:1], ids[:1], upsert=True
+                )
+
+                mock_instance.get_collection.assert_called_once_with(name=db_name)
+                assert mock_collection.add.call_count == 3
+                mock_collection.add.assert_any_call(
+                    documents=["cid4"],
+                    embeddings=[[4.0]],
+                    ids=["id4"],
+                    metadatas=[{"content_cid": "cid4"}],
+                )
+                mock_collection.upsert.assert_called_once_with(
+                    documents=["cid0"],
+                    embeddings=[[0.0]],
+                    ids=["id0"],
+                    metadatas=[{"content_cid": "cid0"}],
+                )
+
+    def test_insert_documents_deduplicates_ids(self):
+        """Test repeated ids are written once, keeping the last occurrence."""
+        components = {
+            "converter": ["openai"],
+            "chunker": ["paragraph"],
+            "embedder": ["openai"],
+        }
+
+        with patch("chromadb.PersistentClient") as mock_client:
+            with patch("os.makedirs"):
+                mock_instance = mock_client.return_value
+                mock_collection = MagicMock()
+                mock_instance.get_collection.return_value = mock_collection
+                mock_instance.get_max_batch_size.return_value = 2
+
+                manager = VectorDatabaseManager(components=components)
+                manager.insert_documents(
+                    "openai_paragraph_openai",
+                    [[0.0], [1.0], [2.0], [3.0]],
+                    [{"content_cid": f"cid{i}"} for i in range(4)],
+                    ["a", "b", "a", "c"],
+                    upsert=True,
+                )
+
+                assert mock_collection.upsert.call_args_list == [
+                    call(
+                        documents=["cid2", "cid1"],
+                        embeddings=[[2.0], [1.0]],
+                        ids=["a", "b"],
+                        metadatas=[{"content_cid": "cid2"}, {"content_cid": "cid1"}],
+                    ),
+                    call(
+                        documents=["cid3"],
+                        embeddings=[[3.0]],
+                        ids=["c"],
+                        metadatas=[{"content_cid": "cid3"}],
+                    ),
+                ]
+
+    def test_insert_documents_length_mismatch(self):
+        """Test bulk inserts reject inputs of different lengths."""
+        components = {
+            "converter": ["openai"],
+            "chunker": ["paragraph"],
+            "embedder": ["openai"],
+        }
+
+        with patch("chromadb.PersistentClient"):
+            with patch("os.makedirs"):
+                manager = VectorDatabaseManager(components=components)
+
+                with pytest.raises(ValueError):
+                    manager.insert_documents(
+                        "openai_paragraph_openai", [[0.1]], [], ["id"]
+                    )
@@ -2,16 +2,30 @@
 Unit tests for the converter module.
 """
 
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+from openai import BadRequestError, RateLimitError
 
 from descidb.core.converter import (
+    PDF_PAGES_PER_SHARD,
+    PDF_PARALLEL_PAGE_THRESHOLD,
+    _convert_segment,
+    _load_marker_converter,
     chunk_text,
     convert,
     convert_from_url,
     extract_text_from_pdf,
+    iter_pdf_pages,
+    iter_text_segments,
+    marker,
     openai,
+    release_marker,
+    warm_up_marker,
 )
 
 
@@ -44,7 +58,7 @@ class TestConverter:
         assert result == "Page 1 contentPage 2 content"
 
     @patch("descidb.core.converter.OpenAI")
-    @patch("descidb.core.converter.extract_text_from_pdf")
+    @patch("descidb.core.converter.iter_pdf_pages")
     @patch("os.path.exists")
     def test_openai_converter(self, mock_exists, mock_extract, mock_openai):
         """Test the OpenAI converter function."""
@@ -52,7 +66,7 @@ class TestConverter:
         mock_exists.return_value = True
 
         # Mock PDF text extraction
-        mock_extract.return_value = "PDF text content"
+        mock_extract.return_value = iter(["PDF text content"])
 
         # Mock OpenAI client response
         mock_client = MagicMock()
@@ -126,3 +140,153 @@ class TestConverter:
             conversion_type="openai", input_path="/tmp/download"
         )
         assert result == "Converted content"
+
+
+class TestPdfPages:
+    """Test cases for streamed and sharded PDF text extraction."""
+
+    def test_segments_match_chunk_text(self):
+        """Streaming pages gives the same segments as chunking the whole text."""
+        random.seed(0)
+        words = ["alpha", "beta", "gamma", "delta\n", "epsilon "]
+        pages = [
+            "".join(random.choice(words) + " " for _ in range(random.randint(0, 900)))
+            + random.choice(["", " ", "word"])
+            for _ in range(12)
+        ]
+
+        segments = list(iter_text_segments(iter(pages), chunk_size=500))
+
+        assert segments == chunk_text("".join(pages), chunk_size=500)
+
+    @patch("descidb.core.converter.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("descidb.core.converter._extract_page_range")
+    @patch("PyPDF2.PdfReader")
+    def test_large_pdf_is_sharded(self, mock_pdf_reader, mock_extract_range):
+        """PDFs above the page threshold are extracted in ordered shards."""
+        num_pages = PDF_PARALLEL_PAGE_THRESHOLD + 6
+        mock_pdf_reader.return_value.pages = [MagicMock()] * num_pages
+        mock_extract_range.side_effect = lambda path, start, stop: [
+            f"{i}," for i in range(start, stop)
+        ]
+
+        pages = list(iter_pdf_pages("big.pdf", max_workers=2))
+
+        assert pages == [f"{i}," for i in range(num_pages)]
+        shards = [c.args for c in mock_extract_range.call_args_list]
+        assert shards[0] == ("big.pdf", 0, PDF_PAGES_PER_SHARD)
+        assert shards[-1][2] == num_pages
+        assert len(shards) == -(-num_pages // PDF_PAGES_PER_SHARD)
+
+    @patch("descidb.core.converter.ProcessPoolExecutor")
+    @patch("PyPDF2.PdfReader")
+    def test_small_pdf_is_serial(self, mock_pdf_reader, mock_executor):
+        """PDFs below the threshold do not start a process pool."""
+        page = MagicMock()
+        page.extract_text.return_value = "page"
+        mock_pdf_reader.return_value.pages = [page] * 3
+
+        assert list(iter_pdf_pages("small.pdf")) == ["page"] * 3
+        mock_executor.assert_not_called()
+
+
+def _openai_error(error_cls, status_code, headers=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return error_cls("error", response=response, body=None)
+
+
+def _completion(content):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    return response
+
+
+class TestOpenAISegments:
+    """Test cases for retrying and isolating OpenAI segment failures."""
+
+    @patch("descidb.core.converter.time.sleep")
+    def test_retryable_error_is_retried(self, mock_sleep):
+        """Rate limits are retried, honouring Retry-After."""
+        client = MagicMock()
+        client.chat.completions.create.side_effect = [
+            _openai_error(RateLimitError, 429, {"retry-after": "2"}),
+            _completion("# Markdown"),
+        ]
+
+        assert _convert_segment(client, "text") == "# Markdown"
+        assert client.chat.completions.create.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("descidb.core.converter.time.sleep")
+    def test_non_retryable_error_is_not_retried(self, mock_sleep):
+        """Other errors are not retried and keep the segment as plain text."""
+        client = MagicMock()
+        client.chat.completions.create.side_effect = _openai_error(BadRequestError, 400)
+
+        assert _convert_segment(client, "text") == "text"
+        client.chat.completions.create.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("descidb.core.converter.OpenAI")
+    @patch("descidb.core.converter.iter_text_segments")
+    @patch("descidb.core.converter.iter_pdf_pages")
+    @patch("os.path.exists", return_value=True)
+    def test_failed_segment_does_not_fail_document(
+        self, mock_exists, mock_pages, mock_segments, mock_openai
+    ):
+        """One failing segment leaves the other segments converted."""
+        mock_segments.return_value = iter(["one", "two", "three"])
+
+        def create(model, messages):
+            if messages[0]["content"].endswith("two"):
+                raise _openai_error(BadRequestError, 400)
+            return _completion(messages[0]["content"].split()[-1].upper())
+
+        mock_openai.return_value.chat.completions.create.side_effect = create
+
+        assert openai("test.pdf") == "ONE\n\ntwo\n\nTHREE"
+
+
+class TestMarkerConverter:
+    """Test cases for the cached marker converter."""
+
+    @pytest.fixture
+    def marker_models(self):
+        """Count marker model loads and converter calls."""
+        modules = {
+            "marker.config.parser": MagicMock(),
+            "marker.converters.pdf": MagicMock(),
+            "marker.models": MagicMock(),
+        }
+        converter = modules["marker.converters.pdf"].PdfConverter.return_value
+        converter.return_value.markdown = "# Paper"
+
+        _load_marker_converter.cache_clear()
+        with patch.dict(sys.modules, modules):
+            yield modules["marker.models"].create_model_dict, converter
+        _load_marker_converter.cache_clear()
+
+    def test_models_loaded_once(self, marker_models, tmp_path):
+        """Warm-up loads the models, later conversions reuse the converter."""
+        create_model_dict, converter = marker_models
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF")
+
+        warm_up_marker()
+        assert marker(str(pdf_path)) == "# Paper"
+        assert marker(str(pdf_path)) == "# Paper"
+
+        create_model_dict.assert_called_once()
+        assert converter.call_count == 2
+
+    def test_release_reloads_models(self, marker_models):
+        """After release_marker the next use loads the models again."""
+        create_model_dict, _ = marker_models
+
+        warm_up_marker()
+        release_marker()
+        warm_up_marker()
+
+        assert create_model_dict.call_count == 2
@@ -0,0 +1,127 @@
+"""
+Unit tests for the DatabaseCreator.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from descidb.db.db_creator import DatabaseCreator
+
+
+class TestDatabaseCreator:
+    """Test cases for DatabaseCreator.process_paths."""
+
+    def _creator(self, paths, **kwargs):
+        graph = MagicMock()
+        graph.recreate_path.return_value = paths
+        return DatabaseCreator(graph, MagicMock(), **kwargs)
+
+    def test_process_paths_fetches_and_inserts_all(self):
+        """Every path is fetched and inserted with its metadata."""
+        paths = [["root", f"content{i}", f"emb{i}"] for i in range(5)]
+        creator = self._creator(paths, max_in_flight=3, batch_size=2)
+
+        with patch.object(
+            creator, "query_lighthouse_for_embedding", return_value=[0.1, 0.2]
+        ), patch.object(creator, "query_ipfs_content", side_effect=lambda c: c):
+            stats = creator.process_paths("root", ["CHUNKED_BY_x"], "db")
+
+        insert = creator.vector_db_manager.insert_documents
+        assert insert.call_count == 3
+        inserted = {}
+        for call in insert.call_args_list:
+            db_name, embeddings, metadatas, ids = call.args
+            assert db_name == "db"
+            assert call.kwargs == {"upsert": True}
+            inserted.update(zip(ids, zip(embeddings, metadatas)))
+        assert sorted(inserted) == [f"emb{i}" for i in range(5)]
+        assert inserted["emb3"] == (
+            [0.1, 0.2],
+            {
+                "content_cid": "content3",
+                "root_cid": "root",
+                "embedding_cid": "emb3",
+                "content": "content3",
+            },
+        )
+        assert stats["paths"] == 5
+        assert stats["inserted"] == 5
+        assert stats["failed"] == 0
+        assert creator.metrics == {
+            "paths": 5,
+            "inserted": 5,
+            "failed": 0,
+            "insert_failed": 0,
+            "duplicates": 0,
+        }
+
+    def test_process_paths_counts_failures(self):
+        """Failed fetches and short paths are counted apart from failed inserts."""
+        paths = [
+            ["root", "c1", "e1"],
+            ["root", "c2", "bad"],
+            ["e3"],
+            ["root", "c4", "e4"],
+        ]
+        creator = self._creator(paths, batch_size=1)
+        creator.vector_db_manager.insert_documents.side_effect = [
+            None,
+            Exception("boom"),
+        ]
+
+        with patch.object(
+            creator,
+            "query_lighthouse_for_embedding",
+            side_effect=lambda cid: None if cid == "bad" else [1.0],
+        ), patch.object(creator, "query_ipfs_content", return_value="text"):
+            stats = creator.process_paths("root", [], "db")
+
+        assert stats["inserted"] == 1
+        assert stats["failed"] == 2
+        assert stats["insert_failed"] == 1
+
+    def test_fetch_errors_skip_only_that_path(self):
+        """I/O, key and decode errors while fetching fail a single path."""
+        paths = [["root", f"c{i}", f"e{i}"] for i in range(4)]
+        creator = self._creator(paths)
+        errors = {"e1": OSError("disk"), "e2": KeyError("Hash"), "e3": ValueError}
+
+        def embedding(cid):
+            if cid in errors:
+                raise errors[cid]
+            return [1.0]
+
+        with patch.object(
+            creator, "query_lighthouse_for_embedding", side_effect=embedding
+        ), patch.object(creator, "query_ipfs_content", return_value="text"):
+            stats = creator.process_paths("root", [], "db")
+
+        assert stats["inserted"] == 1
+        assert stats["failed"] == 3
+
+    def test_duplicate_embeddings_are_inserted_once(self):
+        """Paths ending in the same embedding CID are deduplicated per batch."""
+        paths = [["root", f"c{i}", "emb"] for i in range(3)]
+        creator = self._creator(paths, max_in_flight=1)
+
+        with patch.object(
+            creator, "query_lighthouse_for_embedding", return_value=[1.0]
+        ), patch.object(creator, "query_ipfs_content", side_effect=lambda c: c):
+            stats = creator.process_paths("root", [], "db")
+
+        (
+            _,
+            embeddings,
+            metadatas,
+            ids,
+        ) = creator.vector_db_manager.insert_documents.call_args.args
+        assert ids == ["emb"]
+        assert metadatas[0]["content_cid"] == "c2"
+        assert stats["inserted"] == 1
+        assert stats["duplicates"] == 2
+
+    def test_process_paths_without_paths(self):
+        """A root CID without valid paths is skipped."""
+        creator = self._creator(False)
+
+        assert creator.process_paths("root", [], "db") is None
+        creator.vector_db_manager.insert_documents.assert_not_called()
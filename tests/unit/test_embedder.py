@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from descidb.core.embedder import embed, embed_from_url, openai
+from descidb.core.embedder import embed, embed_batch, embed_from_url, openai
 
 
 class TestEmbedder:
@@ -122,3 +122,77 @@ class TestEmbedder:
                 os.environ["OPENAI_API_KEY"] = original_api_key
             else:
                 del os.environ["OPENAI_API_KEY"]
+
+
+class TestEmbedBatch:
+    """Test cases for batched embedding."""
+
+    @patch("descidb.core.embedder.OpenAI")
+    def test_openai_batch_splits_requests(self, mock_openai):
+        """Texts are sent in request-sized batches and returned in input order."""
+        mock_client = MagicMock()
+        mock_openai.return_value = mock_client
+
+        def create(model, input):
+            response = MagicMock()
+            items = []
+            # Return results out of order to check they are re-sorted by index
+            for index in reversed(range(len(input))):
+                item = MagicMock()
+                item.index = index
+                item.embedding = [float(len(input[index]))]
+                items.append(item)
+            response.data = items
+            return response
+
+        mock_client.embeddings.create.side_effect = create
+
+        result = embed_batch("openai", ["a", "bb", "ccc"], batch_size=2)
+
+        assert mock_client.embeddings.create.call_count == 2
+        assert mock_client.embeddings.create.call_args_list[0].kwargs["input"] == [
+            "a",
+            "bb",
+        ]
+        assert result == [[1.0], [2.0], [3.0]]
+
+    @patch("descidb.core.embedder._load_bge")
+    def test_bge_batch_uses_batch_size(self, mock_load_bge):
+        """The BGE model encodes all texts in one call with the given batch size."""
+        mock_model = MagicMock()
+        mock_model.encode.return_value.tolist.return_value = [[0.1], [0.2]]
+        mock_load_bge.return_value = mock_model
+
+        result = embed_batch("bge", ["first", "second"], batch_size=8)
+
+        mock_model.encode.assert_called_once_with(
+            ["first", "second"], batch_size=8, show_progress_bar=False
+        )
+        assert result == [[0.1], [0.2]]
+
+    @patch("descidb.core.embedder.openai_batch")
+    def test_duplicate_texts_embedded_once(self, mock_openai_batch):
+        """Repeated texts are sent once and the result is fanned back out."""
+        mock_openai_batch.return_value = [[1.0], [2.0]]
+
+        result = embed_batch("openai", ["a", "b", "a"])
+
+        mock_openai_batch.assert_called_once_with(texts=["a", "b"], batch_size=None)
+        assert result == [[1.0], [2.0], [1.0]]
+
+    @patch("descidb.core.embedder.openai_batch")
+    def test_embedding_count_mismatch(self, mock_openai_batch):
+        """An embedder returning too few embeddings raises instead of leaving gaps."""
+        mock_openai_batch.return_value = [[1.0]]
+
+        with pytest.raises(ValueError, match="1 embeddings for 2 texts"):
+            embed_batch("openai", ["a", "b"])
+
+    def test_embed_batch_empty(self):
+        """An empty input returns an empty list without calling an embedder."""
+        assert embed_batch("openai", []) == []
+
+    def test_embed_batch_with_invalid_type(self):
+        """An unknown embedder type raises a KeyError."""
+        with pytest.raises(KeyError):
+            embed_batch("invalid_embedder", ["Test text"])
@@ -0,0 +1,98 @@
+"""
+Unit tests for the embedding cache module.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from descidb.core.embedder import embed, embed_batch
+from descidb.core.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an embedding cache in a temporary directory."""
+    embedding_cache = EmbeddingCache(tmp_path / "embeddings.sqlite", max_entries=2)
+    yield embedding_cache
+    embedding_cache.close()
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    def test_put_and_get(self, cache):
+        """Stored embeddings are returned unchanged and counted as hits."""
+        embedding = [0.1, 0.2, 0.30000000000000004]
+        cache.put("openai", "text", embedding)
+
+        assert cache.get("openai", "text") == embedding
+        assert cache.get("bge", "text") is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_persistence(self, tmp_path):
+        """Entries survive reopening the cache file."""
+        path = tmp_path / "embeddings.sqlite"
+        first = EmbeddingCache(path)
+        first.put("openai", "text", [1.0])
+        first.close()
+
+        second = EmbeddingCache(path)
+        assert second.get("openai", "text") == [1.0]
+        second.close()
+
+    def test_lru_eviction(self, cache):
+        """The least recently used entry is evicted once max_entries is exceeded."""
+        with patch("descidb.core.embedding_cache.time.time", side_effect=range(10)):
+            cache.put("openai", "a", [1.0])
+            cache.put("openai", "b", [2.0])
+            cache.get("openai", "a")
+            cache.put("openai", "c", [3.0])
+
+        assert len(cache) == 2
+        assert cache.get("openai", "b") is None
+        assert cache.get("openai", "a") == [1.0]
+
+    def test_empty_embeddings_are_not_cached(self, cache):
+        """Empty embeddings (unimplemented embedders) are never stored."""
+        cache.put("nvidia", "text", [])
+        assert len(cache) == 0
+
+
+class TestEmbedWithCache:
+    """Test cases for embed and embed_batch consulting the cache."""
+
+    @patch("descidb.core.embedder.openai")
+    def test_embed_uses_cache(self, mock_openai, cache):
+        """A second embed of the same text is served from the cache."""
+        mock_openai.return_value = [0.5]
+        with patch("descidb.core.embedder.get_embedding_cache", return_value=cache):
+            assert embed("openai", "text") == [0.5]
+            assert embed("openai", "text") == [0.5]
+
+        mock_openai.assert_called_once_with(text="text")
+
+    @patch("descidb.core.embedder.openai_batch")
+    def test_embed_batch_only_embeds_misses(self, mock_openai_batch, cache):
+        """Only uncached texts are sent to the embedder, results keep input order."""
+        cache.put("openai/text-embedding-3-small", "cached", [1.0])
+        mock_openai_batch.return_value = [[2.0]]
+        with patch("descidb.core.embedder.get_embedding_cache", return_value=cache):
+            result = embed_batch("openai", ["cached", "new"])
+
+        mock_openai_batch.assert_called_once_with(texts=["new"], batch_size=None)
+        assert result == [[1.0], [2.0]]
+        assert cache.get("openai/text-embedding-3-small", "new") == [2.0]
+
+    @patch("descidb.core.embedder.openai")
+    def test_model_change_misses(self, mock_openai, cache):
+        """Embeddings cached for another model are not reused."""
+        mock_openai.side_effect = [[0.5], [0.7]]
+        with patch("descidb.core.embedder.get_embedding_cache", return_value=cache):
+            assert embed("openai", "text") == [0.5]
+            with patch.dict(
+                "descidb.core.embedder.EMBEDDER_MODELS", {"openai": "other-model"}
+            ):
+                assert embed("openai", "text") == [0.7]
+
+        assert mock_openai.call_count == 2
@@ -0,0 +1,120 @@
+"""
+Unit tests for the EvaluationAgent.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from descidb.query.evaluation_agent import EvaluationAgent
+
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path):
+    """Create an agent that writes its results to a temp directory."""
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+    agent = EvaluationAgent()
+    agent.temp_dir = tmp_path
+    return agent
+
+
+class TestQueryCollections:
+    """Test cases for EvaluationAgent.query_collections."""
+
+    @patch("descidb.query.evaluation_agent.query_collection")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_query_embedded_once_per_embedder(self, mock_embed, mock_query, agent):
+        """Collections sharing an embedder share one query embedding."""
+        mock_embed.side_effect = lambda embedder_type, texts: [[len(embedder_type)]]
+        mock_query.side_effect = lambda name, query, db_path, query_embedding: (
+            json.dumps({"query": query, "results": [], "embedding": query_embedding})
+        )
+        names = [
+            "openai_paragraph_openai",
+            "marker_fixed_length_openai",
+            "openai_paragraph_bge",
+            "marker_paragraph_openai",
+        ]
+
+        results_file = agent.query_collections("test query", names, "db")
+
+        assert mock_embed.call_count == 2
+        mock_embed.assert_any_call(embedder_type="openai", texts=["test query"])
+        mock_embed.assert_any_call(embedder_type="bge", texts=["test query"])
+        with open(results_file) as f:
+            results = json.load(f)["collection_results"]
+        assert list(results) == names
+        assert results["marker_fixed_length_openai"]["embedding"] == [6]
+        assert results["openai_paragraph_bge"]["embedding"] == [3]
+
+    @patch("descidb.query.evaluation_agent.query_collection")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_embedding_error_is_reported_per_collection(
+        self, mock_embed, mock_query, agent
+    ):
+        """A failed embedding marks only the collections of that embedder."""
+
+        def embed(embedder_type, texts):
+            if embedder_type == "bge":
+                raise RuntimeError("model unavailable")
+            return [[0.1]]
+
+        mock_embed.side_effect = embed
+        mock_query.return_value = json.dumps({"query": "q", "results": []})
+
+        results_file = agent.query_collections(
+            "q", ["openai_paragraph_openai", "openai_paragraph_bge"]
+        )
+
+        with open(results_file) as f:
+            results = json.load(f)["collection_results"]
+        assert results["openai_paragraph_openai"] == {"query": "q", "results": []}
+        assert results["openai_paragraph_bge"] == {"error": "model unavailable"}
+        mock_query.assert_called_once()
+
+    @patch("descidb.query.evaluation_agent.query_collection")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_aquery_collections(self, mock_embed, mock_query, agent, tmp_path):
+        """The async variant returns the results in memory without writing files."""
+        mock_embed.return_value = [[0.1]]
+        mock_query.side_effect = lambda name, query, db_path, query_embedding: (
+            json.dumps({"query": query, "results": [{"document": name}]})
+        )
+        names = ["openai_paragraph_openai", "marker_paragraph_openai"]
+
+        results = asyncio.run(agent.aquery_collections("q", names))
+
+        assert results["query"] == "q"
+        assert list(results["collection_results"]) == names
+        assert results["collection_results"][names[1]]["results"] == [
+            {"document": names[1]}
+        ]
+        mock_embed.assert_called_once()
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("descidb.query.evaluation_agent.query_collection")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_results_are_audited(self, mock_embed, mock_query, agent):
+        """With an audit log configured every result set is recorded."""
+        mock_embed.return_value = [[0.1]]
+        mock_query.return_value = json.dumps({"query": "q", "results": []})
+        agent.audit_log = MagicMock()
+
+        results = agent.run_queries("q", ["openai_paragraph_openai"])
+
+        agent.audit_log.record.assert_called_once_with("query_results", results)
+
+    @patch("descidb.query.evaluation_agent.query_collection")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_query_collections_files_are_unique(self, mock_embed, mock_query, agent):
+        """Queries in the same second write separate results files."""
+        mock_embed.return_value = [[0.1]]
+        mock_query.return_value = json.dumps({"query": "q", "results": []})
+
+        with patch("descidb.query.evaluation_agent.time.time", return_value=1000):
+            first = agent.query_collections("q", ["openai_paragraph_openai"])
+            second = agent.query_collections("q", ["openai_paragraph_openai"])
+
+        assert first != second
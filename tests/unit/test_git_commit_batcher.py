@@ -0,0 +1,144 @@
+"""
+Unit tests for the git commit batcher.
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from descidb.utils.git_commit_batcher import GitCommitBatcher, commit_message
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create an empty git repository."""
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    subprocess.run(
+        ["git", "-C", str(tmp_path), "config", "user.email", "test@example.com"],
+        check=True,
+    )
+    subprocess.run(
+        ["git", "-C", str(tmp_path), "config", "user.name", "Test"], check=True
+    )
+    return tmp_path
+
+
+def _write_cid(repo, cid):
+    path = repo / f"{cid}.txt"
+    path.write_text(cid)
+    return str(path)
+
+
+def _log(repo, *args):
+    result = subprocess.run(
+        ["git", "-C", str(repo), "log", "--format=%B%x00", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return [message.strip() for message in result.stdout.split("\0") if message.strip()]
+
+
+class TestGitCommitBatcher:
+    """Test cases for GitCommitBatcher."""
+
+    def test_commit_message(self):
+        """Single CIDs keep the original message, batches list every CID."""
+        assert commit_message(["Qm1"]) == "Added IPFS CID: Qm1"
+        assert commit_message(["Qm1", "Qm2"]) == (
+            "Added 2 IPFS CIDs\n\nAdded IPFS CID: Qm1\nAdded IPFS CID: Qm2"
+        )
+
+    def test_batch_size_one_commits_each_cid(self, repo):
+        """With max_files=1 every CID gets its own commit."""
+        batcher = GitCommitBatcher(max_files=1)
+        for cid in ["Qm1", "Qm2"]:
+            batcher.add(str(repo), _write_cid(repo, cid), cid)
+
+        assert _log(repo) == ["Added IPFS CID: Qm2", "Added IPFS CID: Qm1"]
+
+    def test_batches_commit_once_and_keep_provenance(self, repo):
+        """Pending files are committed together when the batch fills or on flush."""
+        batcher = GitCommitBatcher(max_files=3)
+        for cid in ["Qm1", "Qm2", "Qm3", "Qm4"]:
+            batcher.add(str(repo), _write_cid(repo, cid), cid)
+
+        assert len(_log(repo)) == 1
+        batcher.close()
+
+        assert batcher.commits == 2
+        assert _log(repo, "--", "Qm2.txt") == [commit_message(["Qm1", "Qm2", "Qm3"])]
+        assert _log(repo, "--grep", "Added IPFS CID: Qm4") == ["Added IPFS CID: Qm4"]
+
+    def test_flush_without_pending_files(self, repo):
+        """Flushing an empty batcher does not create a commit."""
+        batcher = GitCommitBatcher(max_files=10)
+        batcher.flush()
+
+        assert batcher.commits == 0
+
+    def test_failed_commit_is_retried(self, repo):
+        """Files whose commit fails stay pending and land in the next commit."""
+        real_run = subprocess.run
+        calls = []
+
+        def run(args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                raise subprocess.CalledProcessError(1, args)
+            return real_run(args, **kwargs)
+
+        batcher = GitCommitBatcher(max_files=10)
+        batcher.add(str(repo), _write_cid(repo, "Qm1"), "Qm1")
+        with patch("descidb.utils.git_commit_batcher.subprocess.run", side_effect=run):
+            assert batcher.flush() is False
+            assert batcher.commits == 0
+
+            batcher.add(str(repo), _write_cid(repo, "Qm2"), "Qm2")
+            assert batcher.flush() is True
+
+        assert batcher.commits == 1
+        assert _log(repo) == [commit_message(["Qm1", "Qm2"])]
+
+    def test_missing_files_are_not_queued(self, repo):
+        """A CID file that was never written is skipped by add."""
+        batcher = GitCommitBatcher(max_files=1)
+        batcher.add(str(repo), str(repo / "missing.txt"), "QmMissing")
+
+        assert batcher._pending_count() == 0
+        assert batcher.commits == 0
+
+    def test_vanished_file_does_not_block_repository(self, repo):
+        """A queued file deleted before its commit is dropped, not retried forever."""
+        batcher = GitCommitBatcher(max_files=3)
+        missing = _write_cid(repo, "QmMissing")
+        batcher.add(str(repo), missing, "QmMissing")
+        (repo / "QmMissing.txt").unlink()
+        for cid in ["Qm1", "Qm2", "Qm3", "Qm4", "Qm5"]:
+            batcher.add(str(repo), _write_cid(repo, cid), cid)
+        batcher.close()
+
+        assert batcher._pending_count() == 0
+        assert batcher.commits == 2
+        assert _log(repo, "--grep", "QmMissing") == []
+        assert len(_log(repo, "--grep", "Added IPFS CID: Qm5")) == 1
+
+    def test_retries_are_bounded(self, repo):
+        """After max_attempts failed commits a repository's files are dropped."""
+        batcher = GitCommitBatcher(max_files=10, max_attempts=2)
+        batcher.add(str(repo), _write_cid(repo, "Qm1"), "Qm1")
+        with patch(
+            "descidb.utils.git_commit_batcher.subprocess.run",
+            side_effect=subprocess.CalledProcessError(1, "git"),
+        ) as mock_run:
+            assert batcher.flush() is False
+            assert batcher._pending_count() == 1
+            assert batcher.flush() is False
+
+        assert batcher._pending_count() == 0
+        assert mock_run.call_count == 2
+
+        batcher.add(str(repo), _write_cid(repo, "Qm2"), "Qm2")
+        assert batcher.flush() is True
+        assert _log(repo) == ["Added IPFS CID: Qm2"]
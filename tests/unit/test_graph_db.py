@@ -4,8 +4,10 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 import requests
+from neo4j.exceptions import ServiceUnavailable
 
-from descidb.db.graph_db import IPFSNeo4jGraph
+from descidb.db.graph_db import GraphWriteBuffer, IPFSNeo4jGraph
+from descidb.utils.ipfs_blob_store import IPFSBlobStore
 
 
 class TestIPFSNeo4jGraph:
@@ -340,18 +342,24 @@ class TestIPFSNeo4jGraph:
 
         with patch("certifi.where", return_value="/path/to/certifi"):
             with patch("os.getenv") as mock_getenv:
-                with patch("requests.get") as mock_get:
+                with patch(
+                    "descidb.utils.ipfs_blob_store.get_session"
+                ) as mock_session, patch(
+                    "descidb.db.graph_db.get_blob_store",
+                    return_value=IPFSBlobStore(cache_dir=None),
+                ):
 
                     def getenv_side_effect(key, default=None):
                         return mock_env_vars.get(key, default)
 
                     mock_getenv.side_effect = getenv_side_effect
+                    mock_get = mock_session.return_value.get
 
                     # Setup the response mock
                     mock_response = MagicMock()
-                    mock_response.text = (
+                    mock_response.content = (
                         f"{expected_content}  "  # Add spaces to test stripping
-                    )
+                    ).encode()
                     mock_response.raise_for_status = MagicMock()
                     mock_get.return_value = mock_response
 
@@ -374,12 +382,18 @@ class TestIPFSNeo4jGraph:
 
         with patch("certifi.where", return_value="/path/to/certifi"):
             with patch("os.getenv") as mock_getenv:
-                with patch("requests.get") as mock_get:
+                with patch(
+                    "descidb.utils.ipfs_blob_store.get_session"
+                ) as mock_session, patch(
+                    "descidb.db.graph_db.get_blob_store",
+                    return_value=IPFSBlobStore(cache_dir=None),
+                ):
 
                     def getenv_side_effect(key, default=None):
                         return mock_env_vars.get(key, default)
 
                     mock_getenv.side_effect = getenv_side_effect
+                    mock_get = mock_session.return_value.get
 
                     # Setup the response mock to raise an exception
                     mock_get.side_effect = requests.exceptions.RequestException(
@@ -454,3 +468,183 @@ class TestIPFSNeo4jGraph:
                         "author2@example.com": 3,
                     }
                     assert result == expected_result
+
+    def test_add_ipfs_nodes(self, mock_env_vars, mock_driver):
+        """Test adding many nodes in one UNWIND transaction."""
+        session_mock = MagicMock()
+        driver_instance = mock_driver.return_value
+        driver_instance.session.return_value.__enter__.return_value = session_mock
+
+        with patch("certifi.where", return_value="/path/to/certifi"):
+            graph = IPFSNeo4jGraph()
+            graph.add_ipfs_nodes(["QmA", "QmB", "QmA", ""])
+
+        session_mock.execute_write.assert_called_once()
+        tx_func, cids = session_mock.execute_write.call_args.args
+        assert cids == ["QmA", "QmB"]
+
+        tx = MagicMock()
+        tx_func(tx, cids)
+        tx.run.assert_called_once_with(
+            "UNWIND $cids AS cid MERGE (:IPFS {cid: cid})", cids=["QmA", "QmB"]
+        )
+
+    def test_create_relationships_groups_by_type(self, mock_env_vars, mock_driver):
+        """Test that relationships are merged with one UNWIND query per type."""
+        session_mock = MagicMock()
+        driver_instance = mock_driver.return_value
+        driver_instance.session.return_value.__enter__.return_value = session_mock
+
+        with patch("certifi.where", return_value="/path/to/certifi"):
+            graph = IPFSNeo4jGraph()
+            graph.create_relationships(
+                [
+                    ("QmA", "QmAuthor", "AUTHORED_BY"),
+                    ("QmA", "QmB", "CHUNKED_BY_paragraph"),
+                    ("QmB", "QmAuthor", "AUTHORED_BY"),
+                ]
+            )
+
+        session_mock.execute_write.assert_called_once()
+        tx_func, by_type = session_mock.execute_write.call_args.args
+        assert by_type == {
+            "AUTHORED_BY": [
+                {"src": "QmA", "dst": "QmAuthor"},
+                {"src": "QmB", "dst": "QmAuthor"},
+            ],
+            "CHUNKED_BY_paragraph": [{"src": "QmA", "dst": "QmB"}],
+        }
+
+        tx = MagicMock()
+        tx_func(tx, by_type)
+        assert tx.run.call_count == 2
+        assert "UNWIND $pairs AS pair" in tx.run.call_args_list[0].args[0]
+        assert "[:AUTHORED_BY]" in tx.run.call_args_list[0].args[0]
+
+    def test_ensure_schema_creates_constraint(self, mock_env_vars, mock_driver):
+        """Test that an unversioned graph gets the cid constraint and a version."""
+        driver_instance = mock_driver.return_value
+        driver_instance.execute_query.return_value.records = []
+
+        with patch("certifi.where", return_value="/path/to/certifi"):
+            graph = IPFSNeo4jGraph(ensure_schema=False)
+            version = graph.ensure_schema()
+
+        assert version == 1
+        statements = [c.args[0] for c in driver_instance.execute_query.call_args_list]
+        assert any(
+            "CONSTRAINT ipfs_cid_unique IF NOT EXISTS" in stmt for stmt in statements
+        )
+        driver_instance.execute_query.assert_called_with(
+            "MERGE (s:DescidbSchema) SET s.version = $version", version=1
+        )
+
+    def test_ensure_schema_is_idempotent(self, mock_env_vars, mock_driver):
+        """Test that a graph already at the current version is left untouched."""
+        driver_instance = mock_driver.return_value
+        driver_instance.execute_query.return_value.records = [{"version": 1}]
+
+        with patch("certifi.where", return_value="/path/to/certifi"):
+            graph = IPFSNeo4jGraph(ensure_schema=False)
+            version = graph.ensure_schema()
+
+        assert version == 1
+        driver_instance.execute_query.assert_called_once()
+
+    def test_add_ipfs_nodes_reports_failure(self, mock_env_vars, mock_driver):
+        """The bulk writers return False when a transient failure can be retried."""
+        driver_instance = mock_driver.return_value
+        driver_instance.session.side_effect = ServiceUnavailable("unavailable")
+
+        with patch("certifi.where", return_value="/path/to/certifi"):
+            graph = IPFSNeo4jGraph(ensure_schema=False)
+
+            assert graph.add_ipfs_nodes(["QmA"]) is False
+            assert graph.create_relationships([("QmA", "QmB", "LINKS_TO")]) is False
+
+    def test_permanent_failure_dropped(self, mock_env_vars, mock_driver):
+        """Writes that fail for good are logged and dropped instead of retried."""
+        driver_instance = mock_driver.return_value
+        driver_instance.session.side_effect = Exception("Invalid input 'BAD TYPE'")
+
+        with patch("certifi.where", return_value="/path/to/certifi"):
+            graph = IPFSNeo4jGraph(ensure_schema=False)
+
+            with patch.object(graph, "logger") as mock_logger:
+                assert graph.create_relationships([("QmA", "QmB", "BAD TYPE")]) is True
+
+        assert "Dropping 1 relationships" in str(mock_logger.error.call_args)
+
+
+class TestGraphWriteBuffer:
+    """Test suite for GraphWriteBuffer."""
+
+    def test_flushes_at_size_threshold(self):
+        """Pending writes are flushed once max_size is reached."""
+        graph = MagicMock()
+        buffer = GraphWriteBuffer(graph, max_size=3, max_interval=0)
+
+        buffer.add_ipfs_node("QmA")
+        buffer.create_relationship("QmA", "QmB", "LINKS_TO")
+        graph.add_ipfs_nodes.assert_not_called()
+
+        buffer.add_ipfs_node("QmB")
+        graph.add_ipfs_nodes.assert_called_once_with(["QmA", "QmB"])
+        graph.create_relationships.assert_called_once_with([("QmA", "QmB", "LINKS_TO")])
+
+    def test_close_flushes_pending_writes(self):
+        """Closing the buffer writes everything still pending."""
+        graph = MagicMock()
+        with GraphWriteBuffer(graph, max_size=100, max_interval=60) as buffer:
+            buffer.create_relationship("QmA", "QmB", "LINKS_TO")
+
+        graph.add_ipfs_nodes.assert_not_called()
+        graph.create_relationships.assert_called_once_with([("QmA", "QmB", "LINKS_TO")])
+
+    def test_failed_flush_keeps_batch(self):
+        """A batch whose write fails is retried ahead of newer writes."""
+        graph = MagicMock()
+        graph.add_ipfs_nodes.side_effect = [False, True]
+        buffer = GraphWriteBuffer(graph, max_size=100, max_interval=0)
+
+        buffer.add_ipfs_node("QmA")
+        buffer.create_relationship("QmA", "QmB", "LINKS_TO")
+        assert buffer.flush() is False
+        graph.create_relationships.assert_not_called()
+
+        buffer.add_ipfs_node("QmB")
+        assert buffer.flush() is True
+        graph.add_ipfs_nodes.assert_called_with(["QmA", "QmB"])
+        graph.create_relationships.assert_called_once_with([("QmA", "QmB", "LINKS_TO")])
+
+    def test_failing_graph_backs_off_and_bounds_pending(self):
+        """While the graph is down, flushes back off and retained writes are capped."""
+        graph = MagicMock()
+        graph.add_ipfs_nodes.return_value = False
+        buffer = GraphWriteBuffer(
+            graph, max_size=500, max_interval=0, max_pending=1000, backoff_base=60
+        )
+
+        for i in range(2000):
+            buffer.add_ipfs_node(f"Qm{i}")
+
+        assert graph.add_ipfs_nodes.call_count == 1
+        assert buffer._pending() == 1000
+        # The newest writes are the ones kept
+        assert buffer._nodes[-1] == "Qm1999"
+
+    def test_success_resets_backoff(self):
+        """A successful flush lets size-triggered flushes run again."""
+        graph = MagicMock()
+        graph.add_ipfs_nodes.side_effect = [False, True, True]
+        buffer = GraphWriteBuffer(graph, max_size=2, max_interval=0, backoff_base=60)
+
+        buffer.add_ipfs_node("QmA")
+        buffer.add_ipfs_node("QmB")
+        buffer.add_ipfs_node("QmC")
+        assert graph.add_ipfs_nodes.call_count == 1
+
+        assert buffer.flush() is True
+        buffer.add_ipfs_node("QmD")
+        buffer.add_ipfs_node("QmE")
+        assert graph.add_ipfs_nodes.call_count == 3
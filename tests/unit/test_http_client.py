@@ -0,0 +1,44 @@
+"""
+Unit tests for the shared HTTP client.
+"""
+
+from unittest.mock import patch
+
+from descidb.utils import http_client
+from descidb.utils.http_client import TimeoutHTTPAdapter, create_session
+
+
+class TestHttpClient:
+    """Test cases for the pooled HTTP session."""
+
+    def test_create_session_configures_adapter(self):
+        """Sessions pool connections, retry transient failures and set a timeout."""
+        session = create_session(pool_size=8, retries=5, timeout=(1, 2))
+        adapter = session.get_adapter("https://gateway.lighthouse.storage")
+
+        assert isinstance(adapter, TimeoutHTTPAdapter)
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.total == 5
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.timeout == (1, 2)
+
+    def test_default_timeout_applied(self):
+        """Requests without a timeout get the adapter default, explicit ones win."""
+        adapter = TimeoutHTTPAdapter(timeout=(3, 4))
+        with patch("requests.adapters.HTTPAdapter.send") as mock_send:
+            adapter.send("request")
+            adapter.send("request", timeout=9)
+
+        assert mock_send.call_args_list[0].kwargs["timeout"] == (3, 4)
+        assert mock_send.call_args_list[1].kwargs["timeout"] == 9
+
+    def test_get_session_is_shared(self, monkeypatch):
+        """The process-wide session is created once and honours the env settings."""
+        monkeypatch.setenv("DESCIDB_HTTP_POOL_SIZE", "4")
+        http_client.close_session()
+        try:
+            session = http_client.get_session()
+            assert http_client.get_session() is session
+            assert session.get_adapter("https://x")._pool_maxsize == 4
+        finally:
+            http_client.close_session()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the IPFS blob store.
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from descidb.utils.ipfs_blob_store import IPFSBlobStore
+
+
+def _response(content):
+    response = MagicMock()
+    response.content = content
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestIPFSBlobStore:
+    """Test cases for IPFSBlobStore."""
+
+    @patch("descidb.utils.ipfs_blob_store.get_session")
+    def test_read_through_and_hit(self, mock_session, tmp_path):
+        """A miss fetches from the gateway once, later reads come from disk."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value = _response(b"hello")
+        store = IPFSBlobStore(cache_dir=tmp_path)
+
+        assert store.get_text("QmTest") == "hello"
+        assert store.get("QmTest") == b"hello"
+
+        mock_get.assert_called_once_with(
+            "https://gateway.lighthouse.storage/ipfs/QmTest"
+        )
+        assert (tmp_path / "QmTest").read_bytes() == b"hello"
+        assert store.stats() == {"hits": 1, "misses": 1, "bytes": 5}
+
+    @patch("descidb.utils.ipfs_blob_store.get_session")
+    def test_unreadable_blob_falls_back_to_gateway(self, mock_session, tmp_path):
+        """A cached blob that cannot be read is fetched from the gateway instead."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value = _response(b"hello")
+        (tmp_path / "QmTest").mkdir()
+        store = IPFSBlobStore(cache_dir=tmp_path)
+
+        assert store.get("QmTest") == b"hello"
+        mock_get.assert_called_once()
+        assert store.stats()["misses"] == 1
+
+    @patch("descidb.utils.ipfs_blob_store.get_session")
+    def test_custom_gateway(self, mock_session, tmp_path):
+        """Misses are read through a configurable (e.g. local) gateway."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value = _response(b"data")
+        store = IPFSBlobStore(
+            cache_dir=tmp_path, gateway_url="http://localhost:8080/ipfs/"
+        )
+
+        store.get("QmTest")
+
+        mock_get.assert_called_once_with("http://localhost:8080/ipfs/QmTest")
+
+    @patch("descidb.utils.ipfs_blob_store.get_session")
+    def test_lru_eviction(self, mock_session, tmp_path):
+        """The least recently read blob is evicted once max_bytes is exceeded."""
+        store = IPFSBlobStore(cache_dir=tmp_path, max_bytes=10)
+        store.put("QmA", b"aaaa")
+        store.put("QmB", b"bbbb")
+        os.utime(tmp_path / "QmA", (1, 1))
+        os.utime(tmp_path / "QmB", (2, 2))
+
+        store.put("QmC", b"cccc")
+
+        assert not (tmp_path / "QmA").exists()
+        assert (tmp_path / "QmB").exists()
+        assert (tmp_path / "QmC").exists()
+        assert store.stats()["bytes"] == 8
+
+    @patch("descidb.utils.ipfs_blob_store.get_session")
+    def test_gateway_error_is_raised(self, mock_session, tmp_path):
+        """Gateway failures propagate and nothing is cached."""
+        mock_get = mock_session.return_value.get
+        mock_get.side_effect = requests.exceptions.RequestException("down")
+        store = IPFSBlobStore(cache_dir=tmp_path)
+
+        with pytest.raises(requests.exceptions.RequestException):
+            store.get("QmTest")
+        assert not (tmp_path / "QmTest").exists()
+
+    @patch("descidb.utils.ipfs_blob_store.get_session")
+    def test_disabled_cache(self, mock_session):
+        """Without a cache directory every read goes to the gateway."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value = _response(b"data")
+        store = IPFSBlobStore(cache_dir=None)
+
+        store.get("QmTest")
+        store.get("QmTest")
+
+        assert mock_get.call_count == 2
@@ -0,0 +1,58 @@
+"""
+Unit tests for lazy package attributes.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import descidb
+from descidb.utils.lazy import attach
+
+
+class TestLazy:
+    """Test cases for PEP 562 lazy loading."""
+
+    def test_attach_resolves_and_caches_names(self):
+        """Names are imported on first access and then cached on the package."""
+        __getattr__, __dir__, __all__ = attach(
+            "descidb.utils",
+            submodules=["cid"],
+            attrs={"descidb.utils.cid": ["compute_cid"]},
+        )
+
+        from descidb.utils import cid
+
+        assert __all__ == ["cid", "compute_cid"]
+        assert set(__all__) <= set(__dir__())
+        assert {"__name__", "__path__", "cid"} <= set(__dir__())
+        assert __getattr__("cid") is cid
+        assert __getattr__("compute_cid") is cid.compute_cid
+        assert vars(sys.modules["descidb.utils"])["compute_cid"] is cid.compute_cid
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Missing names raise AttributeError so hasattr and getattr work."""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            descidb.missing
+        assert not hasattr(descidb.core, "missing")
+
+    def test_package_exports(self):
+        """The top-level package still exposes its subpackages and re-exports."""
+        from descidb.core.chunker import chunk
+
+        assert descidb.chunk is chunk
+        assert "Processor" in dir(descidb)
+        assert {"core", "db", "query", "rewards", "utils"} <= set(descidb.__all__)
+
+    def test_chunker_import_is_lightweight(self):
+        """Importing the chunker does not import the heavy optional dependencies."""
+        heavy = ["chromadb", "marker", "neo4j", "sentence_transformers", "web3"]
+        code = (
+            "import sys, descidb.core.chunker; "
+            f"print([m for m in {heavy!r} if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
@@ -0,0 +1,86 @@
+"""
+Unit tests for the metadata index.
+"""
+
+import json
+import os
+
+import pytest
+
+from descidb.utils.metadata_index import MetadataIndex
+
+
+def write_metadata(path, records):
+    with open(path, "w") as file:
+        for record in records:
+            file.write(
+                (record if isinstance(record, str) else json.dumps(record)) + "\n"
+            )
+
+
+@pytest.fixture
+def metadata_file(tmp_path):
+    path = tmp_path / "metadata.json"
+    write_metadata(
+        path,
+        [
+            {"id": "2101.00001", "title": "First"},
+            "not json",
+            {"title": "No id", "id": "2101.00002"},
+            {"id": "2101.00001", "title": "Duplicate"},
+            {"id": "2101.00003", "title": "Unicode é"},
+            '{"id": "2101.00009", "title": broken',
+        ],
+    )
+    return path
+
+
+class TestMetadataIndex:
+    """Test cases for indexed metadata lookups."""
+
+    def test_get(self, metadata_file, tmp_path):
+        """Records are found by id and invalid lines are skipped."""
+        index = MetadataIndex(metadata_file, tmp_path / "index.sqlite")
+
+        assert index.get("2101.00002") == {"title": "No id", "id": "2101.00002"}
+        assert index.get("2101.00003")["title"] == "Unicode é"
+        assert index.get("missing") == {}
+        index.close()
+
+    def test_invalid_indexed_line(self, metadata_file, tmp_path):
+        """A line indexed by its leading id but not valid JSON yields {}."""
+        index = MetadataIndex(metadata_file, tmp_path / "index.sqlite")
+
+        assert index.get("2101.00009") == {}
+        index.close()
+
+    def test_first_duplicate_wins(self, metadata_file, tmp_path):
+        """Duplicate ids resolve to the first record, like a linear scan."""
+        index = MetadataIndex(metadata_file, tmp_path / "index.sqlite")
+
+        assert index.get("2101.00001")["title"] == "First"
+        index.close()
+
+    def test_rebuilt_when_file_changes(self, metadata_file, tmp_path):
+        """The index follows edits to the metadata file."""
+        index = MetadataIndex(metadata_file, tmp_path / "index.sqlite")
+        assert index.get("2101.00004") == {}
+
+        write_metadata(metadata_file, [{"id": "2101.00004", "title": "New"}])
+        stat = os.stat(metadata_file)
+        os.utime(metadata_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert index.get("2101.00004")["title"] == "New"
+        assert index.get("2101.00001") == {}
+        index.close()
+
+    def test_index_persists(self, metadata_file, tmp_path):
+        """A reopened index is reused without scanning the file again."""
+        first = MetadataIndex(metadata_file, tmp_path / "index.sqlite")
+        first.get("2101.00001")
+        first.close()
+
+        index = MetadataIndex(metadata_file, tmp_path / "index.sqlite")
+        index._scan = None  # Any rebuild would fail
+        assert index.get("2101.00003")["title"] == "Unicode é"
+        index.close()
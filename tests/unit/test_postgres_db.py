@@ -1,10 +1,14 @@
 """Tests for PostgreSQL database manager in DeSciDB."""
 
+import gc
+import pickle
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import psycopg2
 import pytest
 
-from descidb.db.postgres_db import PostgresDBManager
+from descidb.db.postgres_db import PostgresDBManager, decode_embedding, encode_embedding
 
 
 class TestPostgresDBManager:
@@ -396,3 +400,485 @@ class TestPostgresDBManager:
                     # Verify cursor and connection were closed
                     mock_cursor.close.assert_called_once()
                     mock_conn.close.assert_called_once()
+
+
+@pytest.fixture
+def pool_cls():
+    """Patch the pool class; every pool hands out healthy mock connections."""
+    with patch("descidb.db.postgres_db.psycopg2.connect"), patch(
+        "descidb.db.postgres_db.ThreadedConnectionPool"
+    ) as pool_cls:
+
+        def make_pool(*args, **kwargs):
+            pool = MagicMock(closed=False)
+            conn = MagicMock(closed=0)
+            conn.info.transaction_status = 0
+            pool.getconn.return_value = conn
+            return pool
+
+        pool_cls.side_effect = make_pool
+        yield pool_cls
+
+
+class TestPostgresConnectionPool:
+    """Test suite for the per-database connection pools."""
+
+    def test_pool_reused_per_database(self, pool_cls):
+        """Calls on the same database share one pool and return connections."""
+        manager = PostgresDBManager(min_connections=2, max_connections=5)
+
+        manager.query("db1", "SELECT 1")
+        manager.query("db1", "SELECT 2")
+        manager.query("db2", "SELECT 3")
+
+        assert pool_cls.call_count == 2
+        args, kwargs = pool_cls.call_args_list[0]
+        assert args == (2, 5)
+        assert kwargs["dbname"] == "db1"
+
+        pool = manager._pools["db1"]
+        conn = pool.getconn.return_value
+        assert pool.getconn.call_count == 2
+        pool.putconn.assert_called_with(conn, close=False)
+        conn.close.assert_not_called()
+
+    def test_insert_data_returns_connection(self, pool_cls):
+        """insert_data gives its connection back instead of leaking it."""
+        manager = PostgresDBManager()
+
+        manager.insert_data("db1", [("a", "p", "md", [0.1], {}, "key")])
+
+        pool = manager._pools["db1"]
+        pool.putconn.assert_called_once_with(pool.getconn.return_value, close=False)
+
+    def test_broken_connection_replaced(self, pool_cls):
+        """A connection that died in the pool is discarded on checkout."""
+        manager = PostgresDBManager()
+        pool, _ = manager._get_pool("db1")
+        broken, healthy = MagicMock(closed=1), MagicMock(closed=0)
+        healthy.info.transaction_status = 0
+        pool.getconn.side_effect = [broken, healthy]
+
+        with manager._connection("db1") as conn:
+            assert conn is healthy
+
+        pool.putconn.assert_any_call(broken, close=True)
+        pool.putconn.assert_called_with(healthy, close=False)
+
+    def test_fresh_connection_not_pinged(self, pool_cls):
+        """A connection's first checkout from a new pool skips the health check."""
+        manager = PostgresDBManager(health_check_interval=30)
+
+        with manager._connection("db1") as conn:
+            pass
+
+        conn.cursor.assert_not_called()
+
+    def test_idle_pool_connection_pinged(self, pool_cls):
+        """Connections opened with the pool and never used are checked once stale."""
+        manager = PostgresDBManager(health_check_interval=30)
+        with patch("descidb.db.postgres_db.time.monotonic", return_value=100.0):
+            manager._get_pool("db1")
+
+        with patch("descidb.db.postgres_db.time.monotonic", return_value=200.0):
+            with manager._connection("db1") as conn:
+                pass
+
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with("SELECT 1")
+
+    def test_idle_connection_pinged(self, pool_cls):
+        """Connections idle past the health check interval are checked first."""
+        manager = PostgresDBManager(health_check_interval=30)
+
+        with manager._connection("db1") as conn:
+            pass
+        conn.cursor.assert_not_called()
+        manager._last_used[conn] -= 60
+        with manager._connection("db1"):
+            pass
+
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with("SELECT 1")
+
+    def test_last_used_keyed_by_connection(self, pool_cls):
+        """Timestamps belong to connection objects and go away with them."""
+        manager = PostgresDBManager()
+
+        with manager._connection("db1") as conn:
+            pass
+        assert conn in manager._last_used
+
+        pool = manager._pools["db1"]
+        pool.getconn.return_value = MagicMock(closed=0)
+        pool.reset_mock()
+        del conn
+        gc.collect()
+        assert len(manager._last_used) == 0
+
+    def test_pool_failure(self, pool_cls):
+        """An unreachable database is logged and the call returns None."""
+        pool_cls.side_effect = Exception("Connection refused")
+        manager = PostgresDBManager()
+
+        with patch.object(manager, "logger") as mock_logger:
+            assert manager.query("db1", "SELECT 1") is None
+
+        assert "Connection refused" in str(mock_logger.error.call_args_list[0])
+
+    def test_close(self, pool_cls):
+        """close() shuts every pool and the server connection."""
+        manager = PostgresDBManager()
+        manager.conn.closed = 0
+        manager.query("db1", "SELECT 1")
+        pool = manager._pools["db1"]
+
+        manager.close()
+
+        pool.closeall.assert_called_once()
+        manager.conn.close.assert_called_once()
+        assert manager._pools == {}
+
+
+class TestPostgresBulkInsert:
+    """Test suite for COPY-based bulk loading."""
+
+    def test_insert_data_copies_in_batches(self, pool_cls):
+        """Records are streamed with one COPY per batch, including public_key."""
+        manager = PostgresDBManager()
+        data = [
+            ("author", f"paper{i}", 'say "hi"', [0.5], {"i": i}, "key")
+            for i in range(5)
+        ]
+
+        assert manager.insert_data("db1", data, batch_size=2) == 5
+
+        cursor = manager._pools["db1"].getconn.return_value.cursor.return_value
+        assert cursor.copy_expert.call_count == 3
+        statement, buffer = cursor.copy_expert.call_args_list[0][0]
+        assert "public_key" in statement and "FORMAT csv" in statement
+
+        lines = buffer.getvalue().splitlines()
+        assert len(lines) == 2
+        fields = lines[0].split(",")
+        assert fields[:3] == ['"author"', '"paper0"', '"say ""hi"""']
+        assert fields[3].startswith('"\\x')
+        assert fields[-1] == '"key"'
+
+    def test_insert_data_nulls(self, pool_cls):
+        """None is sent as NULL while empty strings stay empty strings."""
+        manager = PostgresDBManager()
+
+        manager.insert_data("db1", [("", "paper", None, None, None, None)])
+
+        cursor = manager._pools["db1"].getconn.return_value.cursor.return_value
+        buffer = cursor.copy_expert.call_args[0][1]
+        assert buffer.getvalue() == '"","paper",,,,\n'
+
+    def test_insert_data_stops_on_error(self, pool_cls):
+        """A failed batch is logged and the rows loaded so far are reported."""
+        manager = PostgresDBManager()
+        manager._get_pool("db1")
+        cursor = manager._pools["db1"].getconn.return_value.cursor.return_value
+        cursor.copy_expert.side_effect = [None, Exception("bad row")]
+        data = [("a", "p", "m", [0.1], {}, "k")] * 3
+
+        with patch.object(manager, "logger") as mock_logger:
+            assert manager.insert_data("db1", data, batch_size=2) == 2
+
+        assert "bad row" in str(mock_logger.error.call_args[0][0])
+
+
+def pooled_cursor(manager, db_name):
+    """Return the cursor the mock pool of db_name hands out."""
+    manager._get_pool(db_name)
+    conn = manager._pools[db_name].getconn.return_value
+    cursor = conn.cursor.return_value
+    cursor.__enter__.return_value = cursor
+    return conn, cursor
+
+
+class TestEmbeddingStorage:
+    """Test suite for embedding storage formats and their migration."""
+
+    @pytest.mark.parametrize("embedding_format", ["pickle", "float32", "vector"])
+    def test_encode_decode_roundtrip(self, embedding_format):
+        """Every format decodes back to the float32 values that were stored."""
+        embedding = [0.25, -1.5, 3.0]
+        text = encode_embedding(embedding, embedding_format)
+        if embedding_format == "vector":
+            value = text
+        else:
+            assert text.startswith("\\x")
+            value = memoryview(bytes.fromhex(text[2:]))
+
+        decoded = decode_embedding(value, embedding_format)
+        np.testing.assert_array_equal(decoded, np.array(embedding, dtype=np.float32))
+
+    def test_float32_is_compact_and_zero_copy(self):
+        """float32 stores 4 bytes per dimension and is read with np.frombuffer."""
+        text = encode_embedding([0.5] * 1536, "float32")
+        data = bytes.fromhex(text[2:])
+        assert len(data) == 1536 * 4
+        assert len(data) < len(pickle.dumps(np.array([0.5] * 1536)))
+
+        decoded = decode_embedding(data, "float32")
+        assert decoded.base is not None and not decoded.flags.writeable
+
+    def test_unknown_format_rejected(self, pool_cls):
+        """Only the supported formats can be configured."""
+        with pytest.raises(ValueError):
+            PostgresDBManager(embedding_format="json")
+
+    def test_create_table_records_format(self, pool_cls):
+        """New tables get the configured column type and record the format."""
+        manager = PostgresDBManager(embedding_format="vector")
+        _, cursor = pooled_cursor(manager, "db1")
+
+        manager._create_schema_and_table_in_db("db1")
+
+        statements = [str(call[0][0]) for call in cursor.execute.call_args_list]
+        assert any("CREATE EXTENSION IF NOT EXISTS vector" in s for s in statements)
+        assert any("CREATE TABLE" in s and "SQL('vector')" in s for s in statements)
+        assert cursor.execute.call_args_list[-1][0][1] == ("vector",)
+        assert manager.get_embedding_format("db1") == "vector"
+
+    def test_vector_falls_back_to_float32(self, pool_cls):
+        """Without pgvector, new tables store float32 bytes."""
+        manager = PostgresDBManager(embedding_format="vector")
+        _, cursor = pooled_cursor(manager, "db1")
+
+        def execute(statement, *args):
+            if "CREATE EXTENSION" in str(statement):
+                raise psycopg2.Error('extension "vector" is not available')
+
+        cursor.execute.side_effect = execute
+        manager._create_schema_and_table_in_db("db1")
+
+        assert manager.get_embedding_format("db1") == "float32"
+
+    def test_legacy_database_is_pickle(self, pool_cls):
+        """Databases without a storage_info table hold pickled embeddings."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        cursor.fetchone.return_value = (None,)
+
+        assert manager.get_embedding_format("db1") == "pickle"
+
+    def test_insert_data_uses_database_format(self, pool_cls):
+        """Rows are encoded in the format recorded for the database."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "float32"
+
+        manager.insert_data("db1", [("a", "p", "m", [0.5, 1.0], {}, "k")])
+
+        buffer = cursor.copy_expert.call_args[0][1]
+        expected = np.array([0.5, 1.0], dtype="<f4").tobytes().hex()
+        assert f'"\\x{expected}"' in buffer.getvalue()
+
+    def test_migrate_embeddings(self, pool_cls):
+        """Pickled embeddings are re-encoded and the columns swapped in one commit."""
+        manager = PostgresDBManager()
+        conn, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "pickle"
+        reader = MagicMock()
+        reader.__enter__.return_value = reader
+        conn.cursor.side_effect = lambda name=None: reader if name else cursor
+        reader.fetchmany.side_effect = [
+            [("(0,1)", pickle.dumps(np.array([0.5, 1.0])))],
+            [],
+        ]
+
+        with patch("descidb.db.postgres_db.execute_values") as mock_values:
+            stats = manager.migrate_embeddings("db1", "float32")
+
+        assert stats == {"from": "pickle", "to": "float32", "rows": 1}
+        values = mock_values.call_args[0][2]
+        assert values == [("(0,1)", encode_embedding([0.5, 1.0], "float32"))]
+        statements = [str(call[0][0]) for call in cursor.execute.call_args_list]
+        assert any("DROP COLUMN embedding" in s for s in statements)
+        assert any("RENAME COLUMN embedding_migrated" in s for s in statements)
+        conn.commit.assert_called_once()
+        assert conn.autocommit is True
+        assert manager.get_embedding_format("db1") == "float32"
+
+    def test_migrate_embeddings_rolls_back(self, pool_cls):
+        """A failed migration leaves the table and its recorded format unchanged."""
+        manager = PostgresDBManager()
+        conn, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "pickle"
+        cursor.execute.side_effect = [None, psycopg2.Error("disk full")]
+
+        with pytest.raises(psycopg2.Error):
+            manager.migrate_embeddings("db1", "float32")
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        assert "db1" not in manager._embedding_formats
+
+
+class TestVectorSearch:
+    """Test suite for pgvector indexes and similarity search."""
+
+    def test_create_hnsw_index(self, pool_cls):
+        """HNSW indexes fix the column dimensions and use cosine ops."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+
+        assert manager.create_vector_index("db1", dimensions=1536) is True
+
+        statements = [str(call[0][0]) for call in cursor.execute.call_args_list]
+        assert "Literal(1536)" in statements[0]
+        assert "SQL('hnsw')" in statements[1]
+        assert "vector_cosine_ops" in statements[1]
+
+    def test_create_ivfflat_index_sizes_lists(self, pool_cls):
+        """IVFFlat lists follow the row count and dimensions are inferred."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+        cursor.fetchone.side_effect = [(384,), (50000,), None]
+
+        assert manager.create_vector_index("db1", index_type="ivfflat") is True
+
+        statements = [str(call[0][0]) for call in cursor.execute.call_args_list]
+        assert "Literal(384)" in statements[1]
+        assert "Literal(50)" in statements[-1]
+        assert not any("DROP INDEX" in statement for statement in statements)
+
+    def test_outgrown_ivfflat_index_rebuilt(self, pool_cls):
+        """An IVFFlat index built with too few lists for the table is replaced."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+        cursor.fetchone.side_effect = [(50000,), (["lists=1"],)]
+
+        assert (
+            manager.create_vector_index("db1", dimensions=384, index_type="ivfflat")
+            is True
+        )
+
+        statements = [str(call[0][0]) for call in cursor.execute.call_args_list]
+        assert "DROP INDEX" in statements[-2]
+        assert "papers_embedding_ivfflat_idx" in statements[-2]
+        assert "Literal(50)" in statements[-1]
+
+    def test_current_ivfflat_index_kept(self, pool_cls):
+        """An IVFFlat index with enough lists is left as it is."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+        cursor.fetchone.side_effect = [(50000,), (["lists=50"],)]
+
+        manager.create_vector_index("db1", dimensions=384, index_type="ivfflat")
+
+        statements = [str(call[0][0]) for call in cursor.execute.call_args_list]
+        assert not any("DROP INDEX" in statement for statement in statements)
+
+    def test_create_index_migrates_to_vector(self, pool_cls):
+        """Tables in another format are migrated to vector first."""
+        manager = PostgresDBManager()
+        pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "float32"
+
+        with patch.object(manager, "migrate_embeddings") as mock_migrate:
+            manager.create_vector_index("db1", dimensions=8)
+
+        mock_migrate.assert_called_once_with("db1", "vector")
+
+    def test_create_index_needs_dimensions(self, pool_cls):
+        """Empty tables cannot be indexed without explicit dimensions."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+        cursor.fetchone.return_value = None
+
+        assert manager.create_vector_index("db1") is False
+
+    def test_search(self, pool_cls):
+        """Search orders by cosine distance and filters on metadata keys."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+        cursor.fetchall.return_value = [
+            ("author", "paper.pdf", "chunk", {"year": 2024}, "key", 0.12)
+        ]
+
+        results = manager.search(
+            "db1", [0.5, 1.0], k=3, filters={"categories": "cs.LG", "year": 2024}
+        )
+
+        assert results == [
+            {
+                "author": "author",
+                "paper_name": "paper.pdf",
+                "document": "chunk",
+                "metadata": {"year": 2024},
+                "public_key": "key",
+                "distance": 0.12,
+            }
+        ]
+        statement, params = cursor.execute.call_args[0]
+        assert "ORDER BY embedding <=> %s::vector" in str(statement)
+        assert str(statement).count("metadata->>%s = %s") == 2
+        assert params == [
+            "[0.5,1.0]",
+            "categories",
+            "cs.LG",
+            "year",
+            "2024",
+            "[0.5,1.0]",
+            3,
+        ]
+
+    @pytest.mark.parametrize(
+        "k, filters, ef_search",
+        [(3, None, 40), (100, None, 100), (50, {"year": 2024}, 500)],
+    )
+    def test_search_sets_ef_search(self, pool_cls, k, filters, ef_search):
+        """The HNSW candidate list covers k, with headroom when filtering."""
+        manager = PostgresDBManager()
+        conn, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+        cursor.fetchall.return_value = []
+
+        manager.search("db1", [0.5], k=k, filters=filters)
+
+        statement = cursor.execute.call_args_list[0][0][0]
+        assert "SET LOCAL hnsw.ef_search" in str(statement)
+        assert f"Literal({ef_search})" in str(statement)
+        conn.commit.assert_called_once()
+        assert conn.autocommit is True
+
+    def test_search_caps_ef_search(self, pool_cls):
+        """ef_search never exceeds pgvector's maximum of 1000."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+        cursor.fetchall.return_value = []
+
+        manager.search("db1", [0.5], k=200, filters={"year": 2024})
+
+        assert "Literal(1000)" in str(cursor.execute.call_args_list[0][0][0])
+
+    def test_search_error_rolls_back(self, pool_cls):
+        """A failed search rolls back its transaction and returns no results."""
+        manager = PostgresDBManager()
+        conn, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "vector"
+        cursor.execute.side_effect = [None, psycopg2.Error("canceled")]
+
+        assert manager.search("db1", [0.5]) == []
+        conn.rollback.assert_called_once()
+        assert conn.autocommit is True
+
+    def test_search_requires_vector_column(self, pool_cls):
+        """Databases without a vector column return no results."""
+        manager = PostgresDBManager()
+        _, cursor = pooled_cursor(manager, "db1")
+        manager._embedding_formats["db1"] = "float32"
+
+        assert manager.search("db1", [0.5]) == []
+        cursor.execute.assert_not_called()
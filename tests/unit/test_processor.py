@@ -0,0 +1,93 @@
+"""
+Unit tests for the processor module.
+"""
+
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from descidb.core.processor import Processor
+
+
+@pytest.fixture
+def make_processor(tmp_path):
+    """Build Processors with IPFS, Neo4j and git replaced by mocks."""
+    patches = [
+        patch("descidb.core.processor.IPFSNeo4jGraph"),
+        patch("descidb.core.processor.GraphWriteBuffer"),
+        patch("descidb.core.processor.GitCommitBatcher"),
+        patch("descidb.core.processor.get_session"),
+    ]
+    mocks = [p.start() for p in patches]
+    mocks[3].return_value.post.return_value.json.return_value = {"Hash": "author"}
+
+    def make(max_workers):
+        processor = Processor(
+            authorPublicKey="0xauthor",
+            db_manager=MagicMock(),
+            postgres_db_manager=MagicMock(),
+            metadata_file=str(tmp_path / "metadata.json"),
+            ipfs_api_key="key",
+            TokenRewarder=MagicMock(),
+            project_root=tmp_path,
+            max_workers=max_workers,
+        )
+        processor.graph_writer = MagicMock()
+        return processor
+
+    yield make
+    for p in patches:
+        p.stop()
+
+
+def _run_chunks(processor, chunks, fail_on=None):
+    """Process chunks with content-derived CIDs and return the graph writes."""
+
+    def store(content, git_path):
+        if content == fail_on:
+            raise RuntimeError("upload failed")
+        return f"cid:{content}"
+
+    with patch.object(
+        processor, "_Processor__lighthouse_and_commit_text", side_effect=store
+    ):
+        processor._Processor__process_chunks(
+            chunks,
+            [[float(i)] for i in range(len(chunks))],
+            "doc",
+            "paragraph",
+            "openai",
+            "git",
+        )
+    return processor.graph_writer.method_calls
+
+
+class TestProcessor:
+    """Test cases for the per-chunk pipeline."""
+
+    def test_threaded_matches_serial(self, make_processor):
+        """A worker pool writes the same graph as the serial loop."""
+        chunks = [f"chunk {i}" for i in range(20)]
+
+        serial = _run_chunks(make_processor(1), chunks)
+        threaded = _run_chunks(make_processor(4), chunks)
+
+        assert len(serial) == 20 * 6
+        assert sorted(map(repr, threaded)) == sorted(map(repr, serial))
+        # Each chunk's own writes keep their order
+        chunk_writes = [c for c in threaded if "cid:chunk 3" in repr(c)]
+        assert chunk_writes[:3] == [
+            call.add_ipfs_node("cid:chunk 3"),
+            call.create_relationship("doc", "cid:chunk 3", "CHUNKED_BY_paragraph"),
+            call.create_relationship("cid:chunk 3", "author", "AUTHORED_BY"),
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_failed_chunk_does_not_stop_others(self, make_processor, max_workers):
+        """An exception in one chunk is logged and the other chunks still run."""
+        chunks = ["a", "b", "c"]
+
+        writes = _run_chunks(make_processor(max_workers), chunks, fail_on="b")
+
+        nodes = {c.args[0] for c in writes if c[0] == "add_ipfs_node"}
+        assert nodes == {"cid:a", "cid:[0.0]", "cid:c", "cid:[2.0]"}
@@ -11,7 +11,15 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from descidb.query.query_db import query_collection
+from descidb.query import query_db
+from descidb.query.query_db import (
+    check_db_path,
+    get_collection,
+    invalidate_cache,
+    query_collection,
+    search_collection,
+    search_collections,
+)
 
 
 class TestQueryDB:
@@ -250,3 +258,200 @@ class TestQueryDB:
                 mock_logger.error.assert_called_once_with(
                     "Error querying collection: Test error"
                 )
+
+
+class TestCollectionRegistry:
+    """Test suite for the process-wide client/collection registry."""
+
+    @pytest.fixture(autouse=True)
+    def clear_registry(self):
+        """Start and end every test with an empty registry."""
+        invalidate_cache()
+        yield
+        invalidate_cache()
+
+    def test_client_and_collection_are_reused(self, tmp_path):
+        """Repeated lookups open the client and fetch the collection once."""
+        with patch("descidb.query.query_db.chromadb.PersistentClient") as mock_client:
+            first = get_collection("test_collection", tmp_path)
+            second = get_collection("test_collection", str(tmp_path))
+
+        assert first is second
+        mock_client.assert_called_once_with(path=str(tmp_path))
+        mock_client.return_value.get_collection.assert_called_once_with(
+            name="test_collection"
+        )
+
+    def test_clients_are_keyed_by_db_path(self, tmp_path):
+        """Each db_path gets its own client."""
+        with patch("descidb.query.query_db.chromadb.PersistentClient") as mock_client:
+            get_collection("test_collection", tmp_path / "a")
+            get_collection("test_collection", tmp_path / "b")
+
+        assert mock_client.call_count == 2
+
+    def test_client_cache_is_bounded(self, tmp_path, monkeypatch):
+        """The least recently used client is dropped once the cache is full."""
+        invalidate_cache()
+        monkeypatch.setattr(query_db, "MAX_CACHED_CLIENTS", 2)
+        with patch("descidb.query.query_db.chromadb.PersistentClient") as mock_client:
+            get_collection("test_collection", tmp_path / "a")
+            get_collection("test_collection", tmp_path / "b")
+            get_collection("test_collection", tmp_path / "a")
+            get_collection("test_collection", tmp_path / "c")
+            assert mock_client.call_count == 3
+
+            get_collection("test_collection", tmp_path / "a")
+            assert mock_client.call_count == 3
+            get_collection("test_collection", tmp_path / "b")
+            assert mock_client.call_count == 4
+        invalidate_cache()
+
+    def test_check_db_path(self, tmp_path, monkeypatch):
+        """Only the default and DESCIDB_DB_PATHS directories are accepted."""
+        monkeypatch.setenv("DESCIDB_DB_PATHS", str(tmp_path / "extra"))
+
+        check_db_path(None)
+        check_db_path(tmp_path / "extra")
+        with pytest.raises(ValueError, match="not configured"):
+            check_db_path(tmp_path / "other")
+
+    def test_invalidate_cache(self, tmp_path):
+        """Invalidation drops collection handles and, unless scoped, clients."""
+        with patch("descidb.query.query_db.chromadb.PersistentClient") as mock_client:
+            get_collection("test_collection", tmp_path)
+            invalidate_cache(tmp_path, "test_collection")
+            get_collection("test_collection", tmp_path)
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.get_collection.call_count == 2
+
+            invalidate_cache(tmp_path)
+            get_collection("test_collection", tmp_path)
+            assert mock_client.call_count == 2
+
+    def test_query_with_precomputed_embedding(self, tmp_path):
+        """A precomputed query embedding is used without calling the embedder."""
+        with patch(
+            "descidb.query.query_db.chromadb.PersistentClient"
+        ) as mock_client, patch("descidb.query.query_db.embed_batch") as mock_embed:
+            collection = mock_client.return_value.get_collection.return_value
+            collection.query.return_value = {
+                "ids": [["id1", "id2"]],
+                "documents": [["document1", "document2"]],
+                "metadatas": [[{"source": "paper1"}, {"source": "paper2"}]],
+                "distances": [[0.1, 0.2]],
+            }
+
+            result = json.loads(
+                query_collection(
+                    "test_collection", "test query", tmp_path, query_embedding=[0.5]
+                )
+            )
+
+        mock_embed.assert_not_called()
+        assert collection.query.call_args.kwargs["query_embeddings"] == [[0.5]]
+        assert len(result["results"]) == 2
+
+
+class TestSearchCollections:
+    """Test suite for multi-collection retrieval."""
+
+    @patch("descidb.query.query_db.search_collection")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_results_are_merged_and_ranked(self, mock_embed, mock_search):
+        """Results from all collections are merged, sorted by distance and cut to k."""
+        mock_embed.return_value = [[0.1]]
+        mock_search.side_effect = lambda name, embedding, k, where, db_path: [
+            {"id": f"{name}-{d}", "document": "", "metadata": {}, "distance": d}
+            for d in ([0.3, 0.5] if name == "a_x_openai" else [0.1, 0.4])
+        ]
+
+        result = search_collections(
+            "q", ["a_x_openai", "b_x_openai"], k=3, where={"root_cid": "r"}
+        )
+
+        mock_embed.assert_called_once_with(embedder_type="openai", texts=["q"])
+        assert [r["id"] for r in result["results"]] == [
+            "b_x_openai-0.1",
+            "a_x_openai-0.3",
+            "b_x_openai-0.4",
+        ]
+        assert result["results"][0]["collection"] == "b_x_openai"
+        assert result["errors"] == {}
+        mock_search.assert_any_call("a_x_openai", [0.1], 3, {"root_cid": "r"}, None)
+
+    @patch("descidb.query.query_db.search_collection")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_mixed_embedders_are_ranked_separately(self, mock_embed, mock_search):
+        """Distances are only compared within an embedder, rankings interleave."""
+        mock_embed.return_value = [[0.1]]
+        mock_search.side_effect = lambda name, embedding, k, where, db_path: [
+            {"id": f"{name}-{d}", "document": "", "metadata": {}, "distance": d}
+            for d in ([0.5, 0.6] if name == "a_x_openai" else [0.1, 0.2, 0.3])
+        ]
+
+        result = search_collections("q", ["a_x_openai", "b_x_bge"], k=4)
+
+        assert [r["id"] for r in result["results"]] == [
+            "a_x_openai-0.5",
+            "b_x_bge-0.1",
+            "a_x_openai-0.6",
+            "b_x_bge-0.2",
+        ]
+
+    @patch("descidb.query.query_db.ThreadPoolExecutor")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_search_workers_are_capped(self, mock_embed, mock_executor):
+        """Many collections do not start one thread each."""
+        names = [f"c{i}_x_openai" for i in range(50)]
+
+        search_collections("q", names)
+
+        mock_executor.assert_called_once_with(max_workers=query_db.SEARCH_MAX_WORKERS)
+
+    @patch("descidb.query.query_db.search_collection")
+    @patch("descidb.query.query_db.embed_batch")
+    def test_failed_collections_are_reported(self, mock_embed, mock_search):
+        """A failing collection is reported without failing the whole search."""
+        mock_embed.return_value = [[0.1]]
+
+        def search(name, embedding, k, where, db_path):
+            if name == "missing_x_openai":
+                raise ValueError("Collection missing_x_openai does not exist")
+            return [{"id": "1", "document": "", "metadata": {}, "distance": 0.2}]
+
+        mock_search.side_effect = search
+
+        result = search_collections("q", ["a_x_openai", "missing_x_openai"])
+
+        assert len(result["results"]) == 1
+        assert "does not exist" in result["errors"]["missing_x_openai"]
+
+    def test_search_collection_passes_k_and_where(self, tmp_path):
+        """search_collection forwards k and the metadata filter to Chroma."""
+        invalidate_cache()
+        with patch("descidb.query.query_db.chromadb.PersistentClient") as mock_client:
+            collection = mock_client.return_value.get_collection.return_value
+            collection.query.return_value = {
+                "ids": [["id1"]],
+                "documents": [["doc1"]],
+                "metadatas": [[{"root_cid": "r"}]],
+                "distances": [[0.25]],
+            }
+
+            results = search_collection(
+                "a_x_openai", [0.1], k=7, where={"root_cid": "r"}, db_path=tmp_path
+            )
+        invalidate_cache()
+
+        assert results == [
+            {
+                "id": "id1",
+                "document": "doc1",
+                "metadata": {"root_cid": "r"},
+                "distance": 0.25,
+            }
+        ]
+        kwargs = collection.query.call_args.kwargs
+        assert kwargs["n_results"] == 7
+        assert kwargs["where"] == {"root_cid": "r"}
@@ -0,0 +1,168 @@
+"""
+Unit tests for local CID computation and the background upload queue.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from descidb.utils.cid import MAX_SINGLE_BLOCK_SIZE, compute_cid, is_single_block
+from descidb.utils.upload_queue import UploadQueue
+
+
+def _response(cid):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {"Hash": cid}
+    return response
+
+
+class TestComputeCid:
+    """Test cases for compute_cid."""
+
+    def test_known_cids(self):
+        """CIDs match what IPFS reports for raw-leaf CIDv1 adds."""
+        assert (
+            compute_cid(b"hello world\n")
+            == "bafkreifjjcie6lypi6ny7amxnfftagclbuxndqonfipmb64f2km2devei4"
+        )
+        assert (
+            compute_cid(b"")
+            == "bafkreihdwdcefgh4dqkjv67uzcmw7ojee6xedzdetojuzjevtenxquvyku"
+        )
+
+    def test_is_single_block(self):
+        """Only data that fits in one block gets a locally computable CID."""
+        assert is_single_block(b"x" * MAX_SINGLE_BLOCK_SIZE)
+        assert not is_single_block(b"x" * (MAX_SINGLE_BLOCK_SIZE + 1))
+
+
+class TestUploadQueue:
+    """Test cases for UploadQueue."""
+
+    @patch("descidb.utils.upload_queue.get_session")
+    def test_upload_drains_queue(self, mock_session, tmp_path):
+        """Enqueued blobs are uploaded once and removed from the spool."""
+        mock_post = mock_session.return_value.post
+        cid = compute_cid(b"data")
+        mock_post.return_value = _response(cid)
+        queue = UploadQueue("key", tmp_path, num_workers=1)
+
+        queue.enqueue(cid, b"data")
+        assert queue.join(timeout=5)
+        queue.close()
+
+        mock_post.assert_called_once()
+        _, kwargs = mock_post.call_args
+        assert kwargs["params"] == {"cid-version": 1, "raw-leaves": "true"}
+        assert not (tmp_path / "blobs" / cid).exists()
+
+    @patch("descidb.utils.upload_queue.get_session")
+    def test_enqueue_is_idempotent(self, mock_session, tmp_path):
+        """Enqueueing the same CID twice schedules a single upload."""
+        mock_post = mock_session.return_value.post
+        queue = UploadQueue("key", tmp_path, num_workers=0)
+
+        queue.enqueue("bafkreitest", b"data")
+        queue.enqueue("bafkreitest", b"data")
+
+        assert queue.stats() == {"pending": 1}
+        queue.close(wait=False)
+        mock_post.assert_not_called()
+
+    @patch("descidb.utils.upload_queue.get_session")
+    def test_failures_are_retried_then_given_up(self, mock_session, tmp_path):
+        """Failed uploads back off and are marked failed after max_attempts."""
+        mock_post = mock_session.return_value.post
+        mock_post.side_effect = requests.ConnectionError("network down")
+        queue = UploadQueue(
+            "key", tmp_path, num_workers=1, max_attempts=2, backoff_base=0.01
+        )
+
+        queue.enqueue("bafkreitest", b"data")
+        assert queue.join(timeout=5)
+
+        assert mock_post.call_count == 2
+        assert queue.stats() == {"failed": 1}
+        assert (tmp_path / "blobs" / "bafkreitest").exists()
+
+        mock_post.side_effect = None
+        mock_post.return_value = _response("bafkreitest")
+        queue.retry_failed()
+        assert queue.join(timeout=5)
+        assert queue.stats() == {}
+        queue.close()
+
+    @patch("descidb.utils.upload_queue.get_session")
+    def test_cid_mismatch_is_a_failure(self, mock_session, tmp_path):
+        """A CID mismatch fails on the first attempt and keeps the blob."""
+        mock_post = mock_session.return_value.post
+        mock_post.return_value = _response("bafkreiother")
+        queue = UploadQueue(
+            "key", tmp_path, num_workers=1, max_attempts=8, backoff_base=0.01
+        )
+
+        queue.enqueue("bafkreitest", b"data")
+        assert queue.join(timeout=5)
+
+        assert queue.stats() == {"failed": 1}
+        assert mock_post.call_count == 1
+        assert (tmp_path / "blobs" / "bafkreitest").exists()
+        (last_error,) = queue.conn.execute("SELECT last_error FROM uploads").fetchone()
+        assert "bafkreiother" in last_error
+        queue.close()
+
+    @patch("descidb.utils.upload_queue.get_session")
+    def test_transport_errors_retried(self, mock_session, tmp_path):
+        """Connection errors and 5xx responses are retried until the upload succeeds."""
+        server_error = _response("bafkreitest")
+        server_error.raise_for_status.side_effect = requests.HTTPError(
+            response=MagicMock(status_code=503)
+        )
+        mock_post = mock_session.return_value.post
+        mock_post.side_effect = [
+            requests.ConnectionError("reset"),
+            server_error,
+            _response("bafkreitest"),
+        ]
+        queue = UploadQueue("key", tmp_path, num_workers=1, backoff_base=0.01)
+
+        queue.enqueue("bafkreitest", b"data")
+        assert queue.join(timeout=5)
+
+        assert mock_post.call_count == 3
+        assert queue.stats() == {}
+        queue.close()
+
+    @patch("descidb.utils.upload_queue.get_session")
+    def test_client_error_not_retried(self, mock_session, tmp_path):
+        """A 4xx response such as a rejected API key fails without retrying."""
+        response = _response("bafkreitest")
+        response.raise_for_status.side_effect = requests.HTTPError(
+            response=MagicMock(status_code=401)
+        )
+        mock_post = mock_session.return_value.post
+        mock_post.return_value = response
+        queue = UploadQueue("key", tmp_path, num_workers=1, backoff_base=0.01)
+
+        queue.enqueue("bafkreitest", b"data")
+        assert queue.join(timeout=5)
+
+        assert mock_post.call_count == 1
+        assert queue.stats() == {"failed": 1}
+        queue.close()
+
+    @patch("descidb.utils.upload_queue.get_session")
+    def test_pending_uploads_survive_restart(self, mock_session, tmp_path):
+        """Uploads left in the spool are picked up by a new queue."""
+        mock_post = mock_session.return_value.post
+        queue = UploadQueue("key", tmp_path, num_workers=0)
+        queue.enqueue("bafkreitest", b"data")
+        queue.close(wait=False)
+
+        mock_post.return_value = _response("bafkreitest")
+        queue = UploadQueue("key", tmp_path, num_workers=1)
+        assert queue.join(timeout=5)
+        queue.close()
+
+        mock_post.assert_called_once()